@@ -0,0 +1,31 @@
+#!/bin/bash
+# Build a single-file vmctl executable (dist/vmctl.pyz) with shiv.
+#
+# The zipapp bundles vmctl and its dependencies with pre-compiled bytecode,
+# so it runs on any machine with Python 3.12+ without a virtualenv or
+# pip install, and the first run doesn't have to compile anything.
+#
+# Usage: scripts/build-zipapp.sh   (requires: pip install shiv)
+set -e
+
+cd "$(dirname "$0")/.."
+
+if ! command -v shiv &> /dev/null; then
+  echo "shiv not found. Install it with: pip install shiv" >&2
+  exit 1
+fi
+
+mkdir -p dist
+
+echo "📦 Building dist/vmctl.pyz..."
+shiv . \
+  --console-script vmctl \
+  --python "/usr/bin/env python3" \
+  --compile-pyc \
+  --reproducible \
+  --output-file dist/vmctl.pyz
+
+echo "✅ Built dist/vmctl.pyz"
+echo ""
+echo "Install it with:"
+echo "  cp dist/vmctl.pyz ~/.local/bin/vmctl"
@@ -1,6 +1,7 @@
 """Docker-based local and cloud deployment commands."""
 
 import subprocess
+import time
 from pathlib import Path
 
 import click
@@ -19,6 +20,12 @@ DEFAULT_APPS = ["openclaw-gateway", "workstation"]
 # Base directory for vmctl on the VM
 VM_BASE_DIR = "/srv/vmctl"
 
+# Waiting for a local container to show up: first check after 0.25s, then
+# back off (x2, capped at 2s) until 10s have passed
+CONTAINER_POLL_INITIAL = 0.25
+CONTAINER_POLL_MAX = 2.0
+CONTAINER_POLL_TIMEOUT = 10.0
+
 
 def run_command(cmd: list[str], cwd: Path | None = None) -> tuple[int, str, str]:
     """Run a command and return exit code, stdout, stderr.
@@ -215,14 +222,7 @@ def _up_local() -> None:
             console.print(f"[red]{escape(stderr)}[/red]")
         raise click.Abort()
 
-    # Wait a moment for container to start
-    import time
-    time.sleep(2)
-
-    # Check if container is running
-    exit_code, stdout, stderr = run_command(["docker", "ps", "--filter", "name=vmctl"])
-
-    if "vmctl" in stdout:
+    if _wait_for_container("vmctl"):
         console.print("[green]✓[/green] code-server started successfully")
         console.print("[bold green]Access at: http://localhost:8080[/bold green]")
         console.print("\nTo stop: [cyan]vmctl down --local[/cyan]")
@@ -231,6 +231,27 @@ def _up_local() -> None:
         console.print("Check logs with: docker logs vmctl")
 
 
+def _wait_for_container(name: str) -> bool:
+    """Poll ``docker ps`` until a container is running, backing off between checks.
+
+    Args:
+        name: Container name filter
+
+    Returns:
+        True if the container showed up within CONTAINER_POLL_TIMEOUT seconds
+    """
+    deadline = time.monotonic() + CONTAINER_POLL_TIMEOUT
+    interval = CONTAINER_POLL_INITIAL
+    while True:
+        time.sleep(interval)
+        _, stdout, _ = run_command(["docker", "ps", "--filter", f"name={name}"])
+        if name in stdout:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        interval = min(interval * 2, CONTAINER_POLL_MAX)
+
+
 def _down_local() -> None:
     """Stop local code-server Docker container."""
     console.print("[bold cyan]Stopping local code-server...[/bold cyan]")
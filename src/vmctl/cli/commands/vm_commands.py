@@ -1,14 +1,36 @@
 """VM lifecycle commands."""
 
 import click
-from rich.console import Console
 
 from vmctl.config.manager import ConfigManager
-from vmctl.core.exceptions import VMError
+from vmctl.config.models import VMConfig
+from vmctl.core.exceptions import ConfigNotFound, TunnelError, VMError
 from vmctl.core.tunnel import TunnelManager
 from vmctl.core.vm import VMManager
+from vmctl.utils.output import say
 
-console = Console()
+
+def _load_config(ctx: click.Context, required: bool = False) -> VMConfig:
+    """Load the config through this CLI invocation's shared ConfigManager.
+
+    The manager is created on first use and kept on ``ctx.obj``, so commands
+    that delegate to each other (e.g. ``connect`` -> ``ssh``) load the config once.
+
+    Args:
+        ctx: Click context for the running command
+        required: Raise instead of returning defaults if there is no config file
+
+    Returns:
+        Loaded VMConfig
+
+    Raises:
+        ConfigNotFound: If required is True and the config file doesn't exist
+    """
+    obj = ctx.ensure_object(dict)
+    if "config_mgr" not in obj:
+        obj["config_mgr"] = ConfigManager()
+    config_mgr: ConfigManager = obj["config_mgr"]
+    return config_mgr.load(required=required)
 
 
 @click.command()
@@ -24,10 +46,10 @@ def create() -> None:
 
     Requires configuration with workstation disk info.
     """
-    console.print("[red]⚠ The 'create' command is not yet implemented in Python version.[/red]")
-    console.print("[yellow]This command will create a VM from an existing Cloud Workstation.[/yellow]")
-    console.print("\nPlease use the bash version: [blue]bin/vmws create[/blue]")
-    console.print("\nOr use: [green]vmctl init-fresh[/green] to create a fresh VM without a workstation.")
+    say("[red]⚠ The 'create' command is not yet implemented in Python version.[/red]")
+    say("[yellow]This command will create a VM from an existing Cloud Workstation.[/yellow]")
+    say("\nPlease use the bash version: [blue]bin/vmws create[/blue]")
+    say("\nOr use: [green]vmctl init-fresh[/green] to create a fresh VM without a workstation.")
 
 
 @click.command(name="init-fresh")
@@ -42,115 +64,124 @@ def init_fresh() -> None:
 
     No existing workstation needed.
     """
-    console.print("[red]⚠ The 'init-fresh' command is not yet implemented in Python version.[/red]")
-    console.print("[yellow]This command will create a fresh VM without a Cloud Workstation.[/yellow]")
-    console.print("\nPlease use the bash version: [blue]bin/vmws init-fresh[/blue]")
+    say("[red]⚠ The 'init-fresh' command is not yet implemented in Python version.[/red]")
+    say("[yellow]This command will create a fresh VM without a Cloud Workstation.[/yellow]")
+    say("\nPlease use the bash version: [blue]bin/vmws init-fresh[/blue]")
 
 
 @click.command()
-def start() -> None:
+@click.pass_context
+def start(ctx: click.Context) -> None:
     """Start the VM if stopped."""
     try:
-        config_mgr = ConfigManager()
-        config = config_mgr.load()
-
-        if not config_mgr.config_exists():
-            console.print("[red]No configuration found. Run 'vmctl config' first.[/red]")
+        try:
+            config = _load_config(ctx, required=True)
+        except ConfigNotFound:
+            say("[red]No configuration found. Run 'vmctl config' first.[/red]")
             raise click.Abort() from None
 
         vm = VMManager(config)
 
         if not vm.exists():
-            console.print(f"[red]VM {config.vm_name} does not exist.[/red]")
-            console.print("[yellow]Create it first with 'vmctl create' or 'vmctl init-fresh'[/yellow]")
+            say(f"[red]VM {config.vm_name} does not exist.[/red]")
+            say("[yellow]Create it first with 'vmctl create' or 'vmctl init-fresh'[/yellow]")
             raise click.Abort() from None
 
         status = vm.status()
         if status == "RUNNING":
-            console.print(f"[yellow]VM {config.vm_name} is already running[/yellow]")
+            say(f"[yellow]VM {config.vm_name} is already running[/yellow]")
         else:
             vm.start()
 
     except VMError as e:
-        console.print(f"[red]Error: {e}[/red]")
+        say(f"[red]Error: {e}[/red]")
         raise click.Abort() from None
 
 
 @click.command()
-def stop() -> None:
+@click.pass_context
+def stop(ctx: click.Context) -> None:
     """Stop the VM to save money."""
     try:
-        config_mgr = ConfigManager()
-        config = config_mgr.load()
+        config = _load_config(ctx)
 
         vm = VMManager(config)
 
         if not vm.exists():
-            console.print(f"[red]VM {config.vm_name} does not exist.[/red]")
+            say(f"[red]VM {config.vm_name} does not exist.[/red]")
             raise click.Abort() from None
 
         status = vm.status()
         if status == "TERMINATED":
-            console.print(f"[yellow]VM {config.vm_name} is already stopped[/yellow]")
+            say(f"[yellow]VM {config.vm_name} is already stopped[/yellow]")
         else:
             vm.stop()
 
     except VMError as e:
-        console.print(f"[red]Error: {e}[/red]")
+        say(f"[red]Error: {e}[/red]")
         raise click.Abort() from None
 
 
 @click.command()
-def status() -> None:
+@click.pass_context
+def status(ctx: click.Context) -> None:
     """Show VM status."""
     try:
-        config_mgr = ConfigManager()
-        config = config_mgr.load()
-
-        if not config_mgr.config_exists():
-            console.print("[yellow]No configuration found. Run 'vmctl config' first.[/yellow]")
+        try:
+            config = _load_config(ctx, required=True)
+        except ConfigNotFound:
+            say("[yellow]No configuration found. Run 'vmctl config' first.[/yellow]")
             return
 
         vm = VMManager(config)
 
         if not vm.exists():
-            console.print(f"[red]VM {config.vm_name} does not exist[/red]")
-            console.print("[dim]Create it with 'vmctl create' or 'vmctl init-fresh'[/dim]")
+            say(f"[red]VM {config.vm_name} does not exist[/red]")
+            say("[dim]Create it with 'vmctl create' or 'vmctl init-fresh'[/dim]")
             return
 
-        vm_status = vm.status()
+        # Same describe call as exists(), so this doesn't query gcloud again
+        info = vm.info()
 
         # Print status with color
-        if vm_status == "RUNNING":
-            console.print(f"[green]✓ VM {config.vm_name} is RUNNING[/green]")
-        elif vm_status == "TERMINATED":
-            console.print(f"[yellow]○ VM {config.vm_name} is STOPPED[/yellow]")
+        if info.status == "RUNNING":
+            say(f"[green]✓ VM {config.vm_name} is RUNNING[/green]")
+        elif info.status == "TERMINATED":
+            say(f"[yellow]○ VM {config.vm_name} is STOPPED[/yellow]")
         else:
-            console.print(f"[blue]● VM {config.vm_name} is {vm_status}[/blue]")
+            say(f"[blue]● VM {config.vm_name} is {info.status}[/blue]")
+
+        if info.machine_type:
+            say(f"[dim]  {info.machine_type} in {info.zone}[/dim]")
 
         # Show connection info if running
-        if vm_status == "RUNNING":
-            console.print("\n[dim]Connect with:[/dim]")
-            console.print("  [blue]vmctl tunnel[/blue]  → Open code-server")
-            console.print("  [blue]vmctl ssh[/blue]     → SSH into VM")
+        if info.status == "RUNNING":
+            if info.internal_ip:
+                say(f"[dim]  Internal IP: {info.internal_ip}[/dim]")
+            if info.external_ip:
+                say(f"[dim]  External IP: {info.external_ip}[/dim]")
+            say("\n[dim]Connect with:[/dim]")
+            say("  [blue]vmctl tunnel[/blue]  → Open code-server")
+            say("  [blue]vmctl ssh[/blue]     → SSH into VM")
 
     except VMError as e:
-        console.print(f"[red]Error: {e}[/red]")
+        say(f"[red]Error: {e}[/red]")
         raise click.Abort() from None
 
 
 @click.command()
 @click.argument("command", required=False)
-def connect(command: str | None) -> None:
+@click.pass_context
+def connect(ctx: click.Context, command: str | None) -> None:
     """SSH into the VM (alias for 'ssh')."""
     # Delegate to ssh command
-    ctx = click.get_current_context()
     ctx.invoke(ssh, command=command)
 
 
 @click.command()
 @click.argument("command", required=False)
-def ssh(command: str | None) -> None:
+@click.pass_context
+def ssh(ctx: click.Context, command: str | None) -> None:
     """SSH into the VM.
 
     COMMAND: Optional command to run (if omitted, opens interactive shell)
@@ -160,113 +191,136 @@ def ssh(command: str | None) -> None:
         vmctl ssh "ls -la"     # Run command
     """
     try:
-        config_mgr = ConfigManager()
-        config = config_mgr.load()
+        config = _load_config(ctx)
 
         vm = VMManager(config)
 
         if not vm.exists():
-            console.print(f"[red]VM {config.vm_name} does not exist.[/red]")
+            say(f"[red]VM {config.vm_name} does not exist.[/red]")
             raise click.Abort() from None
 
         vm_status = vm.status()
         if vm_status != "RUNNING":
-            console.print(f"[red]VM is {vm_status}. Start it with 'vmctl start'[/red]")
+            say(f"[red]VM is {vm_status}. Start it with 'vmctl start'[/red]")
             raise click.Abort() from None
 
-        console.print(f"[blue]Connecting to {config.vm_name}...[/blue]")
+        say(f"[blue]Connecting to {config.vm_name}...[/blue]")
         vm.ssh(command)
 
     except VMError as e:
-        console.print(f"[red]Error: {e}[/red]")
+        say(f"[red]Error: {e}[/red]")
         raise click.Abort() from None
 
 
 @click.command()
 @click.option("--port", "-p", default=8080, help="Local port for tunnel")
-def tunnel(port: int) -> None:
+@click.option("--background", "-b", is_flag=True, help="Keep the tunnel running after vmctl exits")
+@click.option("--stop", "stop_tunnel", is_flag=True, help="Stop the background tunnel on --port")
+@click.pass_context
+def tunnel(ctx: click.Context, port: int, background: bool, stop_tunnel: bool) -> None:
     """Start IAP tunnel to code-server.
 
     This opens a tunnel to the code-server running on your VM.
     Access it at http://localhost:8080 in your browser.
 
-    The tunnel runs in the foreground. Press Ctrl+C to stop.
+    The tunnel runs in the foreground. Press Ctrl+C to stop. With
+    --background it keeps running, and later 'vmctl tunnel' calls for the
+    same VM and port reuse it. Stop it with 'vmctl tunnel --stop'.
     """
     try:
-        config_mgr = ConfigManager()
-        config = config_mgr.load()
+        config = _load_config(ctx)
+
+        tunnel_mgr = TunnelManager(config, local_port=port)
+
+        if stop_tunnel:
+            tunnel_mgr.stop()
+            return
+
+        # Reuse our own background tunnel to this VM rather than checking the
+        # VM and setting up a new IAP connection
+        pid = tunnel_mgr.running_pid()
+        if pid is not None:
+            say(f"[green]✓ Tunnel already up on localhost:{port} (PID: {pid})[/green]")
+            say(f"[yellow]→ Access code-server at http://localhost:{port}[/yellow]")
+            return
+
+        # Something else (local code-server, another VM's tunnel) has the port
+        if tunnel_mgr.check_tunnel():
+            say(
+                f"[red]localhost:{port} is already in use by another process. "
+                "Stop it or pick another --port.[/red]"
+            )
+            raise click.Abort() from None
 
         vm = VMManager(config)
 
         if not vm.exists():
-            console.print(f"[red]VM {config.vm_name} does not exist.[/red]")
+            say(f"[red]VM {config.vm_name} does not exist.[/red]")
             raise click.Abort() from None
 
         vm_status = vm.status()
         if vm_status != "RUNNING":
-            console.print(f"[red]VM is {vm_status}. Start it with 'vmctl start'[/red]")
+            say(f"[red]VM is {vm_status}. Start it with 'vmctl start'[/red]")
             raise click.Abort() from None
 
-        tunnel_mgr = TunnelManager(config, local_port=port)
-        tunnel_mgr.start(background=False)
+        tunnel_mgr.start(background=background)
 
-    except VMError as e:
-        console.print(f"[red]Error: {e}[/red]")
+    except (VMError, TunnelError) as e:
+        say(f"[red]Error: {e}[/red]")
         raise click.Abort() from None
     except KeyboardInterrupt:
-        console.print("\n[yellow]Tunnel stopped[/yellow]")
+        say("\n[yellow]Tunnel stopped[/yellow]")
 
 
 @click.command()
 @click.option("--file", "-f", default="/var/log/vm-auto-shutdown.log", help="Log file to view")
-def logs(file: str) -> None:
+@click.pass_context
+def logs(ctx: click.Context, file: str) -> None:
     """View VM logs (default: auto-shutdown logs)."""
     try:
-        config_mgr = ConfigManager()
-        config = config_mgr.load()
+        config = _load_config(ctx)
 
         vm = VMManager(config)
 
         if not vm.exists():
-            console.print(f"[red]VM {config.vm_name} does not exist.[/red]")
+            say(f"[red]VM {config.vm_name} does not exist.[/red]")
             raise click.Abort() from None
 
-        console.print(f"[blue]Fetching logs from {file}...[/blue]")
-        log_content = vm.logs(file)
-
-        console.print("\n" + log_content)
+        say(f"[blue]Fetching logs from {file}...[/blue]\n")
+        # Print lines as they arrive rather than buffering the whole file
+        vm.stream_logs(lambda line: say(line, markup=False, highlight=False), file)
 
     except VMError as e:
-        console.print(f"[red]Error: {e}[/red]")
+        say(f"[red]Error: {e}[/red]")
         raise click.Abort() from None
 
 
 @click.command()
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
-def delete(yes: bool) -> None:
+@click.pass_context
+def delete(ctx: click.Context, yes: bool) -> None:
     """Delete the VM and all resources.
 
     WARNING: This is destructive! Make sure you have backups.
     """
     try:
-        config_mgr = ConfigManager()
-        config = config_mgr.load()
+        config = _load_config(ctx)
 
         vm = VMManager(config)
 
         if not vm.exists():
-            console.print(f"[yellow]VM {config.vm_name} does not exist.[/yellow]")
+            say(f"[yellow]VM {config.vm_name} does not exist.[/yellow]")
             return
 
         if not yes:
-            console.print(f"[red]⚠ WARNING: This will delete VM {config.vm_name} and its boot disk![/red]")
-            console.print("[yellow]Data disk will NOT be deleted (use gcloud to delete manually if needed)[/yellow]")
+            say(f"[red]⚠ WARNING: This will delete VM {config.vm_name} and its boot disk![/red]")
+            say("[yellow]Data disk will NOT be deleted (use gcloud to delete manually if needed)[/yellow]")
             if not click.confirm("Are you sure?"):
-                console.print("[dim]Cancelled[/dim]")
+                say("[dim]Cancelled[/dim]")
                 return
 
         vm.delete()
 
     except VMError as e:
-        console.print(f"[red]Error: {e}[/red]")
+        say(f"[red]Error: {e}[/red]")
         raise click.Abort() from None
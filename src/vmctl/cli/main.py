@@ -1,14 +1,99 @@
 """Main CLI entry point for vmctl."""
 
+import importlib
+
 import click
-from rich.console import Console
 
 from vmctl import __version__
 
-console = Console()
 
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when needed.
+
+    Subcommands are registered as ``name -> "module:attribute"`` import paths,
+    so ``vmctl --version`` or ``vmctl start`` doesn't pay for importing every
+    command module (and rich, pydantic, etc. behind them).
+    """
 
-@click.group()
+    def __init__(
+        self, *args: object, lazy_subcommands: dict[str, str] | None = None, **kwargs: object
+    ) -> None:
+        """Initialize lazy group.
+
+        Args:
+            *args: Positional arguments for click.Group
+            lazy_subcommands: Mapping of command name to "module:attribute"
+            **kwargs: Keyword arguments for click.Group
+        """
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eagerly and lazily registered command names."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return a command, importing its module on first access."""
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import and return a lazily registered command.
+
+        Args:
+            cmd_name: Registered command name
+
+        Returns:
+            The click command object
+
+        Raises:
+            TypeError: If the import path doesn't point at a click command
+        """
+        module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy command {cmd_name!r} is not a click command: {command!r}")
+        return command
+
+
+_VM = "vmctl.cli.commands.vm_commands"
+_CONFIG = "vmctl.cli.commands.config_commands"
+_BACKUP = "vmctl.cli.commands.backup_commands"
+_DOCKER = "vmctl.cli.commands.docker_commands"
+
+# Command name -> "module:attribute"
+LAZY_SUBCOMMANDS = {
+    # VM lifecycle
+    "create": f"{_VM}:create",
+    "init-fresh": f"{_VM}:init_fresh",
+    "start": f"{_VM}:start",
+    "stop": f"{_VM}:stop",
+    "status": f"{_VM}:status",
+    "connect": f"{_VM}:connect",
+    "ssh": f"{_VM}:ssh",
+    "tunnel": f"{_VM}:tunnel",
+    "delete": f"{_VM}:delete",
+    "config": f"{_CONFIG}:config",
+    "backup": f"{_BACKUP}:backup",
+    "restore": f"{_BACKUP}:restore",
+    "snapshots": f"{_BACKUP}:snapshots",
+    "up": f"{_DOCKER}:up",
+    "down": f"{_DOCKER}:down",
+    # Docker management commands (Gate 2); "logs" shows compose logs
+    "provision": f"{_DOCKER}:provision",
+    "deploy": f"{_DOCKER}:deploy",
+    "ps": f"{_DOCKER}:docker_ps",
+    "logs": f"{_DOCKER}:docker_logs",
+    "restart": f"{_DOCKER}:restart",
+    # Multi-app setup command (Gate 5)
+    "setup": f"{_DOCKER}:setup",
+    # Secrets management command (Gate 6)
+    "secrets": f"{_DOCKER}:secrets",
+}
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS)
 @click.version_option(version=__version__, prog_name="vmctl")
 @click.pass_context
 def cli(ctx: click.Context) -> None:
@@ -30,48 +115,5 @@ def cli(ctx: click.Context) -> None:
     ctx.ensure_object(dict)
 
 
-# Import command groups
-from vmctl.cli.commands import (
-    backup_commands,
-    config_commands,
-    docker_commands,
-    vm_commands,
-)
-
-# Register command groups
-cli.add_command(vm_commands.create)
-cli.add_command(vm_commands.init_fresh)
-cli.add_command(vm_commands.start)
-cli.add_command(vm_commands.stop)
-cli.add_command(vm_commands.status)
-cli.add_command(vm_commands.connect)
-cli.add_command(vm_commands.ssh)
-cli.add_command(vm_commands.tunnel)
-cli.add_command(vm_commands.logs)
-cli.add_command(vm_commands.delete)
-
-cli.add_command(config_commands.config)
-
-cli.add_command(backup_commands.backup)
-cli.add_command(backup_commands.restore)
-cli.add_command(backup_commands.snapshots)
-
-cli.add_command(docker_commands.up)
-cli.add_command(docker_commands.down)
-
-# Docker management commands (Gate 2)
-cli.add_command(docker_commands.provision)
-cli.add_command(docker_commands.deploy)
-cli.add_command(docker_commands.docker_ps)
-cli.add_command(docker_commands.docker_logs)
-cli.add_command(docker_commands.restart)
-
-# Multi-app setup command (Gate 5)
-cli.add_command(docker_commands.setup)
-
-# Secrets management command (Gate 6)
-cli.add_command(docker_commands.secrets)
-
-
 if __name__ == "__main__":
     cli()
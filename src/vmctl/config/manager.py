@@ -1,10 +1,60 @@
 """Configuration manager for vmctl."""
 
+import hashlib
+import os
+import pickle
+import struct
 import subprocess
 from pathlib import Path
+from typing import Any
 
-from vmctl.config.migration import ConfigMigration
 from vmctl.config.models import ConfigPaths, VMConfig
+from vmctl.core.exceptions import ConfigNotFound
+from vmctl.utils.gcloud_config import gcloud_property
+
+# Cache header: (schema tag, st_mtime_ns, st_size). The stat fields identify the
+# config file the cache was built from; the schema tag invalidates caches pickled
+# by a vmctl whose VMConfig had different fields.
+_CACHE_HEADER = struct.Struct("<8sqq")
+_SCHEMA_FIELDS = [(name, repr(field.annotation)) for name, field in VMConfig.model_fields.items()]
+_SCHEMA_TAG = hashlib.blake2b(repr(_SCHEMA_FIELDS).encode(), digest_size=8).digest()
+
+# Parsed configs shared by every ConfigManager in this process:
+# resolved config file path -> (cache header, VMConfig)
+_CONFIG_CACHE: dict[Path, tuple[bytes, VMConfig]] = {}
+
+# Fields that ConfigManager.update() accepts
+_UPDATABLE_FIELDS = frozenset(
+    {
+        "vm_name",
+        "zone",
+        "project",
+        "workstation_disk",
+        "region",
+        "ssh_host",
+        "ssh_user",
+        "ssh_key",
+        "ssh_port",
+    }
+)
+
+
+def _write_private(path: Path, data: bytes) -> None:
+    """Atomically replace a file with owner-only permissions.
+
+    Args:
+        path: File to write
+        data: New file contents
+    """
+    tmp_file = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+    os.replace(tmp_file, path)
 
 
 class ConfigManager:
@@ -18,35 +68,96 @@ class ConfigManager:
         """
         self.paths = ConfigPaths(config_dir)
         self._config: VMConfig | None = None
-        self._migration_checked = False
+        self._config_found = False
+        # Migration only ever moves legacy config into the default ~/.vmctl
+        # (and marks it there), so a custom config_dir skips it entirely
+        self._migration_checked = (
+            self.paths.config_dir.resolve() != ConfigPaths().config_dir.resolve()
+        )
+        self._migrated_marker = self.paths.config_dir / ".migrated"
 
-    def load(self) -> VMConfig:
+    def load(self, required: bool = False) -> VMConfig:
         """Load configuration from file or create default.
 
-        Automatically performs migration from ~/.vmws if needed.
+        Automatically performs migration from ~/.vmws into ~/.vmctl if needed.
+
+        Args:
+            required: Raise instead of returning defaults if there is no config file
 
         Returns:
             VMConfig instance with loaded or default values
+
+        Raises:
+            ConfigNotFound: If required is True and the config file doesn't exist
         """
-        # Run migration check once per manager instance
-        if not self._migration_checked:
+        # Run migration check once per manager instance; the marker left by a
+        # completed migration lets us skip the probe (and its imports) entirely
+        if not self._migration_checked and not self._migrated_marker.exists():
+            from vmctl.config.migration import ConfigMigration
+
             migration = ConfigMigration()
             if migration.needs_migration():
                 migration.migrate()
-            self._migration_checked = True
+            elif self.paths.config_dir.is_dir():
+                # Nothing to migrate (the usual case); remember that so later
+                # runs skip the probe too
+                try:
+                    self._migrated_marker.write_text("No legacy configuration to migrate\n")
+                except OSError:
+                    pass
+        self._migration_checked = True
 
-        if self._config is not None:
-            return self._config
+        if self._config is None:
+            config = self._read_config_file()
+            if config is not None:
+                self._config = config
+                self._config_found = True
+            elif not required:
+                # Create default config with project from gcloud if available
+                self._config = VMConfig(project=self._get_gcloud_project())
 
-        if self.paths.config_file.exists():
+        if required and not self._config_found:
+            raise ConfigNotFound(f"No configuration found at {self.paths.config_file}")
+        assert self._config is not None
+        return self._config
+
+    def _read_config_file(self) -> VMConfig | None:
+        """Read the config file, using the in-process and on-disk caches.
+
+        Returns:
+            Parsed VMConfig, or None if the config file doesn't exist
+        """
+        try:
+            cache_key = self._cache_key()
+        except FileNotFoundError:
+            return None
+
+        # Managers in the same process share one parsed config per file
+        shared_key = self.paths.config_file.resolve()
+        shared = _CONFIG_CACHE.get(shared_key)
+        if shared is not None and shared[0] == cache_key:
+            return shared[1]
+
+        config = self._read_cache(cache_key)
+        if config is None:
             content = self.paths.config_file.read_text()
-            self._config = VMConfig.from_bash_format(content)
-        else:
-            # Create default config with project from gcloud if available
-            project = self._get_gcloud_project()
-            self._config = VMConfig(project=project)
+            config = VMConfig.from_bash_format(content)
+            self._write_cache(config)
+        _CONFIG_CACHE[shared_key] = (cache_key, config)
+        return config
 
-        return self._config
+    def reload(self) -> VMConfig:
+        """Forget the loaded config and read it again.
+
+        The shared cache is keyed on the file's mtime and size, so this only
+        re-parses the file if something else has written to it.
+
+        Returns:
+            VMConfig instance with loaded or default values
+        """
+        self._config = None
+        self._config_found = False
+        return self.load()
 
     def save(self, config: VMConfig) -> None:
         """Save configuration to file.
@@ -55,70 +166,122 @@ class ConfigManager:
             config: VMConfig instance to save
         """
         self.paths.ensure_config_dir()
-        self.paths.config_file.write_text(config.to_bash_format())
+        self._write_config_file(config.to_bash_format().encode("utf-8"))
+        cache_key = self._write_cache(config)
+        _CONFIG_CACHE[self.paths.config_file.resolve()] = (cache_key, config)
         self._config = config
+        self._config_found = True
 
-    def update(
-        self,
-        vm_name: str | None = None,
-        zone: str | None = None,
-        project: str | None = None,
-        workstation_disk: str | None = None,
-        region: str | None = None,
-        ssh_host: str | None = None,
-        ssh_user: str | None = None,
-        ssh_key: str | None = None,
-        ssh_port: int | None = None,
-    ) -> VMConfig:
+    def update(self, **changes: Any) -> VMConfig:
         """Update configuration fields and save.
 
+        Keyword arguments set to None are ignored, so callers can pass
+        unset CLI options straight through.
+
         Args:
-            vm_name: VM instance name
-            zone: Google Cloud zone
-            project: Google Cloud project ID
-            workstation_disk: Source workstation disk
-            region: Google Cloud region
-            ssh_host: Direct SSH hostname or IP
-            ssh_user: SSH username for direct SSH
-            ssh_key: Path to SSH identity file
-            ssh_port: SSH port
+            **changes: Field values to update. Accepted keys are vm_name,
+                zone, project, workstation_disk, region, ssh_host,
+                ssh_user, ssh_key and ssh_port.
 
         Returns:
             Updated VMConfig instance
+
+        Raises:
+            TypeError: If an unknown field name is passed
         """
+        unknown = changes.keys() - _UPDATABLE_FIELDS
+        if unknown:
+            raise TypeError(f"Unknown config field(s): {', '.join(sorted(unknown))}")
+
+        changes = {k: v for k, v in changes.items() if v is not None}
         current = self.load()
 
+        # Nothing to change - skip revalidation and the disk write
+        if not changes:
+            return current
+
         # Only update fields that are provided
         updated_data = current.model_dump()
-        if vm_name is not None:
-            updated_data["vm_name"] = vm_name
-        if zone is not None:
-            updated_data["zone"] = zone
-        if project is not None:
-            updated_data["project"] = project
-        if workstation_disk is not None:
-            updated_data["workstation_disk"] = workstation_disk
-        if region is not None:
-            updated_data["region"] = region
-        if ssh_host is not None:
-            updated_data["ssh_host"] = ssh_host
-        if ssh_user is not None:
-            updated_data["ssh_user"] = ssh_user
-        if ssh_key is not None:
-            updated_data["ssh_key"] = ssh_key
-        if ssh_port is not None:
-            updated_data["ssh_port"] = ssh_port
+        updated_data.update(changes)
 
         updated_config = VMConfig(**updated_data)
         self.save(updated_config)
         return updated_config
 
+    def _write_config_file(self, data: bytes) -> None:
+        """Atomically replace the config file with owner-only permissions.
+
+        Args:
+            data: Encoded bash-format config
+        """
+        _write_private(self.paths.config_file, data)
+
+    def _cache_key(self) -> bytes:
+        """Build the cache header for the current config file.
+
+        Returns:
+            Packed (schema tag, mtime_ns, size) of the config file
+        """
+        stat = self.paths.config_file.stat()
+        return _CACHE_HEADER.pack(_SCHEMA_TAG, stat.st_mtime_ns, stat.st_size)
+
+    def _read_cache(self, cache_key: bytes) -> VMConfig | None:
+        """Load the parsed config from the cache file if still valid.
+
+        Args:
+            cache_key: Header for the current config file (see _cache_key)
+
+        Returns:
+            Cached VMConfig, or None if the cache is missing or stale
+        """
+        try:
+            data = self.paths.cache_file.read_bytes()
+            if data[: _CACHE_HEADER.size] != cache_key:
+                return None
+            config = pickle.loads(data[_CACHE_HEADER.size :])
+        except Exception:
+            # Missing, stale, or unreadable cache - fall back to parsing
+            return None
+        return config if isinstance(config, VMConfig) else None
+
+    def _write_cache(self, config: VMConfig) -> bytes:
+        """Write the parsed config to the cache file.
+
+        Args:
+            config: VMConfig parsed from (or just written to) the config file
+
+        Returns:
+            Header for the current config file (see _cache_key)
+        """
+        cache_key = self._cache_key()
+        try:
+            # Same permissions as the config file - the cache holds the same data
+            _write_private(self.paths.cache_file, cache_key + pickle.dumps(config))
+        except OSError:
+            # Cache is best-effort; the bash config remains the source of truth
+            pass
+        return cache_key
+
     def _get_gcloud_project(self) -> str | None:
         """Get default project from gcloud config.
 
         Returns:
             Project ID or None if gcloud not configured
         """
+        # gcloud honours CLOUDSDK_CORE_PROJECT over its config file, so an
+        # exported project lets us skip spawning gcloud entirely
+        project = os.environ.get("CLOUDSDK_CORE_PROJECT") or os.environ.get(
+            "GOOGLE_CLOUD_PROJECT"
+        )
+        if project:
+            return project
+
+        # Reading gcloud's config file avoids starting gcloud in the usual
+        # case; gcloud itself is still asked if the file has no project
+        project = gcloud_property("core", "project")
+        if project:
+            return project
+
         try:
             result = subprocess.run(
                 ["gcloud", "config", "get-value", "project"],
@@ -3,6 +3,7 @@
 Handles automatic migration from legacy ~/.vmws/ or ~/.codestation/ to ~/.vmctl/ directory.
 """
 
+import os
 import shutil
 from pathlib import Path
 
@@ -41,12 +42,17 @@ class ConfigMigration:
         Returns:
             True if legacy config exists and new config doesn't, or migration incomplete
         """
-        legacy_dir = self._find_legacy_dir()
-        if legacy_dir is None:
+        # One readdir of ~ instead of stat-ing each candidate directory
+        try:
+            home_entries = set(os.listdir(Path.home()))
+        except OSError:
+            return False
+
+        if not any(d.name in home_entries for d in self.legacy_dirs):
             return False
 
         # If new dir doesn't exist and legacy dir exists, we need migration
-        if not self.new_dir.exists():
+        if self.new_dir.name not in home_entries:
             return True
 
         # If new dir exists but no migration marker, and legacy dir exists
@@ -71,24 +77,34 @@ class ConfigMigration:
         console.print(f"\n[cyan]Migrating configuration from {legacy_dir} to ~/.vmctl...[/cyan]")
 
         try:
-            # Create new directory if it doesn't exist
-            self.new_dir.mkdir(parents=True, exist_ok=True)
-
-            # Copy all files from legacy directory
-            for item in legacy_dir.iterdir():
+            # Copy rather than rename: bin/vmws still reads ~/.vmws/config and
+            # the legacy directory is kept for rollback.
+            if not self.new_dir.exists():
+                # Fresh target - copy the whole tree in a single call
+                shutil.copytree(
+                    legacy_dir, self.new_dir, ignore=shutil.ignore_patterns(".migrated")
+                )
+                console.print(f"  [dim]Copied {legacy_dir.name}/[/dim]")
+                entries_to_merge: list[os.DirEntry[str]] = []
+            else:
+                with os.scandir(legacy_dir) as it:
+                    entries_to_merge = list(it)
+
+            # Merge into an existing ~/.vmctl (scandir caches file types,
+            # so is_file/is_dir don't re-stat each entry)
+            for entry in entries_to_merge:
                 # Skip migration markers from previous migrations
-                if item.name == ".migrated":
+                if entry.name == ".migrated":
                     continue
 
-                src = item
-                dst = self.new_dir / item.name
+                dst = self.new_dir / entry.name
 
-                if src.is_file():
-                    shutil.copy2(src, dst)
-                    console.print(f"  [dim]Copied {item.name}[/dim]")
-                elif src.is_dir():
-                    shutil.copytree(src, dst, dirs_exist_ok=True)
-                    console.print(f"  [dim]Copied {item.name}/[/dim]")
+                if entry.is_file():
+                    shutil.copy2(entry.path, dst)
+                    console.print(f"  [dim]Copied {entry.name}[/dim]")
+                elif entry.is_dir():
+                    shutil.copytree(entry.path, dst, dirs_exist_ok=True)
+                    console.print(f"  [dim]Copied {entry.name}/[/dim]")
 
             # Create migration marker
             self.migration_marker.write_text(
@@ -107,7 +123,9 @@ class ConfigMigration:
             return False
 
     def is_migrated(self) -> bool:
-        """Check if migration has been completed.
+        """Check if migration has been completed (or found to be unnecessary).
+
+        ConfigManager also leaves the marker when there was nothing to migrate.
 
         Returns:
             True if migration marker exists
@@ -1,9 +1,38 @@
 """Configuration models for vmctl."""
 
+import re
 from pathlib import Path
 
 from pydantic import BaseModel, Field, field_validator
 
+# Bash variable name -> VMConfig field name
+_BASH_KEYS = {
+    "VM_NAME": "vm_name",
+    "ZONE": "zone",
+    "PROJECT": "project",
+    "WORKSTATION_DISK": "workstation_disk",
+    "REGION": "region",
+    "APP_DIR": "app_dir",
+    "SSH_HOST": "ssh_host",
+    "SSH_USER": "ssh_user",
+    "SSH_KEY": "ssh_key",
+    "SSH_PORT": "ssh_port",
+}
+
+# Matches KEY="value", KEY='value' or KEY=value for known keys, one per line.
+# A bare value runs to the end of the line (spaces included), and a " #"
+# comment after any value is dropped, as bash would.
+_BASH_RE = re.compile(
+    r"^[ \t]*(" + "|".join(_BASH_KEYS) + r")[ \t]*=[ \t]*"
+    r"(?:\"([^\"\n]*)\"|'([^'\n]*)'|([^\n]*?))"
+    r"(?:[ \t]+#[^\n]*)?[ \t]*$",
+    re.MULTILINE,
+)
+
+
+# Emitted by VMConfig.to_bash_format; one line per key, in _BASH_KEYS order
+_BASH_TEMPLATE = "".join(f'{key}="%s"\n' for key in _BASH_KEYS)
+
 
 class VMConfig(BaseModel):
     """VM configuration settings."""
@@ -59,91 +88,33 @@ class VMConfig(BaseModel):
 
     def to_bash_format(self) -> str:
         """Convert config to bash source format for backward compatibility."""
-        lines = [
-            f'VM_NAME="{self.vm_name}"',
-            f'ZONE="{self.zone}"',
-            f'PROJECT="{self.project or ""}"',
-            f'WORKSTATION_DISK="{self.workstation_disk or ""}"',
-            f'REGION="{self.region or ""}"',
-            f'APP_DIR="{self.app_dir or ""}"',
-            f'SSH_HOST="{self.ssh_host or ""}"',
-            f'SSH_USER="{self.ssh_user or ""}"',
-            f'SSH_KEY="{self.ssh_key or ""}"',
-            f'SSH_PORT="{self.ssh_port or ""}"',
-        ]
-        return "\n".join(lines) + "\n"
+        return _BASH_TEMPLATE % (
+            self.vm_name,
+            self.zone,
+            self.project or "",
+            self.workstation_disk or "",
+            self.region or "",
+            self.app_dir or "",
+            self.ssh_host or "",
+            self.ssh_user or "",
+            self.ssh_key or "",
+            self.ssh_port or "",
+        )
 
     @classmethod
     def from_bash_format(cls, content: str) -> "VMConfig":
         """Parse bash source format config file."""
-        # Initialize with None for all optional fields
-        vm_name: str | None = None
-        zone: str | None = None
-        project: str | None = None
-        workstation_disk: str | None = None
-        region: str | None = None
-        app_dir: str | None = None
-        ssh_host: str | None = None
-        ssh_user: str | None = None
-        ssh_key: str | None = None
-        ssh_port: int | None = None
-
-        for line in content.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            # Parse bash variable assignment: VAR="value"
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-                value_or_none = value if value else None
-
-                # Map bash variable names to Python variables
-                if key == "VM_NAME":
-                    vm_name = value_or_none
-                elif key == "ZONE":
-                    zone = value_or_none
-                elif key == "PROJECT":
-                    project = value_or_none
-                elif key == "WORKSTATION_DISK":
-                    workstation_disk = value_or_none
-                elif key == "REGION":
-                    region = value_or_none
-                elif key == "APP_DIR":
-                    app_dir = value_or_none
-                elif key == "SSH_HOST":
-                    ssh_host = value_or_none
-                elif key == "SSH_USER":
-                    ssh_user = value_or_none
-                elif key == "SSH_KEY":
-                    ssh_key = value_or_none
-                elif key == "SSH_PORT":
-                    ssh_port = int(value) if value else None
-
-        # Build config with explicit fields (use defaults if None)
-        config_kwargs: dict[str, str | None] = {}
-        if vm_name is not None:
-            config_kwargs["vm_name"] = vm_name
-        if zone is not None:
-            config_kwargs["zone"] = zone
-        if project is not None:
-            config_kwargs["project"] = project
-        if workstation_disk is not None:
-            config_kwargs["workstation_disk"] = workstation_disk
-        if region is not None:
-            config_kwargs["region"] = region
-        if app_dir is not None:
-            config_kwargs["app_dir"] = app_dir
-        if ssh_host is not None:
-            config_kwargs["ssh_host"] = ssh_host
-        if ssh_user is not None:
-            config_kwargs["ssh_user"] = ssh_user
-        if ssh_key is not None:
-            config_kwargs["ssh_key"] = ssh_key
-        if ssh_port is not None:
-            config_kwargs["ssh_port"] = ssh_port
+        # Later assignments win, and an empty value (KEY="") falls back to the
+        # model default, even if an earlier line set the key
+        config_kwargs: dict[str, str | int] = {}
+        for key, dq, sq, bare in _BASH_RE.findall(content):
+            value = dq or sq or bare.strip('"').strip("'")
+            if value:
+                config_kwargs[_BASH_KEYS[key]] = value
+            else:
+                config_kwargs.pop(_BASH_KEYS[key], None)
+        if "ssh_port" in config_kwargs:
+            config_kwargs["ssh_port"] = int(config_kwargs["ssh_port"])
 
         return cls(**config_kwargs)  # type: ignore[arg-type]
 
@@ -159,6 +130,7 @@ class ConfigPaths:
         """
         self.config_dir = config_dir or Path.home() / ".vmctl"
         self.config_file = self.config_dir / "config"
+        self.cache_file = self.config_dir / "config.cache"
 
     def ensure_config_dir(self) -> None:
         """Create config directory if it doesn't exist."""
@@ -55,7 +55,7 @@ class DiskManager:
             if description:
                 cmd.append(f"--description={description}")
 
-            run_command(cmd, check=True)
+            run_command(cmd, check=True, capture_stdout=False)
             console.print(f"[green]✓ Snapshot {snapshot_name} created[/green]")
             return snapshot_name
 
@@ -85,10 +85,7 @@ class DiskManager:
                 check=True,
             )
 
-            # Parse JSON output
-            import json
-
-            snapshots = json.loads(result.stdout) if result.stdout else []
+            snapshots = result.json() if result.stdout_bytes else []
             return [
                 {
                     "name": s.get("name", ""),
@@ -145,6 +142,7 @@ class DiskManager:
                     "--quiet",
                 ],
                 check=True,
+                capture_stdout=False,
             )
 
             # Create new disk from snapshot
@@ -161,6 +159,7 @@ class DiskManager:
                     f"--project={self.config.project}",
                 ],
                 check=True,
+                capture_stdout=False,
             )
 
             # Restart VM
@@ -195,6 +194,7 @@ class DiskManager:
                     "--quiet",
                 ],
                 check=True,
+                capture_stdout=False,
             )
             console.print(f"[green]✓ Snapshot {snapshot_name} deleted[/green]")
 
@@ -19,6 +19,12 @@ class ConfigError(CodestationError):
     pass
 
 
+class ConfigNotFound(ConfigError):
+    """Configuration file does not exist."""
+
+    pass
+
+
 class TunnelError(CodestationError):
     """Tunnel operation errors."""
 
@@ -1,31 +1,47 @@
 """IAP tunnel management for code-server access."""
 
+import json
+import os
 import signal
+import socket
 import subprocess
 import time
-
-from rich.console import Console
+from pathlib import Path
+from typing import Any
 
 from vmctl.config.models import VMConfig
 from vmctl.core.exceptions import TunnelError
+from vmctl.utils.output import say
 
-console = Console()
+# Background tunnel startup: poll the local port instead of sleeping blindly
+STARTUP_POLL_INTERVAL = 0.1
+STARTUP_POLL_ATTEMPTS = 100  # ~10s; gcloud usually binds well within that
 
 
 class TunnelManager:
     """Manages IAP tunnels to code-server."""
 
-    def __init__(self, config: VMConfig, local_port: int = 8080, remote_port: int = 8080) -> None:
+    def __init__(
+        self,
+        config: VMConfig,
+        local_port: int = 8080,
+        remote_port: int = 8080,
+        state_dir: Path | None = None,
+    ) -> None:
         """Initialize tunnel manager.
 
         Args:
             config: VM configuration
             local_port: Local port for tunnel
             remote_port: Remote port on VM (code-server default is 8080)
+            state_dir: Where background tunnels are recorded (~/.cache/vmctl)
         """
         self.config = config
         self.local_port = local_port
         self.remote_port = remote_port
+        self.state_file = (state_dir or Path.home() / ".cache" / "vmctl") / (
+            f"tunnel-{local_port}.json"
+        )
         self._process: subprocess.Popen[bytes] | None = None
 
     def start(self, background: bool = False) -> None:
@@ -37,7 +53,7 @@ class TunnelManager:
         Raises:
             TunnelError: If tunnel startup fails
         """
-        console.print(
+        say(
             f"[blue]Starting IAP tunnel to {self.config.vm_name}:{self.remote_port} "
             f"-> localhost:{self.local_port}...[/blue]"
         )
@@ -62,55 +78,202 @@ class TunnelManager:
                     stderr=subprocess.DEVNULL,
                     start_new_session=True,
                 )
-                # Give it a moment to start
-                time.sleep(2)
-                console.print(
+                self._wait_for_port()
+                self._write_state(self._process.pid)
+                say(
                     f"[green]✓ Tunnel started in background (PID: {self._process.pid})[/green]"
                 )
-                console.print(f"[yellow]→ Access code-server at http://localhost:{self.local_port}[/yellow]")
+                say(f"[yellow]→ Access code-server at http://localhost:{self.local_port}[/yellow]")
             else:
                 # Run in foreground (blocking)
-                console.print("[green]✓ Tunnel active[/green]")
-                console.print(f"[yellow]→ Access code-server at http://localhost:{self.local_port}[/yellow]")
-                console.print("[dim]Press Ctrl+C to stop tunnel[/dim]")
+                say("[green]✓ Tunnel active[/green]")
+                say(f"[yellow]→ Access code-server at http://localhost:{self.local_port}[/yellow]")
+                say("[dim]Press Ctrl+C to stop tunnel[/dim]")
 
                 # Run and handle Ctrl+C gracefully
                 try:
                     subprocess.run(cmd, check=True)
                 except KeyboardInterrupt:
-                    console.print("\n[yellow]Tunnel stopped[/yellow]")
+                    say("\n[yellow]Tunnel stopped[/yellow]")
 
+        except TunnelError:
+            raise
         except subprocess.CalledProcessError as e:
             raise TunnelError(f"Failed to start tunnel: {e}") from e
         except Exception as e:
             raise TunnelError(f"Tunnel error: {e}") from e
 
+    def _wait_for_port(self) -> None:
+        """Wait for the background tunnel to start listening on the local port.
+
+        Raises:
+            TunnelError: If gcloud exits early or the port never opens
+        """
+        assert self._process is not None
+
+        for _ in range(STARTUP_POLL_ATTEMPTS):
+            if self._process.poll() is not None:
+                returncode = self._process.returncode
+                self._process = None
+                raise TunnelError(f"Tunnel process exited during startup (exit code {returncode})")
+            if self.check_tunnel(self.local_port):
+                return
+            time.sleep(STARTUP_POLL_INTERVAL)
+
+        self._process.terminate()
+        self._process = None
+        raise TunnelError(
+            f"Tunnel did not open localhost:{self.local_port} within "
+            f"{STARTUP_POLL_ATTEMPTS * STARTUP_POLL_INTERVAL:.0f}s"
+        )
+
+    def _state(self) -> dict[str, object]:
+        """Identify the tunnel this manager would start.
+
+        Returns:
+            VM, zone, project and ports, as recorded in the state file
+        """
+        return {
+            "vm_name": self.config.vm_name,
+            "zone": self.config.zone,
+            "project": self.config.project,
+            "local_port": self.local_port,
+            "remote_port": self.remote_port,
+        }
+
+    def _write_state(self, pid: int) -> None:
+        """Record a background tunnel so later runs can reuse or stop it.
+
+        Args:
+            pid: Process ID of the detached gcloud tunnel
+        """
+        try:
+            self.state_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self.state_file.write_text(json.dumps({"pid": pid, **self._state()}))
+        except OSError as e:
+            say(f"[yellow]Warning: couldn't record tunnel in {self.state_file}: {e}[/yellow]")
+
+    def _read_state(self) -> dict[str, Any] | None:
+        """Load this port's recorded background tunnel if its process is alive.
+
+        A state file whose process has exited is removed.
+
+        Returns:
+            Recorded state including "pid", or None if there is no live tunnel
+        """
+        try:
+            state = json.loads(self.state_file.read_text())
+            pid = int(state["pid"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            # Exited, or the PID now belongs to another user's process
+            self.state_file.unlink(missing_ok=True)
+            return None
+        return dict(state)
+
+    @staticmethod
+    def _is_tunnel_process(pid: int) -> bool:
+        """Check that a PID belongs to a gcloud IAP tunnel.
+
+        Without /proc (e.g. macOS) this can't be checked, so it defers to the
+        caller's other checks.
+
+        Args:
+            pid: Process ID to check
+
+        Returns:
+            True if the process is running 'start-iap-tunnel' or can't be inspected
+        """
+        try:
+            cmdline = Path(f"/proc/{pid}/cmdline").read_bytes()
+        except OSError:
+            return not Path("/proc/self").exists()
+        return b"start-iap-tunnel" in cmdline
+
+    def running_pid(self) -> int | None:
+        """Find a background tunnel started by vmctl for this VM and port.
+
+        A listener on the port alone isn't enough: it could be a local
+        code-server or a tunnel to a different VM. A live PID alone isn't
+        either: the state file can outlive the tunnel and PIDs are reused.
+
+        Returns:
+            PID of the reusable tunnel, or None if there isn't one
+        """
+        state = self._read_state()
+        if state is None:
+            return None
+        pid = int(state.pop("pid"))
+        if state != self._state() or not self.check_tunnel():
+            return None
+        if not self._is_tunnel_process(pid):
+            return None
+        return pid
+
     def stop(self) -> None:
         """Stop background tunnel process.
 
+        Stops the tunnel this manager started, or else the background tunnel
+        recorded for this port by an earlier 'vmctl tunnel --background'.
+
         Raises:
             TunnelError: If no background tunnel is running
         """
         if self._process is None:
-            raise TunnelError("No background tunnel process running")
+            self._stop_recorded()
+            return
 
         try:
             # Send SIGTERM to process group
             if self._process.poll() is None:  # Still running
                 self._process.send_signal(signal.SIGTERM)
                 self._process.wait(timeout=5)
-                console.print("[yellow]Tunnel stopped[/yellow]")
+                say("[yellow]Tunnel stopped[/yellow]")
             else:
-                console.print("[dim]Tunnel already stopped[/dim]")
+                say("[dim]Tunnel already stopped[/dim]")
 
         except subprocess.TimeoutExpired:
             # Force kill if didn't stop gracefully
             self._process.kill()
-            console.print("[yellow]Tunnel force stopped[/yellow]")
+            say("[yellow]Tunnel force stopped[/yellow]")
         except Exception as e:
             raise TunnelError(f"Failed to stop tunnel: {e}") from e
         finally:
             self._process = None
+            self.state_file.unlink(missing_ok=True)
+
+    def _stop_recorded(self) -> None:
+        """Stop the background tunnel recorded in the state file.
+
+        The recorded process is only signalled if running_pid() confirms it
+        is still this tunnel; otherwise the stale record is just removed.
+
+        Raises:
+            TunnelError: If no background tunnel is recorded or it can't be stopped
+        """
+        if not self.state_file.exists():
+            raise TunnelError("No background tunnel process running")
+        pid = self.running_pid()
+        if pid is None:
+            self.state_file.unlink(missing_ok=True)
+            say("[dim]Tunnel already stopped[/dim]")
+            return
+
+        try:
+            # start_new_session made gcloud its own process group leader
+            os.killpg(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            say("[dim]Tunnel already stopped[/dim]")
+        except OSError as e:
+            raise TunnelError(f"Failed to stop tunnel: {e}") from e
+        else:
+            say(f"[yellow]Tunnel stopped (PID: {pid})[/yellow]")
+        finally:
+            self.state_file.unlink(missing_ok=True)
 
     def check_tunnel(self, port: int | None = None) -> bool:
         """Check if a tunnel is active on the specified port.
@@ -123,13 +286,10 @@ class TunnelManager:
         """
         check_port = port or self.local_port
 
-        # Check if port is in use (simple check)
+        # Connect to the local end of the tunnel; 127.0.0.1 avoids a DNS lookup
+        # and the short timeout keeps a dead port from stalling the caller
         try:
-            import socket
-
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            result = sock.connect_ex(("localhost", check_port))
-            sock.close()
-            return result == 0
-        except Exception:
+            socket.create_connection(("127.0.0.1", check_port), timeout=0.1).close()
+            return True
+        except OSError:
             return False
@@ -1,12 +1,59 @@
 """VM management operations."""
 
-from rich.console import Console
+import shlex
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any
 
 from vmctl.config.models import VMConfig
-from vmctl.core.exceptions import VMError
-from vmctl.utils.subprocess_runner import run_command
+from vmctl.core.exceptions import GCloudError, VMError
+from vmctl.utils.output import say
+from vmctl.utils.subprocess_runner import (
+    CommandResult,
+    exec_command,
+    run_command,
+    run_command_streaming,
+)
 
-console = Console()
+# How long exists()/status()/info() reuse one describe result, in seconds
+STATUS_CACHE_TTL = 2.0
+
+# How long an idle shared SSH connection is kept open
+SSH_CONTROL_PERSIST = "10m"
+
+
+@dataclass(frozen=True, slots=True)
+class VMInfo:
+    """VM details from a single ``gcloud compute instances describe`` call."""
+
+    status: str
+    zone: str = ""
+    machine_type: str = ""
+    internal_ip: str | None = None
+    external_ip: str | None = None
+
+    @classmethod
+    def from_describe(cls, data: dict[str, Any]) -> "VMInfo":
+        """Build from ``gcloud compute instances describe --format=json`` output.
+
+        Args:
+            data: Parsed describe output
+
+        Returns:
+            VMInfo with zone and machine type reduced to their short names
+        """
+        nic = (data.get("networkInterfaces") or [{}])[0]
+        access = (nic.get("accessConfigs") or [{}])[0]
+        return cls(
+            status=data.get("status") or "UNKNOWN",
+            zone=str(data.get("zone", "")).rsplit("/", 1)[-1],
+            machine_type=str(data.get("machineType", "")).rsplit("/", 1)[-1],
+            internal_ip=nic.get("networkIP"),
+            external_ip=access.get("natIP"),
+        )
 
 
 class VMManager:
@@ -19,43 +66,92 @@ class VMManager:
             config: VM configuration
         """
         self.config = config
+        self._gcloud_scope = (f"--zone={config.zone}", f"--project={config.project}")
+        # Last describe call as (monotonic time, result), shared by
+        # exists()/status()/info() for STATUS_CACHE_TTL seconds
+        self._describe_cache: tuple[float, CommandResult] | None = None
 
     @property
     def use_direct_ssh(self) -> bool:
         """Whether to use direct SSH instead of gcloud compute ssh."""
         return self.config.ssh_host is not None
 
-    def _ssh_opts(self) -> list[str]:
-        """Build common SSH options for direct SSH."""
+    # The config is fixed for the lifetime of a manager, so the SSH option
+    # tuples are built once on first use.
+    @cached_property
+    def _mux_opts(self) -> tuple[str, ...]:
+        """SSH connection-sharing options.
+
+        Repeated ssh/scp calls reuse one master connection (and its IAP
+        tunnel) instead of doing a full handshake each time. Sharing is
+        skipped if the control socket directory can't be created.
+        """
+        control_dir = Path.home() / ".cache" / "vmctl"
+        try:
+            control_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        except OSError:
+            return ()
+        return (
+            "-o", "ControlMaster=auto",
+            "-o", f"ControlPath={control_dir}/cm-%C",
+            "-o", f"ControlPersist={SSH_CONTROL_PERSIST}",
+        )  # fmt: skip
+
+    def _gcloud_mux_flags(self, flag: str = "--ssh-flag") -> list[str]:
+        """Connection-sharing options as gcloud pass-through arguments.
+
+        Args:
+            flag: gcloud pass-through flag (--ssh-flag, or --scp-flag for scp)
+
+        Returns:
+            One ``flag=-o Option=value`` argument per option
+        """
+        opts = self._mux_opts
+        return [f"{flag}={opts[i]} {opts[i + 1]}" for i in range(0, len(opts), 2)]
+
+    @cached_property
+    def _ssh_opts(self) -> tuple[str, ...]:
+        """Common SSH options for direct SSH."""
         opts = ["-o", "StrictHostKeyChecking=no", "-o", "UserKnownHostsFile=/dev/null"]
+        opts.extend(self._mux_opts)
         if self.config.ssh_key:
             opts.extend(["-i", self.config.ssh_key])
         if self.config.ssh_port:
             opts.extend(["-p", str(self.config.ssh_port)])
-        return opts
+        return tuple(opts)
 
-    def _scp_opts(self) -> list[str]:
-        """Build common SCP options for direct SSH."""
+    @cached_property
+    def _scp_opts(self) -> tuple[str, ...]:
+        """Common SCP options for direct SSH."""
         opts = ["-o", "StrictHostKeyChecking=no", "-o", "UserKnownHostsFile=/dev/null"]
+        opts.extend(self._mux_opts)
         if self.config.ssh_key:
             opts.extend(["-i", self.config.ssh_key])
         if self.config.ssh_port:
             opts.extend(["-P", str(self.config.ssh_port)])
-        return opts
+        return tuple(opts)
 
+    @cached_property
     def _ssh_target(self) -> str:
-        """Build user@host string for direct SSH."""
+        """user@host string for direct SSH."""
         host = self.config.ssh_host
         if self.config.ssh_user:
             return f"{self.config.ssh_user}@{host}"
         return host or ""
 
-    def exists(self) -> bool:
-        """Check if VM exists.
+    def _describe(self) -> CommandResult:
+        """Run ``gcloud compute instances describe`` for the VM.
 
-        Returns:
-            True if VM exists
+        The result is reused for STATUS_CACHE_TTL seconds (or until
+        invalidate()), so the usual ``exists()``, ``status()`` and ``info()``
+        checks cost one gcloud call between them.
         """
+        now = time.monotonic()
+        if self._describe_cache is not None:
+            cached_at, cached = self._describe_cache
+            if now - cached_at < STATUS_CACHE_TTL:
+                return cached
+
         result = run_command(
             [
                 "gcloud",
@@ -63,40 +159,71 @@ class VMManager:
                 "instances",
                 "describe",
                 self.config.vm_name,
-                f"--zone={self.config.zone}",
-                f"--project={self.config.project}",
+                *self._gcloud_scope,
+                "--format=json",
             ],
             check=False,
         )
-        return result.success
+        self._describe_cache = (now, result)
+        return result
 
-    def status(self) -> str:
-        """Get VM status.
+    def invalidate(self) -> None:
+        """Forget the cached VM status so the next check queries gcloud."""
+        self._describe_cache = None
+
+    def describe(self) -> tuple[bool, str]:
+        """Check existence and status with a single gcloud call.
 
         Returns:
-            Status string (RUNNING, TERMINATED, STOPPED, etc.)
+            Tuple of (exists, status); status is empty if the VM doesn't exist
+
+        Raises:
+            VMError: If gcloud's describe output can't be parsed
+        """
+        if not self._describe().success:
+            return False, ""
+        return True, self.info().status
+
+    def exists(self) -> bool:
+        """Check if VM exists.
+
+        Returns:
+            True if VM exists
+        """
+        return self._describe().success
+
+    def info(self) -> VMInfo:
+        """Get VM status, location and addresses.
+
+        Returns:
+            VMInfo for the VM
 
         Raises:
             VMError: If VM doesn't exist or status check fails
         """
-        result = run_command(
-            [
-                "gcloud",
-                "compute",
-                "instances",
-                "describe",
-                self.config.vm_name,
-                f"--zone={self.config.zone}",
-                f"--project={self.config.project}",
-                "--format=value(status)",
-            ],
-            check=False,
-        )
+        result = self._describe()
 
         if not result.success:
             raise VMError(f"Failed to get VM status: {result.stderr}")
 
-        return result.stdout or "UNKNOWN"
+        if not result.stdout_bytes:
+            return VMInfo(status="UNKNOWN")
+
+        try:
+            return VMInfo.from_describe(result.json())
+        except (ValueError, AttributeError) as e:
+            raise VMError(f"Unexpected output from gcloud describe: {e}") from e
+
+    def status(self) -> str:
+        """Get VM status.
+
+        Returns:
+            Status string (RUNNING, TERMINATED, STOPPED, etc.)
+
+        Raises:
+            VMError: If VM doesn't exist or status check fails
+        """
+        return self.info().status
 
     def start(self) -> None:
         """Start the VM.
@@ -104,7 +231,8 @@ class VMManager:
         Raises:
             VMError: If start fails
         """
-        console.print(f"[blue]Starting VM {self.config.vm_name}...[/blue]")
+        say(f"[blue]Starting VM {self.config.vm_name}...[/blue]")
+        self.invalidate()
 
         try:
             run_command(
@@ -114,12 +242,12 @@ class VMManager:
                     "instances",
                     "start",
                     self.config.vm_name,
-                    f"--zone={self.config.zone}",
-                    f"--project={self.config.project}",
+                    *self._gcloud_scope,
                 ],
                 check=True,
+                capture_stdout=False,
             )
-            console.print(f"[green]✓ VM {self.config.vm_name} started[/green]")
+            say(f"[green]✓ VM {self.config.vm_name} started[/green]")
         except Exception as e:
             raise VMError(f"Failed to start VM: {e}") from e
 
@@ -129,7 +257,8 @@ class VMManager:
         Raises:
             VMError: If stop fails
         """
-        console.print(f"[blue]Stopping VM {self.config.vm_name}...[/blue]")
+        say(f"[blue]Stopping VM {self.config.vm_name}...[/blue]")
+        self.invalidate()
 
         try:
             run_command(
@@ -139,12 +268,12 @@ class VMManager:
                     "instances",
                     "stop",
                     self.config.vm_name,
-                    f"--zone={self.config.zone}",
-                    f"--project={self.config.project}",
+                    *self._gcloud_scope,
                 ],
                 check=True,
+                capture_stdout=False,
             )
-            console.print(f"[green]✓ VM {self.config.vm_name} stopped[/green]")
+            say(f"[green]✓ VM {self.config.vm_name} stopped[/green]")
         except Exception as e:
             raise VMError(f"Failed to stop VM: {e}") from e
 
@@ -154,7 +283,8 @@ class VMManager:
         Raises:
             VMError: If deletion fails
         """
-        console.print(f"[red]Deleting VM {self.config.vm_name}...[/red]")
+        say(f"[red]Deleting VM {self.config.vm_name}...[/red]")
+        self.invalidate()
 
         try:
             run_command(
@@ -164,20 +294,23 @@ class VMManager:
                     "instances",
                     "delete",
                     self.config.vm_name,
-                    f"--zone={self.config.zone}",
-                    f"--project={self.config.project}",
+                    *self._gcloud_scope,
                     "--delete-disks=boot",
                     "--quiet",
                 ],
                 check=True,
+                capture_stdout=False,
             )
-            console.print(f"[green]✓ VM {self.config.vm_name} deleted[/green]")
+            say(f"[green]✓ VM {self.config.vm_name} deleted[/green]")
         except Exception as e:
             raise VMError(f"Failed to delete VM: {e}") from e
 
     def ssh(self, command: str | None = None) -> None:
         """SSH into the VM.
 
+        Without a command, vmctl hands the terminal over to the SSH client by
+        replacing its own process, so this call doesn't return on success.
+
         Args:
             command: Optional command to run (if None, opens interactive shell)
 
@@ -185,7 +318,7 @@ class VMManager:
             VMError: If SSH fails
         """
         if self.use_direct_ssh:
-            cmd = ["ssh", *self._ssh_opts(), self._ssh_target()]
+            cmd = ["ssh", *self._ssh_opts, self._ssh_target]
             if command:
                 cmd.append(command)
         else:
@@ -194,48 +327,61 @@ class VMManager:
                 "compute",
                 "ssh",
                 self.config.vm_name,
-                f"--zone={self.config.zone}",
-                f"--project={self.config.project}",
+                *self._gcloud_scope,
                 "--tunnel-through-iap",
+                *self._gcloud_mux_flags(),
             ]
             if command:
                 cmd.extend(["--command", command])
 
         try:
-            result = run_command(cmd, check=False)
-            if not result.success:
-                raise VMError(f"SSH command failed: {result.stderr}")
+            if not command:
+                exec_command(cmd)
+            else:
+                result = run_command(cmd, check=False)
+                if not result.success:
+                    raise VMError(f"SSH command failed: {result.stderr}")
         except Exception as e:
             raise VMError(f"Failed to SSH to VM: {e}") from e
 
-    def ssh_exec(self, command: str) -> tuple[bool, str, str]:
-        """Execute a command on the VM via SSH and return output.
-
-        Unlike ssh(), this method captures and returns stdout/stderr
-        for programmatic use.
+    def _ssh_exec_cmd(self, command: str) -> list[str]:
+        """Build the non-interactive SSH command line for running a remote command.
 
         Args:
             command: Command to execute on the VM
 
         Returns:
-            Tuple of (success, stdout, stderr)
+            Command and arguments as list
         """
         if self.use_direct_ssh:
-            cmd = ["ssh", *self._ssh_opts(), self._ssh_target(), command]
+            cmd = ["ssh", *self._ssh_opts, self._ssh_target, command]
         else:
             cmd = [
                 "gcloud",
                 "compute",
                 "ssh",
                 self.config.vm_name,
-                f"--zone={self.config.zone}",
-                f"--project={self.config.project}",
+                *self._gcloud_scope,
                 "--tunnel-through-iap",
+                *self._gcloud_mux_flags(),
                 "--command",
                 command,
             ]
+        return cmd
 
-        result = run_command(cmd, check=False)
+    def ssh_exec(self, command: str) -> tuple[bool, str, str]:
+        """Execute a command on the VM via SSH and return output.
+
+        Unlike ssh(), this method captures and returns stdout/stderr
+        for programmatic use.
+
+        Args:
+            command: Command to execute on the VM
+
+        Returns:
+            Tuple of (success, stdout, stderr)
+        """
+        result = run_command(self._ssh_exec_cmd(command), check=False)
         return result.success, result.stdout, result.stderr
 
     def scp(
@@ -255,10 +401,10 @@ class VMManager:
             Tuple of (success, stdout, stderr)
         """
         if self.use_direct_ssh:
-            cmd = ["scp", *self._scp_opts()]
+            cmd = ["scp", *self._scp_opts]
             if recursive:
                 cmd.append("-r")
-            cmd.extend([local_path, f"{self._ssh_target()}:{remote_path}"])
+            cmd.extend([local_path, f"{self._ssh_target}:{remote_path}"])
         else:
             cmd = [
                 "gcloud",
@@ -271,19 +417,22 @@ class VMManager:
                 [
                     local_path,
                     f"{self.config.vm_name}:{remote_path}",
-                    f"--zone={self.config.zone}",
-                    f"--project={self.config.project}",
+                    *self._gcloud_scope,
                     "--tunnel-through-iap",
+                    *self._gcloud_mux_flags("--scp-flag"),
                 ]
             )
         result = run_command(cmd, check=False)
         return result.success, result.stdout, result.stderr
 
-    def logs(self, log_file: str = "/var/log/vm-auto-shutdown.log") -> str:
+    def logs(
+        self, log_file: str = "/var/log/vm-auto-shutdown.log", lines: int | None = None
+    ) -> str:
         """Get logs from VM.
 
         Args:
             log_file: Path to log file on VM
+            lines: Only return the last N lines (default: whole file)
 
         Returns:
             Log contents
@@ -291,9 +440,51 @@ class VMManager:
         Raises:
             VMError: If log retrieval fails
         """
-        success, stdout, stderr = self.ssh_exec(f"sudo cat {log_file}")
+        success, stdout, stderr = self.ssh_exec(self._logs_command(log_file, lines))
 
         if not success:
             raise VMError(f"Failed to retrieve logs: {stderr}")
 
         return stdout
+
+    def stream_logs(
+        self,
+        on_line: Callable[[str], None],
+        log_file: str = "/var/log/vm-auto-shutdown.log",
+        lines: int | None = None,
+    ) -> None:
+        """Stream logs from VM line by line instead of buffering them.
+
+        Args:
+            on_line: Called with each log line as it arrives
+            log_file: Path to log file on VM
+            lines: Only stream the last N lines (default: whole file)
+
+        Raises:
+            VMError: If log retrieval fails
+        """
+        try:
+            result = run_command_streaming(
+                self._ssh_exec_cmd(self._logs_command(log_file, lines)), on_line
+            )
+        except GCloudError as e:
+            raise VMError(f"Failed to retrieve logs: {e}") from e
+
+        if not result.success:
+            raise VMError(f"Failed to retrieve logs: {result.stderr}")
+
+    @staticmethod
+    def _logs_command(log_file: str, lines: int | None) -> str:
+        """Build the remote command that prints a log file.
+
+        Args:
+            log_file: Path to log file on VM
+            lines: Only print the last N lines (default: whole file)
+
+        Returns:
+            Shell command to run on the VM
+        """
+        quoted = shlex.quote(log_file)
+        if lines is None:
+            return f"sudo cat {quoted}"
+        return f"sudo tail -n {int(lines)} {quoted}"
@@ -0,0 +1,55 @@
+"""Read gcloud CLI properties without spawning gcloud."""
+
+import configparser
+import os
+from pathlib import Path
+
+
+def _gcloud_config_dir() -> Path:
+    """Get gcloud's configuration directory.
+
+    Returns:
+        $CLOUDSDK_CONFIG if set, otherwise ~/.config/gcloud
+    """
+    override = os.environ.get("CLOUDSDK_CONFIG")
+    return Path(override) if override else Path.home() / ".config" / "gcloud"
+
+
+def gcloud_property(section: str, key: str) -> str | None:
+    """Read a property the way ``gcloud config get-value`` resolves it.
+
+    Checks the ``CLOUDSDK_<SECTION>_<KEY>`` environment variable, then the
+    active named configuration file. Starting gcloud just to read a value
+    takes around a second, while this is a small file read.
+
+    Installation-wide properties aren't read, so callers should still fall
+    back to gcloud when this returns None.
+
+    Args:
+        section: Property section (e.g. "core", "compute")
+        key: Property name (e.g. "project", "zone")
+
+    Returns:
+        Property value, or None if it isn't set or the config can't be read
+    """
+    env_value = os.environ.get(f"CLOUDSDK_{section.upper()}_{key.upper()}")
+    if env_value:
+        return env_value
+
+    config_dir = _gcloud_config_dir()
+    active = os.environ.get("CLOUDSDK_ACTIVE_CONFIG_NAME")
+    if not active:
+        try:
+            active = (config_dir / "active_config").read_text().strip()
+        except OSError:
+            # gcloud falls back to the "default" configuration
+            active = "default"
+
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        if not parser.read(config_dir / "configurations" / f"config_{active}"):
+            return None
+    except configparser.Error:
+        return None
+
+    return parser.get(section, key, fallback=None) or None
@@ -0,0 +1,48 @@
+"""Console output that only loads Rich when writing to a terminal."""
+
+import functools
+import os
+import re
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Rich markup tags such as [red], [/red], [bold blue] or [/]
+_MARKUP_RE = re.compile(r"\[/?[a-z ]*\]")
+
+
+@functools.cache
+def _rich_console() -> "Console | None":
+    """Get the shared Rich console, or None when output isn't a terminal.
+
+    Returns:
+        Rich Console for interactive use, None for pipes, files and NO_COLOR
+    """
+    if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+        return None
+
+    from rich.console import Console
+
+    return Console()
+
+
+def say(message: str = "", *, markup: bool = True, highlight: bool = True) -> None:
+    """Print a message, styled with Rich only when stdout is a terminal.
+
+    Scripted use (pipes, cron, CI) gets plain text with markup tags
+    stripped, and never pays for importing Rich.
+
+    Args:
+        message: Text to print, optionally containing Rich markup
+        markup: Interpret Rich markup tags in message
+        highlight: Let Rich highlight numbers, paths, etc. (terminal only)
+    """
+    console = _rich_console()
+    if console is not None:
+        console.print(message, markup=markup, highlight=highlight)
+    elif markup:
+        print(_MARKUP_RE.sub("", message).replace("\\[", "["))
+    else:
+        print(message)
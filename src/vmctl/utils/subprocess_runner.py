@@ -1,15 +1,34 @@
 """Subprocess utility for running commands."""
 
+import json
+import os
 import subprocess
-from typing import Any
+import sys
+import tempfile
+from collections.abc import Callable
+from typing import Any, NoReturn
 
 from vmctl.core.exceptions import GCloudError
 
+# Environment defaults for gcloud invocations. Every gcloud call otherwise
+# checks for component updates, which adds latency to each subprocess;
+# vmctl makes many short calls, so skip it unless the user set it explicitly.
+_GCLOUD_ENV_DEFAULTS = {
+    "CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK": "true",
+}
+
 
 class CommandResult:
-    """Result of a command execution."""
+    """Result of a command execution.
+
+    Output may be given as bytes (as captured by run_command) or str; bytes
+    are only decoded when ``stdout``/``stderr`` is first accessed.
+    """
+
+    # Many results are created per CLI call; slots avoid a per-instance dict
+    __slots__ = ("returncode", "success", "_stdout", "_stderr", "_stdout_str", "_stderr_str")
 
-    def __init__(self, returncode: int, stdout: str, stderr: str) -> None:
+    def __init__(self, returncode: int, stdout: str | bytes, stderr: str | bytes) -> None:
         """Initialize command result.
 
         Args:
@@ -18,10 +37,45 @@ class CommandResult:
             stderr: Standard error
         """
         self.returncode = returncode
-        self.stdout = stdout
-        self.stderr = stderr
+        self._stdout = stdout
+        self._stderr = stderr
+        self._stdout_str: str | None = None
+        self._stderr_str: str | None = None
         self.success = returncode == 0
 
+    @property
+    def stdout(self) -> str:
+        """Standard output decoded as UTF-8."""
+        if self._stdout_str is None:
+            self._stdout_str = _decode(self._stdout)
+        return self._stdout_str
+
+    @property
+    def stderr(self) -> str:
+        """Standard error decoded as UTF-8."""
+        if self._stderr_str is None:
+            self._stderr_str = _decode(self._stderr)
+        return self._stderr_str
+
+    @property
+    def stdout_bytes(self) -> bytes:
+        """Standard output as raw bytes."""
+        if isinstance(self._stdout, bytes):
+            return self._stdout
+        return self._stdout.encode()
+
+    def json(self) -> Any:
+        """Parse standard output as JSON.
+
+        Returns:
+            Parsed JSON value
+
+        Raises:
+            json.JSONDecodeError: If stdout isn't valid JSON
+        """
+        # json.loads accepts bytes, so there's no intermediate str
+        return json.loads(self.stdout_bytes)
+
     def check(self) -> "CommandResult":
         """Raise exception if command failed.
 
@@ -40,10 +94,37 @@ class CommandResult:
         return self
 
 
+def _decode(output: str | bytes) -> str:
+    """Decode captured output, replacing invalid UTF-8 rather than failing.
+
+    Args:
+        output: Captured output
+
+    Returns:
+        Output as str
+    """
+    if isinstance(output, bytes):
+        return output.decode("utf-8", errors="replace")
+    return output
+
+
+def _apply_gcloud_env(cmd: list[str], kwargs: dict[str, Any]) -> None:
+    """Add gcloud environment defaults unless the caller passed its own env.
+
+    Args:
+        cmd: Command and arguments as list
+        kwargs: Keyword arguments destined for subprocess, updated in place
+    """
+    if cmd and cmd[0] == "gcloud" and "env" not in kwargs:
+        kwargs["env"] = {**_GCLOUD_ENV_DEFAULTS, **os.environ}
+
+
 def run_command(
     cmd: list[str],
     check: bool = False,
     timeout: float | None = None,
+    capture_stdout: bool = True,
+    capture_stderr: bool = True,
     **kwargs: Any,
 ) -> CommandResult:
     """Run a command and return structured result.
@@ -52,26 +133,30 @@ def run_command(
         cmd: Command and arguments as list
         check: Raise exception if command fails
         timeout: Command timeout in seconds
+        capture_stdout: Capture stdout; if False it is discarded
+        capture_stderr: Capture stderr; if False it is discarded
         **kwargs: Additional subprocess.run arguments
 
     Returns:
-        CommandResult with output and status
+        CommandResult with output and status (discarded streams are empty)
 
     Raises:
         GCloudError: If command fails and check=True
     """
+    _apply_gcloud_env(cmd, kwargs)
+
     try:
         result = subprocess.run(
             cmd,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
             timeout=timeout,
             **kwargs,
         )
         cmd_result = CommandResult(
             returncode=result.returncode,
-            stdout=result.stdout.strip(),
-            stderr=result.stderr.strip(),
+            stdout=(result.stdout or b"").strip(),
+            stderr=(result.stderr or b"").strip(),
         )
 
         if check:
@@ -83,3 +168,87 @@ def run_command(
         raise GCloudError(f"Command timed out after {timeout}s: {' '.join(cmd)}") from e
     except FileNotFoundError as e:
         raise GCloudError(f"Command not found: {cmd[0]}") from e
+
+
+def exec_command(cmd: list[str]) -> NoReturn:
+    """Replace the current process with a command.
+
+    Use this for interactive hand-offs (e.g. an SSH shell) where vmctl has
+    nothing left to do: the command inherits the terminal directly and
+    Python doesn't stay resident as its parent. Python opens files
+    non-inheritable, so only stdin/stdout/stderr are passed on.
+
+    Args:
+        cmd: Command and arguments as list
+
+    Raises:
+        GCloudError: If the command is not found or can't be executed
+    """
+    kwargs: dict[str, Any] = {}
+    _apply_gcloud_env(cmd, kwargs)
+    env = kwargs.get("env", os.environ)
+
+    # Anything still buffered would be lost when the process image is replaced
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    try:
+        os.execvpe(cmd[0], cmd, env)
+    except FileNotFoundError as e:
+        raise GCloudError(f"Command not found: {cmd[0]}") from e
+    except OSError as e:
+        raise GCloudError(f"Failed to execute {cmd[0]}: {e}") from e
+
+
+def run_command_streaming(
+    cmd: list[str],
+    on_line: Callable[[str], None],
+    timeout: float | None = None,
+    **kwargs: Any,
+) -> CommandResult:
+    """Run a command, passing each stdout line to a callback as it arrives.
+
+    Use this instead of run_command() for output that may be large (e.g.
+    log files), so it is never held in memory all at once.
+
+    Args:
+        cmd: Command and arguments as list
+        on_line: Called with each stdout line, without its trailing newline
+        timeout: Timeout in seconds for the command to exit once output ends
+        **kwargs: Additional subprocess.Popen arguments
+
+    Returns:
+        CommandResult with empty stdout (it was streamed) and captured stderr
+
+    Raises:
+        GCloudError: If the command is not found or times out
+    """
+    _apply_gcloud_env(cmd, kwargs)
+
+    # stderr goes to a temp file so a chatty stderr can't fill its pipe and
+    # block the process while we're reading stdout. Like CommandResult, decode
+    # leniently so a stray non-UTF-8 byte in a log can't abort the stream.
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="replace") as stderr_file:
+        try:
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+                **kwargs,
+            ) as proc:
+                assert proc.stdout is not None
+                for line in proc.stdout:
+                    on_line(line.rstrip("\n"))
+                returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired as e:
+            raise GCloudError(f"Command timed out after {timeout}s: {' '.join(cmd)}") from e
+        except FileNotFoundError as e:
+            raise GCloudError(f"Command not found: {cmd[0]}") from e
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read().strip()
+
+    return CommandResult(returncode=returncode, stdout="", stderr=stderr)
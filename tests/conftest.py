@@ -1,23 +1,16 @@
 """Pytest configuration and shared fixtures."""
 
-from collections.abc import Generator
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
+from click.testing import CliRunner
 
 from vmctl.config.manager import ConfigManager
 from vmctl.config.models import VMConfig
 
 
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for testing."""
-    with TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-
-@pytest.fixture
+# Configs are only read by tests, so build them once per session
+@pytest.fixture(scope="session")
 def test_config() -> VMConfig:
     """Create a standard test configuration."""
     return VMConfig(
@@ -29,7 +22,7 @@ def test_config() -> VMConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_config() -> VMConfig:
     """Create a minimal test configuration."""
     return VMConfig(
@@ -39,17 +32,23 @@ def minimal_config() -> VMConfig:
     )
 
 
+# CliRunner keeps no state between invocations, so one serves each module.
+# NO_COLOR (set only for the duration of each invoke) keeps output plain text.
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Create Click test runner."""
+    return CliRunner(env={"NO_COLOR": "1"})
+
+
 @pytest.fixture
-def config_manager(temp_dir: Path) -> ConfigManager:
+def config_manager(tmp_path: Path) -> ConfigManager:
     """Create a ConfigManager with temporary directory."""
-    return ConfigManager(config_dir=temp_dir)
+    return ConfigManager(config_dir=tmp_path)
 
 
 @pytest.fixture
-def config_manager_with_config(
-    temp_dir: Path, test_config: VMConfig
-) -> ConfigManager:
+def config_manager_with_config(tmp_path: Path, test_config: VMConfig) -> ConfigManager:
     """Create a ConfigManager with pre-saved config."""
-    manager = ConfigManager(config_dir=temp_dir)
+    manager = ConfigManager(config_dir=tmp_path)
     manager.save(test_config)
     return manager
@@ -1,7 +1,11 @@
 """Integration test for VM Workstation creation and validation.
 
 This test replicates the bash workflow from scripts/run-vm-test-workflow.sh
-but uses vmws CLI commands instead of raw gcloud commands.
+but uses vmws CLI commands where it can. Commands run on the VM go through
+gcloud compute ssh directly so they can share one SSH connection. Snapshot,
+disk and VM create/delete go through the Compute Engine client library
+(google-cloud-compute) rather than gcloud subprocesses, authenticating with
+Application Default Credentials (``gcloud auth application-default login``).
 
 Features:
     - TRUE cost calculation based on actual resource usage during test
@@ -31,23 +35,201 @@ Environment Variables:
     VMWS_PROJECT - GCP project ID (uses gcloud default if not set)
     VMWS_MACHINE_TYPE - VM machine type (default: e2-standard-2)
     VMWS_DISK_SIZE_GB - Data disk size in GB (default: 200)
+    VMWS_SSH_POLL_INTERVAL - First delay between boot/SSH readiness checks in seconds (default: 2)
+    VMWS_QUIET - Set to any value to stop echoing each command line (e.g. in CI logs)
 """
 
 import argparse
+import functools
+import importlib
 import os
+import re
+import shlex
 import subprocess
 import sys
+import threading
 import time
+import uuid
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import Any, ClassVar, Literal, NamedTuple
 
 import pytest
 
+from vmctl.core.vm import SSH_CONTROL_PERSIST
+from vmctl.utils.gcloud_config import gcloud_property
+
+# Longest wait for a single Compute Engine operation, in seconds
+OPERATION_TIMEOUT = 600
+
+# Helper scripts uploaded to the VM
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+
+# How _run_command handles a command's output
+OutputMode = Literal["stream", "capture", "discard"]
+
+# Lines of streamed command output kept for error messages
+STREAM_TAIL_LINES = 64
+
+# Serial console line systemd prints once boot has finished (unit name or description)
+BOOT_FINISHED_RE = re.compile(r"Reached target (multi-user\.target|Multi-User System)")
+
+CLOUD_PLATFORM_SCOPE = "https://www.googleapis.com/auth/cloud-platform"
+
+# Cost model assumptions
+HOURS_PER_MONTH = 730
+WORKDAY_HOURS_PER_MONTH = 8 * 22  # 8 hours/day, 22 working days/month
+WORKSTATION_HOURLY_FEE = 0.20  # Cloud Workstation always-on fee, $/hour
+
+
+@functools.cache
+def _compute_v1() -> ModuleType:
+    """Import the Compute Engine client library on first use.
+
+    Kept out of module scope so collecting the unit test suite doesn't
+    require google-cloud-compute.
+    """
+    return importlib.import_module("google.cloud.compute_v1")
+
+
+# Image family -> image self link, keyed by (project, family)
+_IMAGE_CACHE: dict[tuple[str, str], str] = {}
+
+
+@functools.cache
+def _find_scripts() -> dict[str, Path]:
+    """Find the helper scripts the workflow uploads, once per process.
+
+    Returns:
+        Mapping of script file name to path, for scripts that exist
+    """
+    return {
+        name: path
+        for name in (
+            "vm-startup-script.sh",
+            "setup-vm-environment.sh",
+            "vm-auto-shutdown.sh",
+            "install-auto-shutdown.sh",
+        )
+        if (path := SCRIPTS_DIR / name).is_file()
+    }
+
+
+@functools.cache
+def _read_script(path: Path) -> str:
+    """Read a helper script's contents, once per process.
+
+    Args:
+        path: Script path
+
+    Returns:
+        Script contents
+    """
+    return path.read_text()
+
+
+@functools.cache
+def _gcloud_default_project() -> str:
+    """Get gcloud's default project, cached for the rest of the process.
+
+    Reads gcloud's config file directly and only starts gcloud if the
+    project isn't found there. Failures aren't cached; call
+    ``_gcloud_default_project.cache_clear()`` after changing gcloud config.
+
+    Raises:
+        ValueError: If no project is configured
+    """
+    project = gcloud_property("core", "project")
+    if not project:
+        result = subprocess.run(
+            ["gcloud", "config", "get-value", "project"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        project = result.stdout.strip()
+    if not project or project == "(unset)":
+        raise ValueError("No GCP project configured. Set VMWS_PROJECT or run 'gcloud config set project PROJECT_ID'")
+    return project
+
+
+class ValidationTally(NamedTuple):
+    """Validation test counts."""
+
+    total: int
+    passed: int
+
+    @property
+    def all_ok(self) -> bool:
+        """Whether every validation test passed."""
+        return self.passed == self.total
+
+
+@dataclass(frozen=True, slots=True)
+class IntegrationConfig:
+    """Settings for one integration test run."""
+
+    workstation_disk: str
+    zone: str = "northamerica-northeast1-b"
+    region: str = "northamerica-northeast1"
+    project: str | None = None
+    machine_type: str = "e2-standard-2"
+    disk_size_gb: int = 200
+    ssh_poll_interval: float = 2.0
+    quiet: bool = False
+
+    @classmethod
+    def from_env(cls) -> "IntegrationConfig":
+        """Read settings from VMWS_* environment variables.
+
+        Unset variables fall back to the field defaults, and an unset
+        VMWS_WORKSTATION_DISK gives an empty workstation_disk.
+
+        Returns:
+            Config built from the environment
+        """
+        env = os.environ
+        overrides: dict[str, Any] = {
+            field: env[var]
+            for field, var in (
+                ("zone", "VMWS_ZONE"),
+                ("region", "VMWS_REGION"),
+                ("project", "VMWS_PROJECT"),
+                ("machine_type", "VMWS_MACHINE_TYPE"),
+            )
+            if env.get(var)
+        }
+        if env.get("VMWS_DISK_SIZE_GB"):
+            overrides["disk_size_gb"] = int(env["VMWS_DISK_SIZE_GB"])
+        if env.get("VMWS_SSH_POLL_INTERVAL"):
+            overrides["ssh_poll_interval"] = float(env["VMWS_SSH_POLL_INTERVAL"])
+        if env.get("VMWS_QUIET"):
+            overrides["quiet"] = True
+
+        return cls(workstation_disk=env.get("VMWS_WORKSTATION_DISK", ""), **overrides)
+
 
 class VMWorkstationIntegrationTest:
     """Integration test for VM Workstation workflow."""
 
+    # GCP pricing (as of 2025, subject to change - check cloud.google.com/compute/pricing)
+    # Prices are per hour
+    PRICING: ClassVar[dict[str, float]] = {
+        "e2-standard-2": 0.067,      # $0.067/hour
+        "e2-standard-4": 0.134,      # $0.134/hour
+        "n2-standard-2": 0.097,      # $0.097/hour
+        "n2-standard-4": 0.194,      # $0.194/hour
+        "pd-standard-gb": 0.04 / HOURS_PER_MONTH,  # $0.04/GB/month = ~$0.0000548/GB/hour
+        "pd-ssd-gb": 0.17 / HOURS_PER_MONTH,       # $0.17/GB/month = ~$0.0002329/GB/hour
+        "snapshot-gb": 0.026 / HOURS_PER_MONTH,    # $0.026/GB/month = ~$0.0000356/GB/hour
+    }
+
     def __init__(
         self,
         workstation_disk: str,
@@ -56,6 +238,9 @@ class VMWorkstationIntegrationTest:
         project: str | None = None,
         machine_type: str = "e2-standard-2",
         disk_size_gb: int = 200,
+        ssh_poll_interval: float = 2.0,
+        quiet: bool = False,
+        pricing_overrides: dict[str, float] | None = None,
     ) -> None:
         """Initialize integration test.
 
@@ -66,6 +251,12 @@ class VMWorkstationIntegrationTest:
             project: GCP project ID (uses gcloud default if None)
             machine_type: VM machine type (e.g., e2-standard-2, n2-standard-4)
             disk_size_gb: Data disk size in GB
+            ssh_poll_interval: First delay between boot/SSH readiness checks, in seconds
+            quiet: Don't echo each command line (it's still in the report)
+            pricing_overrides: Hourly prices replacing entries in PRICING
+
+        Compute Engine calls use Application Default Credentials with the
+        cloud-platform scope; vmws and gcloud commands use gcloud's own login.
         """
         self.workstation_disk = workstation_disk
         self.zone = zone
@@ -73,21 +264,44 @@ class VMWorkstationIntegrationTest:
         self.project = project or self._get_gcloud_project()
         self.machine_type = machine_type
         self.disk_size_gb = disk_size_gb
+        self.ssh_poll_interval = ssh_poll_interval
+        self.quiet = quiet
+        self.pricing = {**self.PRICING, **(pricing_overrides or {})}
+
+        # Environment for every child command, built once; also makes gcloud
+        # default to the test's project, zone and region
+        self._child_env = {
+            **os.environ,
+            "CLOUDSDK_CORE_PROJECT": self.project,
+            "CLOUDSDK_COMPUTE_ZONE": self.zone,
+            "CLOUDSDK_COMPUTE_REGION": self.region,
+        }
 
         # Generate unique test VM name
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        self.vm_name = f"test-vm-{timestamp}"
+        # One stamp names the VM, disk, snapshot and report; the random suffix
+        # keeps runs started in the same second (e.g. under xdist) apart
+        self._init_ts = datetime.now()
+        self._init_stamp = f"{self._init_ts.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        self.vm_name = f"test-vm-{self._init_stamp}"
         self.snapshot_name = f"{self.vm_name}-snapshot"
         self.disk_name = f"{self.vm_name}-disk"
 
-        # Report data
+        # Steps look helper scripts up by file name
+        self._scripts_dir = SCRIPTS_DIR
+        self._script_paths = _find_scripts()
+
+        # Report data, shared with worker threads
+        self._report_lock = threading.Lock()
         self.report_data: dict[str, Any] = {
-            "start_time": datetime.now(),
+            "start_time": self._init_ts,
             "steps": [],
             "validation_results": [],
             "resources": [],
         }
 
+        # Cleanup running in the background after a failed run
+        self._cleanup_thread: threading.Thread | None = None
+
         # Track created resources for cleanup
         self.created_resources = {
             "vm": False,
@@ -99,62 +313,292 @@ class VMWorkstationIntegrationTest:
         self.resource_creation_times: dict[str, datetime] = {}
         self.resource_deletion_times: dict[str, datetime] = {}
 
+    @classmethod
+    def from_config(
+        cls, config: IntegrationConfig, pricing_overrides: dict[str, float] | None = None
+    ) -> "VMWorkstationIntegrationTest":
+        """Create a test run from an IntegrationConfig.
+
+        Args:
+            config: Test settings
+            pricing_overrides: Hourly prices replacing entries in PRICING
+
+        Returns:
+            Integration test instance
+        """
+        return cls(**asdict(config), pricing_overrides=pricing_overrides)
+
     def _get_gcloud_project(self) -> str:
-        """Get default gcloud project."""
-        result = subprocess.run(
-            ["gcloud", "config", "get-value", "project"],
-            capture_output=True,
+        """Get default gcloud project.
+
+        Project environment variables win; otherwise the gcloud default is
+        looked up once per process.
+        """
+        for var in ("VMWS_PROJECT", "GOOGLE_CLOUD_PROJECT", "GOOGLE_PROJECT"):
+            project = os.environ.get(var)
+            if project:
+                return project
+        return _gcloud_default_project()
+
+    def _record_step(self, description: str, success: bool, duration: float, command: str) -> None:
+        """Print the outcome of a step and add it to the report.
+
+        Steps can finish on worker threads (parallel installs and cleanup),
+        so the print and the report entry happen under one lock.
+        """
+        with self._report_lock:
+            if success:
+                print(f"   ✅ Success ({duration:.1f}s)")
+            else:
+                print(f"   ❌ Failed ({duration:.1f}s)")
+
+            self.report_data["steps"].append({
+                "description": description,
+                "success": success,
+                "duration": duration,
+                "command": command,
+            })
+
+    def _stream_command(self, cmd: list[str]) -> subprocess.CompletedProcess[str]:
+        """Run a command, echoing its output live and keeping the last lines.
+
+        stderr is merged into stdout, so progress messages from gcloud show up
+        as they happen rather than after a long silent wait. Only the last
+        STREAM_TAIL_LINES lines are kept (for error messages), so chatty
+        installs don't hold their whole log in memory.
+
+        Args:
+            cmd: Command and arguments
+
+        Returns:
+            Completed process with the tail of the combined output as stdout
+        """
+        tail: deque[str] = deque(maxlen=STREAM_TAIL_LINES)
+        with subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            check=False,
-        )
-        project = result.stdout.strip()
-        if not project or project == "(unset)":
-            raise ValueError("No GCP project configured. Set VMWS_PROJECT or run 'gcloud config set project PROJECT_ID'")
-        return project
+            bufsize=1,
+            env=self._child_env,
+        ) as proc:
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                print(f"   │ {line}", end="", flush=True)
+                tail.append(line)
+        return subprocess.CompletedProcess(cmd, proc.returncode, "".join(tail), "")
+
+    def _run_command(
+        self,
+        cmd: list[str],
+        description: str,
+        check: bool = True,
+        output: OutputMode = "stream",
+    ) -> subprocess.CompletedProcess[str]:
+        """Run command and log result.
 
-    def _run_command(self, cmd: list[str], description: str, check: bool = True) -> subprocess.CompletedProcess[str]:
-        """Run command and log result."""
+        Commands never read stdin, so it's always /dev/null.
+
+        Args:
+            cmd: Command and arguments
+            description: What the command does, for the log and report
+            check: Raise if the command fails
+            output: "stream" echoes output live (stderr merged into stdout,
+                only the tail kept); "capture" keeps stdout and stderr in
+                full; "discard" drops stdout and keeps stderr for errors
+
+        Returns:
+            Completed process with captured output
+        """
+        # Quoted so the report's command can be pasted into a shell
+        command = shlex.join(cmd)
         print(f"\n🔵 {description}")
-        print(f"   Command: {' '.join(cmd)}")
+        if not self.quiet:
+            print(f"   Command: {command}")
 
         start_time = time.time()
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        if output == "stream":
+            result = self._stream_command(cmd)
+        else:
+            result = subprocess.run(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE if output == "capture" else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=False,
+                env=self._child_env,
+            )
         duration = time.time() - start_time
 
-        if result.returncode == 0:
-            print(f"   ✅ Success ({duration:.1f}s)")
-        else:
-            print(f"   ❌ Failed ({duration:.1f}s)")
-            if result.stderr:
-                print(f"   Error: {result.stderr[:200]}")
-
-        self.report_data["steps"].append({
-            "description": description,
-            "success": result.returncode == 0,
-            "duration": duration,
-            "command": " ".join(cmd),
-        })
+        self._record_step(description, result.returncode == 0, duration, command)
+        # Streamed output has already been shown
+        if result.returncode != 0 and result.stderr:
+            print(f"   Error: {result.stderr[:200]}")
 
         if check and result.returncode != 0:
-            raise RuntimeError(f"Command failed: {description}\n{result.stderr}")
+            raise RuntimeError(f"Command failed: {description}\n{result.stderr or result.stdout}")
 
         return result
 
+    def _run_operation(self, start: Callable[[], Any], description: str, check: bool = True) -> bool:
+        """Start a Compute Engine operation, wait for it, and log the result.
+
+        Args:
+            start: Starts the operation and returns its ExtendedOperation
+            description: What the operation does, for the log and report
+            check: Raise if the operation fails
+
+        Returns:
+            True if the operation succeeded
+        """
+        print(f"\n🔵 {description}")
+
+        start_time = time.time()
+        error: Exception | None = None
+        try:
+            start().result(timeout=OPERATION_TIMEOUT)
+        except Exception as e:  # API errors and operation timeouts
+            error = e
+        duration = time.time() - start_time
+
+        self._record_step(description, error is None, duration, "Compute Engine API")
+        if error is not None:
+            print(f"   Error: {str(error)[:200]}")
+
+        if check and error is not None:
+            raise RuntimeError(f"Operation failed: {description}\n{error}") from error
+
+        return error is None
+
+    @cached_property
+    def _ssh_mux_opts(self) -> tuple[str, ...]:
+        """SSH connection-sharing options, matching the ones vmctl uses.
+
+        Every ssh/scp call in the test uses vmctl's control socket
+        directory, so after the first successful connection the rest reuse
+        its master connection (and IAP tunnel) instead of each doing a full
+        handshake. bin/vmws doesn't pass these options, which is why the
+        steps call gcloud directly. ControlPersist closes the master after
+        it has been idle, so cleanup needn't.
+        """
+        control_dir = Path.home() / ".cache" / "vmctl"
+        try:
+            control_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        except OSError:
+            return ()
+        return (
+            "-o ControlMaster=auto",
+            f"-o ControlPath={control_dir}/cm-%C",
+            f"-o ControlPersist={SSH_CONTROL_PERSIST}",
+        )
+
+    def _ssh_mux_flags(self, flag: str) -> list[str]:
+        """Connection-sharing options as gcloud pass-through arguments.
+
+        Args:
+            flag: gcloud pass-through flag (--ssh-flag, or --scp-flag for scp)
+
+        Returns:
+            One ``flag=-o Option=value`` argument per option
+        """
+        return [f"{flag}={opt}" for opt in self._ssh_mux_opts]
+
+    def _ssh_command(self, command: str) -> list[str]:
+        """Build a gcloud compute ssh command that shares the SSH connection.
+
+        Args:
+            command: Shell command to run on the VM
+
+        Returns:
+            Command list for _run_command
+        """
+        return [
+            "gcloud", "compute", "ssh",
+            self.vm_name,
+            f"--zone={self.zone}",
+            f"--project={self.project}",
+            "--tunnel-through-iap",
+            *self._ssh_mux_flags("--ssh-flag"),
+            f"--command={command}",
+        ]
+
+    @cached_property
+    def _credentials(self) -> Any:
+        """Application Default Credentials shared by all Compute Engine clients.
+
+        Resolved and refreshed once, rather than by each client separately.
+        """
+        google_auth = importlib.import_module("google.auth")
+        transport = importlib.import_module("google.auth.transport.requests")
+        credentials, _ = google_auth.default(scopes=[CLOUD_PLATFORM_SCOPE])
+        credentials.refresh(transport.Request())
+        return credentials
+
+    # Compute Engine clients, created on first use
+    @cached_property
+    def _region_disks(self) -> Any:
+        """Regional disks client (the workstation disk is regional)."""
+        return _compute_v1().RegionDisksClient(credentials=self._credentials)
+
+    @cached_property
+    def _disks(self) -> Any:
+        """Zonal disks client."""
+        return _compute_v1().DisksClient(credentials=self._credentials)
+
+    @cached_property
+    def _instances(self) -> Any:
+        """VM instances client."""
+        return _compute_v1().InstancesClient(credentials=self._credentials)
+
+    @cached_property
+    def _snapshots(self) -> Any:
+        """Snapshots client."""
+        return _compute_v1().SnapshotsClient(credentials=self._credentials)
+
+    @cached_property
+    def _images(self) -> Any:
+        """Images client."""
+        return _compute_v1().ImagesClient(credentials=self._credentials)
+
+    def _resolved_image(self, family: str = "debian-12", project: str = "debian-cloud") -> str:
+        """Resolve an image family to a specific image, once per process.
+
+        A family points at whichever image is newest, so resolving it once
+        keeps retried creates and re-runs on the same image even if a new
+        one is published mid-run.
+
+        Args:
+            family: Image family name
+            project: Project publishing the image family
+
+        Returns:
+            Self link of the image the family currently points to
+        """
+        key = (project, family)
+        if key not in _IMAGE_CACHE:
+            image = self._images.get_from_family(project=project, family=family)
+            _IMAGE_CACHE[key] = image.self_link
+        return _IMAGE_CACHE[key]
+
     def step1_create_snapshot(self) -> None:
         """Step 1: Create snapshot from workstation disk."""
         print("\n" + "="*80)
         print("STEP 1: Create Snapshot from Workstation Disk")
         print("="*80)
 
-        self._run_command(
-            [
-                "gcloud", "compute", "disks", "snapshot",
-                self.workstation_disk,
-                f"--snapshot-names={self.snapshot_name}",
-                f"--region={self.region}",
-                f"--project={self.project}",
-                f"--storage-location={self.region}",
-            ],
+        compute = _compute_v1()
+        self._run_operation(
+            lambda: self._region_disks.create_snapshot(
+                project=self.project,
+                region=self.region,
+                disk=self.workstation_disk,
+                snapshot_resource=compute.Snapshot(
+                    name=self.snapshot_name,
+                    storage_locations=[self.region],
+                ),
+            ),
             f"Creating snapshot {self.snapshot_name}",
         )
 
@@ -172,16 +616,18 @@ class VMWorkstationIntegrationTest:
         print("STEP 2: Create Disk from Snapshot")
         print("="*80)
 
-        self._run_command(
-            [
-                "gcloud", "compute", "disks", "create",
-                self.disk_name,
-                f"--source-snapshot={self.snapshot_name}",
-                f"--size={self.disk_size_gb}GB",
-                "--type=pd-standard",
-                f"--zone={self.zone}",
-                f"--project={self.project}",
-            ],
+        compute = _compute_v1()
+        self._run_operation(
+            lambda: self._disks.insert(
+                project=self.project,
+                zone=self.zone,
+                disk_resource=compute.Disk(
+                    name=self.disk_name,
+                    source_snapshot=f"projects/{self.project}/global/snapshots/{self.snapshot_name}",
+                    size_gb=self.disk_size_gb,
+                    type_=f"zones/{self.zone}/diskTypes/pd-standard",
+                ),
+            ),
             f"Creating disk {self.disk_name}",
         )
 
@@ -200,42 +646,72 @@ class VMWorkstationIntegrationTest:
         print("STEP 3: Create VM Instance")
         print("="*80)
 
-        # Get startup script path
-        scripts_dir = Path(__file__).parent.parent.parent / "scripts"
-        startup_script = scripts_dir / "vm-startup-script.sh"
+        compute = _compute_v1()
 
-        if not startup_script.exists():
-            print(f"   ⚠️  Warning: Startup script not found at {startup_script}")
-            startup_script_args = []
-        else:
-            startup_script_args = [f"--metadata-from-file=startup-script={startup_script}"]
+        startup_script = self._script_paths.get("vm-startup-script.sh")
 
-        self._run_command(
-            [
-                "gcloud", "compute", "instances", "create",
-                self.vm_name,
-                f"--machine-type={self.machine_type}",
-                f"--zone={self.zone}",
-                f"--project={self.project}",
-                "--image-family=debian-12",
-                "--image-project=debian-cloud",
-                "--boot-disk-size=50GB",
-                "--boot-disk-type=pd-standard",
-                f"--disk=name={self.disk_name},mode=rw",
-                "--scopes=cloud-platform",
-                "--metadata=enable-oslogin=TRUE",
-            ] + startup_script_args,
-            f"Creating VM {self.vm_name}",
+        metadata_items = [compute.Items(key="enable-oslogin", value="TRUE")]
+        if startup_script is None:
+            print(f"   ⚠️  Warning: Startup script not found in {self._scripts_dir}")
+        else:
+            metadata_items.append(compute.Items(key="startup-script", value=_read_script(startup_script)))
+
+        instance = compute.Instance(
+            name=self.vm_name,
+            machine_type=f"zones/{self.zone}/machineTypes/{self.machine_type}",
+            disks=[
+                compute.AttachedDisk(
+                    boot=True,
+                    auto_delete=True,
+                    initialize_params=compute.AttachedDiskInitializeParams(
+                        source_image=self._resolved_image(),
+                        disk_size_gb=50,
+                        disk_type=f"zones/{self.zone}/diskTypes/pd-standard",
+                    ),
+                ),
+                compute.AttachedDisk(
+                    source=f"projects/{self.project}/zones/{self.zone}/disks/{self.disk_name}",
+                    mode="READ_WRITE",
+                ),
+            ],
+            # Same as gcloud's default: default network with an ephemeral external IP
+            network_interfaces=[
+                compute.NetworkInterface(
+                    network="global/networks/default",
+                    access_configs=[compute.AccessConfig(name="External NAT", type_="ONE_TO_ONE_NAT")],
+                ),
+            ],
+            service_accounts=[
+                compute.ServiceAccount(
+                    email="default",
+                    scopes=[CLOUD_PLATFORM_SCOPE],
+                ),
+            ],
+            metadata=compute.Metadata(items=metadata_items),
         )
 
-        self.created_resources["vm"] = True
-        self.resource_creation_times["vm"] = datetime.now()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # Configure vmws to use this VM. It only writes local config, so
+            # it runs while Compute Engine provisions the VM.
+            configure = pool.submit(
+                self._run_command,
+                ["vmws", "config", f"--vm-name={self.vm_name}", f"--zone={self.zone}", f"--project={self.project}"],
+                "Configuring vmws",
+            )
 
-        # Configure vmws to use this VM
-        self._run_command(
-            ["vmws", "config", f"--vm-name={self.vm_name}", f"--zone={self.zone}", f"--project={self.project}"],
-            "Configuring vmws",
-        )
+            self._run_operation(
+                lambda: self._instances.insert(
+                    project=self.project,
+                    zone=self.zone,
+                    instance_resource=instance,
+                ),
+                f"Creating VM {self.vm_name}",
+            )
+
+            self.created_resources["vm"] = True
+            self.resource_creation_times["vm"] = datetime.now()
+
+            configure.result()
 
         self.report_data["resources"].append({
             "type": "VM Instance",
@@ -244,29 +720,90 @@ class VMWorkstationIntegrationTest:
             "zone": self.zone,
         })
 
-    def step4_wait_for_ssh(self, max_retries: int = 12, retry_delay: int = 10) -> None:
-        """Step 4: Wait for SSH to be ready."""
+    def _wait_for_boot(self, deadline: float, max_delay: float) -> None:
+        """Wait until the serial console shows the VM has finished booting.
+
+        Reading serial output is a single API call with no SSH handshake, so
+        SSH attempts aren't spent on a VM that is still booting. Only new
+        output is fetched on each poll. Returns without error if the serial
+        console can't be read or the deadline passes, leaving it to SSH.
+
+        Args:
+            deadline: time.monotonic() value to stop waiting at
+            max_delay: Longest delay between polls, in seconds
+        """
+        start = 0
+        tail = ""
+        delay = self.ssh_poll_interval
+        while time.monotonic() < deadline:
+            try:
+                output = self._instances.get_serial_port_output(
+                    project=self.project, zone=self.zone, instance=self.vm_name, start=start
+                )
+            except Exception as e:  # serial port access disabled, API errors
+                print(f"   Serial console unavailable, probing SSH directly: {str(e)[:100]}")
+                return
+
+            # Keep the end of the previous chunk in case the marker spans two reads
+            text = tail + output.contents
+            if BOOT_FINISHED_RE.search(text):
+                print("   ✅ Boot finished (serial console)")
+                return
+            tail = text[-64:]
+            start = output.next_
+
+            time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+            delay = min(delay * 1.5, max_delay)
+
+    def step4_wait_for_ssh(
+        self, timeout: float = 120, initial_delay: float | None = None, max_delay: float = 10
+    ) -> None:
+        """Step 4: Wait for SSH to be ready.
+
+        Waits for boot to finish on the serial console, then probes SSH.
+        Both retry quickly at first, since the VM is often nearly ready, then
+        back off (x1.5 per attempt, up to max_delay) until timeout seconds
+        have passed.
+
+        Args:
+            timeout: Total time to wait for SSH, in seconds
+            initial_delay: Delay after the first failed attempt, in seconds
+                (defaults to ssh_poll_interval)
+            max_delay: Longest delay between attempts, in seconds
+        """
         print("\n" + "="*80)
         print("STEP 4: Wait for SSH Connectivity")
         print("="*80)
 
-        for attempt in range(1, max_retries + 1):
-            print(f"\n   Attempt {attempt}/{max_retries}...")
+        deadline = time.monotonic() + timeout
+        self._wait_for_boot(deadline, max_delay)
+
+        delay = self.ssh_poll_interval if initial_delay is None else initial_delay
+        attempt = 0
+        while True:
+            attempt += 1
+            print(f"\n   Attempt {attempt}...")
             result = self._run_command(
-                ["vmws", "ssh", "echo 'SSH ready'"],
+                self._ssh_command("echo 'SSH ready'"),
                 f"Testing SSH connectivity (attempt {attempt})",
                 check=False,
+                output="discard",
             )
 
             if result.returncode == 0:
                 print("   ✅ SSH is ready!")
                 return
 
-            if attempt < max_retries:
-                print(f"   Waiting {retry_delay}s before retry...")
-                time.sleep(retry_delay)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
 
-        raise RuntimeError("SSH failed to become ready after all retries")
+            wait = min(delay, remaining)
+            print(f"   Waiting {wait:.0f}s before retry...")
+            time.sleep(wait)
+            delay = min(delay * 1.5, max_delay)
+
+        raise RuntimeError(f"SSH failed to become ready within {timeout:.0f}s")
 
     def step5_fix_permissions(self, username: str = "ben_getmensio_com") -> None:
         """Step 5: Fix file permissions on mounted disk."""
@@ -275,14 +812,14 @@ class VMWorkstationIntegrationTest:
         print("="*80)
 
         self._run_command(
-            ["vmws", "ssh", f"sudo chown -R {username}:{username} /mnt/home/user"],
+            self._ssh_command(f"sudo chown -R {username}:{username} /mnt/home/user"),
             "Fixing ownership of /mnt/home/user",
         )
 
         # Write a test file for validation
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self._run_command(
-            ["vmws", "ssh", f"echo 'VM setup completed at {timestamp}' > /mnt/home/user/vm-setup-log.md"],
+            self._ssh_command(f"echo 'VM setup completed at {timestamp}' > /mnt/home/user/vm-setup-log.md"),
             "Writing test file for validation",
         )
 
@@ -293,11 +830,10 @@ class VMWorkstationIntegrationTest:
         print("="*80)
 
         # Copy and run setup script
-        scripts_dir = Path(__file__).parent.parent.parent / "scripts"
-        setup_script = scripts_dir / "setup-vm-environment.sh"
+        setup_script = self._script_paths.get("setup-vm-environment.sh")
 
-        if not setup_script.exists():
-            print(f"   ⚠️  Warning: Setup script not found at {setup_script}")
+        if setup_script is None:
+            print(f"   ⚠️  Warning: Setup script not found in {self._scripts_dir}")
             return
 
         # Copy script to VM
@@ -309,44 +845,53 @@ class VMWorkstationIntegrationTest:
                 f"--zone={self.zone}",
                 f"--project={self.project}",
                 "--tunnel-through-iap",
+                *self._ssh_mux_flags("--scp-flag"),
             ],
             "Copying setup script to VM",
         )
 
         # Run setup script
         self._run_command(
-            ["vmws", "ssh", "bash /tmp/setup-vm-environment.sh"],
+            self._ssh_command("bash /tmp/setup-vm-environment.sh"),
             "Installing Docker, code-server, and neovim",
         )
 
     def step7_install_auto_shutdown(self) -> None:
-        """Step 7: Install auto-shutdown service."""
+        """Step 7: Install auto-shutdown service.
+
+        Runs alongside step 6, so its output is captured rather than streamed
+        to keep step 6's install log readable.
+        """
         print("\n" + "="*80)
         print("STEP 7: Install Auto-Shutdown Service")
         print("="*80)
 
-        scripts_dir = Path(__file__).parent.parent.parent / "scripts"
-
-        # Copy auto-shutdown scripts
-        for script_file in ["vm-auto-shutdown.sh", "install-auto-shutdown.sh"]:
-            script_path = scripts_dir / script_file
-            if script_path.exists():
-                self._run_command(
-                    [
-                        "gcloud", "compute", "scp",
-                        str(script_path),
-                        f"{self.vm_name}:/tmp/{script_file}",
-                        f"--zone={self.zone}",
-                        f"--project={self.project}",
-                        "--tunnel-through-iap",
-                    ],
-                    f"Copying {script_file} to VM",
-                )
+        # Copy auto-shutdown scripts in one scp call (one IAP connection)
+        script_paths = [
+            self._script_paths[name]
+            for name in ("vm-auto-shutdown.sh", "install-auto-shutdown.sh")
+            if name in self._script_paths
+        ]
+        if script_paths:
+            self._run_command(
+                [
+                    "gcloud", "compute", "scp",
+                    *[str(path) for path in script_paths],
+                    f"{self.vm_name}:/tmp/",
+                    f"--zone={self.zone}",
+                    f"--project={self.project}",
+                    "--tunnel-through-iap",
+                    *self._ssh_mux_flags("--scp-flag"),
+                ],
+                f"Copying {', '.join(path.name for path in script_paths)} to VM",
+                output="capture",
+            )
 
         # Run install script
         self._run_command(
-            ["vmws", "ssh", "bash /tmp/install-auto-shutdown.sh"],
+            self._ssh_command("bash /tmp/install-auto-shutdown.sh"),
             "Installing auto-shutdown service",
+            output="capture",
         )
 
     def step8_run_validation_tests(self) -> None:
@@ -363,22 +908,29 @@ class VMWorkstationIntegrationTest:
             ("code-server running", "systemctl is-active code-server && echo 'PASS' || echo 'FAIL'"),
         ]
 
-        for test_name, test_command in tests:
-            # Use raw gcloud ssh for clean output (vmws ssh prints connection messages)
-            result = self._run_command(
-                [
-                    "gcloud", "compute", "ssh",
-                    self.vm_name,
-                    f"--zone={self.zone}",
-                    f"--project={self.project}",
-                    "--tunnel-through-iap",
-                    "--command", test_command,
-                ],
-                f"Testing: {test_name}",
-                check=False,
-            )
+        # Run every check in one SSH session; each prints a "TEST<tab>name<tab>output"
+        # line so results can be matched back to their test afterwards
+        script = "\n".join(
+            f"r=$( ({test_command}) 2>/dev/null | tr '\\n' ' ' ); "
+            f"printf 'TEST\\t%s\\t%s\\n' {shlex.quote(test_name)} \"$r\""
+            for test_name, test_command in tests
+        )
+
+        result = self._run_command(
+            self._ssh_command(script),
+            f"Running {len(tests)} validation tests",
+            check=False,
+            output="capture",  # parsed below and printed per test
+        )
+
+        outputs: dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            fields = line.split("\t", 2)
+            if len(fields) == 3 and fields[0] == "TEST":
+                outputs[fields[1]] = fields[2].strip()
 
-            output = result.stdout.strip()
+        for test_name, _ in tests:
+            output = outputs.get(test_name, "")
             passed = "PASS" in output or (test_name == "Files accessible" and output.isdigit() and int(output) > 0)
 
             self.report_data["validation_results"].append({
@@ -390,6 +942,18 @@ class VMWorkstationIntegrationTest:
             status = "✅ PASS" if passed else "❌ FAIL"
             print(f"   {test_name}: {status} - {output}")
 
+    def _tally_validation(self) -> ValidationTally:
+        """Count validation results in one pass.
+
+        Returns:
+            Total and passed validation test counts
+        """
+        total = passed = 0
+        for v in self.report_data["validation_results"]:
+            total += 1
+            passed += v["passed"]
+        return ValidationTally(total, passed)
+
     def generate_report(self, output_path: Path) -> None:
         """Generate Markdown report."""
         print("\n" + "="*80)
@@ -398,13 +962,20 @@ class VMWorkstationIntegrationTest:
 
         end_time = datetime.now()
         duration = (end_time - self.report_data["start_time"]).total_seconds()
+        generated_at = end_time.strftime("%Y-%m-%d %H:%M:%S")
+        tally = self._tally_validation()
 
         # Calculate TRUE costs based on actual resource usage
         costs = self._calculate_actual_costs()
 
-        report = f"""# VM Workstation Integration Test Report
+        # Write sections straight to the file rather than accumulating one big
+        # string, via a temp file so an interrupted run never leaves a
+        # truncated report behind
+        tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8", buffering=64 * 1024) as f:
+            f.write(f"""# VM Workstation Integration Test Report
 
-**Generated:** {end_time.strftime('%Y-%m-%d %H:%M:%S')}
+**Generated:** {generated_at}
 **Duration:** {duration:.1f}s ({duration/60:.1f} minutes)
 **VM Name:** `{self.vm_name}`
 **Machine Type:** `{self.machine_type}`
@@ -414,8 +985,8 @@ class VMWorkstationIntegrationTest:
 
 ## Executive Summary
 
-✅ **Test Status:** {'PASSED' if all(v['passed'] for v in self.report_data['validation_results']) else 'FAILED'}
-📊 **Validation Tests:** {sum(1 for v in self.report_data['validation_results'] if v['passed'])}/{len(self.report_data['validation_results'])} passed
+✅ **Test Status:** {'PASSED' if tally.all_ok else 'FAILED'}
+📊 **Validation Tests:** {tally.passed}/{tally.total} passed
 💵 **Test Cost:** ${costs['test_cost']:.4f} (actual resources used)
 💰 **Monthly Cost (24/7):** ${costs['monthly_24x7']['total']:.2f} vs ${costs['comparison']['workstation_cost']:.2f} Cloud Workstation
 💵 **Savings:** {costs['comparison']['savings_24x7_percent']:.0f}% (${costs['comparison']['savings_24x7']:.2f}/month)
@@ -426,36 +997,40 @@ class VMWorkstationIntegrationTest:
 
 | Resource Type | Name | Location | Details |
 |--------------|------|----------|---------|
-"""
-        for resource in self.report_data["resources"]:
-            details = resource.get("size", "") or resource.get("machine_type", "")
-            report += f"| {resource['type']} | `{resource['name']}` | {resource.get('zone') or resource.get('location', '')} | {details} |\n"
+""")
+            f.writelines(
+                f"| {resource['type']} | `{resource['name']}` | {resource.get('zone') or resource.get('location', '')} "
+                f"| {resource.get('size', '') or resource.get('machine_type', '')} |\n"
+                for resource in self.report_data["resources"]
+            )
 
-        report += """
+            f.write("""
 ---
 
 ## Workflow Steps
 
 | Step | Description | Status | Duration |
 |------|-------------|--------|----------|
-"""
-        for i, step in enumerate(self.report_data["steps"], 1):
-            status = "✅" if step["success"] else "❌"
-            report += f"| {i} | {step['description']} | {status} | {step['duration']:.1f}s |\n"
+""")
+            f.writelines(
+                f"| {i} | {step['description']} | {'✅' if step['success'] else '❌'} | {step['duration']:.1f}s |\n"
+                for i, step in enumerate(self.report_data["steps"], 1)
+            )
 
-        report += """
+            f.write("""
 ---
 
 ## Validation Tests
 
 | Test | Status | Details |
 |------|--------|---------|
-"""
-        for test in self.report_data["validation_results"]:
-            status = "✅ PASS" if test["passed"] else "❌ FAIL"
-            report += f"| {test['test']} | {status} | `{test['details']}` |\n"
+""")
+            f.writelines(
+                f"| {test['test']} | {'✅ PASS' if test['passed'] else '❌ FAIL'} | `{test['details']}` |\n"
+                for test in self.report_data["validation_results"]
+            )
 
-        report += f"""
+            f.write(f"""
 ---
 
 ## Cost Analysis
@@ -545,13 +1120,13 @@ gcloud compute snapshots delete {self.snapshot_name} --quiet
 ## Summary
 
 - **Total execution time:** {duration:.1f}s ({duration/60:.1f} minutes)
-- **Report generated:** {end_time.strftime('%Y-%m-%d %H:%M:%S')}
+- **Report generated:** {generated_at}
 - **All resources created in:** {self.zone}
 
 🤖 Generated by vmws integration test
-"""
+""")
+        os.replace(tmp_path, output_path)
 
-        output_path.write_text(report)
         print(f"   📄 Report saved to: {output_path}")
 
     def _calculate_actual_costs(self) -> dict[str, Any]:
@@ -560,17 +1135,7 @@ gcloud compute snapshots delete {self.snapshot_name} --quiet
         Returns:
             Dictionary with cost breakdown and comparison
         """
-        # GCP pricing (as of 2025, subject to change - check cloud.google.com/compute/pricing)
-        # Prices are per hour
-        pricing = {
-            "e2-standard-2": 0.067,      # $0.067/hour
-            "e2-standard-4": 0.134,      # $0.134/hour
-            "n2-standard-2": 0.097,      # $0.097/hour
-            "n2-standard-4": 0.194,      # $0.194/hour
-            "pd-standard-gb": 0.04 / 730,  # $0.04/GB/month = ~$0.0000548/GB/hour
-            "pd-ssd-gb": 0.17 / 730,       # $0.17/GB/month = ~$0.0002329/GB/hour
-            "snapshot-gb": 0.026 / 730,    # $0.026/GB/month = ~$0.0000356/GB/hour
-        }
+        pricing = self.pricing
 
         # Get machine type pricing (default to e2-standard-2 if not found)
         vm_hourly_rate = pricing.get(self.machine_type, pricing["e2-standard-2"])
@@ -601,13 +1166,13 @@ gcloud compute snapshots delete {self.snapshot_name} --quiet
         total_test_cost = sum(costs.values())
 
         # Calculate monthly costs (for comparison)
-        vm_monthly = vm_hourly_rate * 730  # 730 hours/month average
-        disk_monthly = self.disk_size_gb * 0.04  # $0.04/GB/month
-        boot_disk_monthly = 50 * 0.04
+        vm_monthly = vm_hourly_rate * HOURS_PER_MONTH
+        disk_monthly = self.disk_size_gb * pricing["pd-standard-gb"] * HOURS_PER_MONTH
+        boot_disk_monthly = 50 * pricing["pd-standard-gb"] * HOURS_PER_MONTH
         total_monthly = vm_monthly + disk_monthly + boot_disk_monthly
 
         # Calculate Cloud Workstation cost (same VM + $0.20/hour always-on fee)
-        workstation_always_on_fee = 0.20 * 730  # $0.20/hour * 730 hours/month = $146/month
+        workstation_always_on_fee = WORKSTATION_HOURLY_FEE * HOURS_PER_MONTH  # $146/month
         workstation_monthly_cost = vm_monthly + disk_monthly + boot_disk_monthly + workstation_always_on_fee
 
         # Calculate savings vs Cloud Workstation
@@ -615,7 +1180,7 @@ gcloud compute snapshots delete {self.snapshot_name} --quiet
         savings_percent = (savings_monthly / workstation_monthly_cost) * 100
 
         # Calculate 8hr/day scenario (auto-shutdown)
-        vm_8hr_monthly = vm_hourly_rate * 8 * 22  # 8 hours/day, 22 working days/month
+        vm_8hr_monthly = vm_hourly_rate * WORKDAY_HOURS_PER_MONTH
         total_8hr_monthly = vm_8hr_monthly + disk_monthly + boot_disk_monthly
         savings_8hr_monthly = workstation_monthly_cost - total_8hr_monthly
         savings_8hr_percent = (savings_8hr_monthly / workstation_monthly_cost) * 100
@@ -653,49 +1218,75 @@ gcloud compute snapshots delete {self.snapshot_name} --quiet
             },
         }
 
-    def cleanup(self) -> None:
-        """Clean up all created resources."""
-        print("\n" + "="*80)
-        print("CLEANUP: Deleting Resources")
-        print("="*80)
+    def _delete_resource(self, kind: str) -> None:
+        """Delete one created resource and record when deletion was requested.
 
-        # Delete VM
-        if self.created_resources["vm"]:
-            self._run_command(
+        Billing stops once the delete is submitted, so the timestamp is taken
+        before the (blocking) delete call rather than after it returns. A
+        successful delete clears the resource from created_resources so a
+        second cleanup() doesn't try it again.
+
+        Args:
+            kind: Resource key in created_resources ("vm", "disk" or "snapshot")
+        """
+        requested_at = datetime.now()
+        if kind == "vm":
+            # The VM is deleted through the CLI under test
+            deleted = self._run_command(
                 ["vmws", "delete", "--yes"],
                 f"Deleting VM {self.vm_name}",
                 check=False,
-            )
-            self.resource_deletion_times["vm"] = datetime.now()
-
-        # Delete disk
-        if self.created_resources["disk"]:
-            self._run_command(
-                [
-                    "gcloud", "compute", "disks", "delete",
-                    self.disk_name,
-                    f"--zone={self.zone}",
-                    f"--project={self.project}",
-                    "--quiet",
-                ],
+                output="discard",
+            ).returncode == 0
+        elif kind == "disk":
+            deleted = self._run_operation(
+                lambda: self._disks.delete(project=self.project, zone=self.zone, disk=self.disk_name),
                 f"Deleting disk {self.disk_name}",
                 check=False,
             )
-            self.resource_deletion_times["disk"] = datetime.now()
-
-        # Delete snapshot
-        if self.created_resources["snapshot"]:
-            self._run_command(
-                [
-                    "gcloud", "compute", "snapshots", "delete",
-                    self.snapshot_name,
-                    f"--project={self.project}",
-                    "--quiet",
-                ],
+        else:
+            deleted = self._run_operation(
+                lambda: self._snapshots.delete(project=self.project, snapshot=self.snapshot_name),
                 f"Deleting snapshot {self.snapshot_name}",
                 check=False,
             )
-            self.resource_deletion_times["snapshot"] = datetime.now()
+        self.resource_deletion_times[kind] = requested_at
+        if deleted:
+            self.created_resources[kind] = False
+
+    def cleanup(self) -> None:
+        """Clean up all created resources.
+
+        The snapshot is deleted alongside the VM; the data disk is attached
+        to the VM, so it's deleted once the VM is gone.
+        """
+        if not any(self.created_resources.values()):
+            return
+
+        print("\n" + "="*80)
+        print("CLEANUP: Deleting Resources")
+        print("="*80)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = []
+            if self.created_resources["snapshot"]:
+                futures.append(pool.submit(self._delete_resource, "snapshot"))
+
+            if self.created_resources["vm"]:
+                pool.submit(self._delete_resource, "vm").result()
+
+            if self.created_resources["disk"]:
+                futures.append(pool.submit(self._delete_resource, "disk"))
+
+            for future in futures:
+                future.result()
+
+    def _cleanup_after_failure(self) -> None:
+        """Best-effort cleanup after a failed run, reporting its own errors."""
+        try:
+            self.cleanup()
+        except Exception as cleanup_error:
+            print(f"⚠️  Cleanup failed: {cleanup_error}")
 
     def run(self, cleanup_on_completion: bool = True) -> Path:
         """Run the complete integration test workflow.
@@ -706,16 +1297,27 @@ gcloud compute snapshots delete {self.snapshot_name} --quiet
         Returns:
             Path to generated report
         """
-        report_path = Path(f"/home/user/vm-integration-test-report-{datetime.now().strftime('%Y%m%d-%H%M%S')}.md")
+        report_path = Path(f"/home/user/vm-integration-test-report-{self._init_stamp}.md")
 
         try:
+            # Fetch a token up front so missing ADC fails before anything is created
+            _ = self._credentials
             self.step1_create_snapshot()
             self.step2_create_disk()
             self.step3_create_vm()
             self.step4_wait_for_ssh()
             self.step5_fix_permissions()
-            self.step6_install_dev_environment()
-            self.step7_install_auto_shutdown()
+
+            # Steps 6 and 7 touch separate files and only step 6 uses apt,
+            # so each runs over its own SSH session at the same time
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                installs = [
+                    pool.submit(self.step6_install_dev_environment),
+                    pool.submit(self.step7_install_auto_shutdown),
+                ]
+                for install in installs:
+                    install.result()
+
             self.step8_run_validation_tests()
 
             self.generate_report(report_path)
@@ -737,11 +1339,13 @@ gcloud compute snapshots delete {self.snapshot_name} --quiet
             print(f"\n❌ Integration test failed: {e}")
             self.generate_report(report_path)
 
-            # Cleanup on failure
-            try:
-                self.cleanup()
-            except Exception as cleanup_error:
-                print(f"⚠️  Cleanup failed: {cleanup_error}")
+            # Clean up in the background so the failure surfaces right away.
+            # Not a daemon thread: the interpreter still waits for the deletes
+            # to finish before exiting, so resources aren't left running.
+            self._cleanup_thread = threading.Thread(
+                target=self._cleanup_after_failure, name="integration-cleanup"
+            )
+            self._cleanup_thread.start()
 
             raise
 
@@ -749,28 +1353,12 @@ gcloud compute snapshots delete {self.snapshot_name} --quiet
 @pytest.mark.integration
 def test_vm_workstation_integration() -> None:
     """Integration test for VM workstation creation and validation."""
-    # Get configuration from environment
-    workstation_disk = os.getenv("VMWS_WORKSTATION_DISK")
-    if not workstation_disk:
+    config = IntegrationConfig.from_env()
+    if not config.workstation_disk:
         pytest.skip("VMWS_WORKSTATION_DISK not set")
 
-    zone = os.getenv("VMWS_ZONE", "northamerica-northeast1-b")
-    region = os.getenv("VMWS_REGION", "northamerica-northeast1")
-    project = os.getenv("VMWS_PROJECT")
-
-    # Get customizable test parameters
-    machine_type = os.getenv("VMWS_MACHINE_TYPE", "e2-standard-2")
-    disk_size_gb = int(os.getenv("VMWS_DISK_SIZE_GB", "200"))
-
     # Run integration test
-    test = VMWorkstationIntegrationTest(
-        workstation_disk=workstation_disk,
-        zone=zone,
-        region=region,
-        project=project,
-        machine_type=machine_type,
-        disk_size_gb=disk_size_gb,
-    )
+    test = VMWorkstationIntegrationTest.from_config(config)
 
     report_path = test.run(cleanup_on_completion=True)
 
@@ -778,12 +1366,12 @@ def test_vm_workstation_integration() -> None:
     assert report_path.exists(), "Report was not generated"
 
     # Verify all validation tests passed
-    all_passed = all(v["passed"] for v in test.report_data["validation_results"])
-    assert all_passed, "Some validation tests failed"
+    assert test._tally_validation().all_ok, "Some validation tests failed"
 
 
 def main() -> int:
     """Run as standalone script."""
+    defaults = IntegrationConfig.from_env()
     parser = argparse.ArgumentParser(
         description="VM Workstation Integration Test - Create, validate, and cost-compare self-managed VMs",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -800,7 +1388,7 @@ Examples:
 
 Environment variables can also be used:
   VMWS_WORKSTATION_DISK, VMWS_ZONE, VMWS_REGION, VMWS_PROJECT,
-  VMWS_MACHINE_TYPE, VMWS_DISK_SIZE_GB
+  VMWS_MACHINE_TYPE, VMWS_DISK_SIZE_GB, VMWS_SSH_POLL_INTERVAL, VMWS_QUIET
 
 Note: Cloud Workstation cost is calculated automatically based on VM specs
       (same compute + $0.20/hour always-on fee = $146/month extra).
@@ -809,32 +1397,34 @@ Note: Cloud Workstation cost is calculated automatically based on VM specs
 
     parser.add_argument(
         "--workstation-disk",
-        required=True,
+        required=not defaults.workstation_disk,
+        default=defaults.workstation_disk or None,
         help="Workstation disk to snapshot (e.g., workstations-4f92986b-...)",
     )
     parser.add_argument(
         "--zone",
-        default="northamerica-northeast1-b",
+        default=defaults.zone,
         help="GCP zone (default: northamerica-northeast1-b)",
     )
     parser.add_argument(
         "--region",
-        default="northamerica-northeast1",
+        default=defaults.region,
         help="GCP region (default: northamerica-northeast1)",
     )
     parser.add_argument(
         "--project",
+        default=defaults.project,
         help="GCP project ID (uses gcloud default if not set)",
     )
     parser.add_argument(
         "--machine-type",
-        default="e2-standard-2",
+        default=defaults.machine_type,
         help="VM machine type (default: e2-standard-2). Examples: e2-standard-4, n2-standard-2, n2-standard-4",
     )
     parser.add_argument(
         "--disk-size",
         type=int,
-        default=200,
+        default=defaults.disk_size_gb,
         help="Data disk size in GB (default: 200)",
     )
     parser.add_argument(
@@ -845,13 +1435,17 @@ Note: Cloud Workstation cost is calculated automatically based on VM specs
 
     args = parser.parse_args()
 
-    test = VMWorkstationIntegrationTest(
-        workstation_disk=args.workstation_disk,
-        zone=args.zone,
-        region=args.region,
-        project=args.project,
-        machine_type=args.machine_type,
-        disk_size_gb=args.disk_size,
+    test = VMWorkstationIntegrationTest.from_config(
+        IntegrationConfig(
+            workstation_disk=args.workstation_disk,
+            zone=args.zone,
+            region=args.region,
+            project=args.project,
+            machine_type=args.machine_type,
+            disk_size_gb=args.disk_size,
+            ssh_poll_interval=defaults.ssh_poll_interval,
+            quiet=defaults.quiet,
+        )
     )
 
     try:
@@ -7,15 +7,11 @@ from click.testing import CliRunner
 
 from vmctl.cli.main import cli
 from vmctl.config.models import VMConfig
+from vmctl.core.vm import VMInfo
 
 
-@pytest.fixture
-def runner() -> CliRunner:
-    """Create CLI test runner."""
-    return CliRunner()
-
-
-@pytest.fixture
+# Read-only, so build it once rather than per test
+@pytest.fixture(scope="session")
 def mock_config() -> VMConfig:
     """Create mock VM config."""
     return VMConfig(
@@ -121,12 +117,12 @@ class TestCLICommands:
 
         mock_vm = MagicMock()
         mock_vm_manager.return_value = mock_vm
-        mock_vm.status.return_value = "RUNNING"
+        mock_vm.info.return_value = VMInfo(status="RUNNING")
 
         result = runner.invoke(cli, ["status"])
 
         assert result.exit_code == 0
-        mock_vm.status.assert_called_once()
+        mock_vm.info.assert_called_once()
 
     @patch("vmctl.cli.commands.backup_commands.DiskManager")
     @patch("vmctl.cli.commands.backup_commands.ConfigManager")
@@ -1,95 +1,129 @@
 """Tests for CLI backup commands."""
 
+import os
+import shutil
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from unittest.mock import MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
 
 from vmctl.cli.commands.backup_commands import backup, restore, snapshots
 from vmctl.config.manager import ConfigManager
-from vmctl.config.models import VMConfig
+from vmctl.config.models import ConfigPaths, VMConfig
 from vmctl.core.exceptions import DiskError
 
 
+class _DiskStub:
+    """Stand-in for DiskManager that records calls instead of touching gcloud.
+
+    Set ``error`` to make every method raise it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no snapshots and no error."""
+        self.snapshot_name = "snapshot-test"
+        self.listing: list[dict[str, str]] = []
+        self.error: Exception | None = None
+        self.calls: list[tuple[str, str | None]] = []
+
+    def _call(self, method: str, arg: str | None = None) -> None:
+        self.calls.append((method, arg))
+        if self.error is not None:
+            raise self.error
+
+    def snapshot(self, description: str | None = None) -> str:
+        """Record a snapshot call and return ``snapshot_name``."""
+        self._call("snapshot", description)
+        return self.snapshot_name
+
+    def restore(self, snapshot_name: str) -> None:
+        """Record a restore call."""
+        self._call("restore", snapshot_name)
+
+    def list_snapshots(self) -> list[dict[str, str]]:
+        """Record a list call and return ``listing``."""
+        self._call("list_snapshots")
+        return self.listing
+
+
+@pytest.fixture(scope="session")
+def config_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the test config once, for tests to link into place."""
+    config_mgr = ConfigManager(config_dir=tmp_path_factory.mktemp("config-template"))
+    config_mgr.save(VMConfig(vm_name="test-vm", zone="us-central1-a"))
+    return config_mgr.paths.config_file
+
+
 class TestBackupCommands:
     """Test backup CLI commands."""
 
     @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create Click test runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def temp_config_dir(self, monkeypatch: pytest.MonkeyPatch) -> Path:
+    def temp_config_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, config_template: Path
+    ) -> Path:
         """Create temporary config directory with a test config."""
-        with TemporaryDirectory() as tmpdir:
-            config_dir = Path(tmpdir) / ".vmctl"
-            config_dir.mkdir(parents=True)
-            monkeypatch.setenv("HOME", tmpdir)
-
-            # Create a default config for tests
-            config_mgr = ConfigManager()
-            config_mgr.save(VMConfig(vm_name="test-vm", zone="us-central1-a"))
+        config_dir = tmp_path / ".vmctl"
+        config_dir.mkdir()
+        monkeypatch.setenv("HOME", str(tmp_path))
+        # ConfigManager replaces the file rather than writing in place, so a
+        # hard link can't leak changes back into the shared template
+        config_file = ConfigPaths(config_dir).config_file
+        try:
+            os.link(config_template, config_file)
+        except OSError:
+            shutil.copyfile(config_template, config_file)
+        return config_dir
 
-            yield config_dir
+    @pytest.fixture
+    def disk(self, monkeypatch: pytest.MonkeyPatch) -> _DiskStub:
+        """Replace DiskManager with a stub and return the instance commands get."""
+        stub = _DiskStub()
+        monkeypatch.setattr("vmctl.cli.commands.backup_commands.DiskManager", lambda config: stub)
+        return stub
 
 
 class TestBackupCommand(TestBackupCommands):
     """Test backup command."""
 
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
     def test_backup_success_no_description(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+        self, disk: _DiskStub, runner: CliRunner, temp_config_dir: Path
     ) -> None:
         """Test successful backup without description."""
-        mock_disk = MagicMock()
-        mock_disk.snapshot.return_value = "snapshot-test-vm-20240101-120000"
-        mock_disk_class.return_value = mock_disk
+        disk.snapshot_name = "snapshot-test-vm-20240101-120000"
 
         result = runner.invoke(backup)
         assert result.exit_code == 0
         assert "Snapshot created successfully" in result.output
         assert "snapshot-test-vm-20240101-120000" in result.output
-        mock_disk.snapshot.assert_called_once_with(None)
+        assert disk.calls == [("snapshot", None)]
 
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
     def test_backup_success_with_description(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+        self, disk: _DiskStub, runner: CliRunner, temp_config_dir: Path
     ) -> None:
         """Test successful backup with description."""
-        mock_disk = MagicMock()
-        mock_disk.snapshot.return_value = "snapshot-test-vm-20240101-120000"
-        mock_disk_class.return_value = mock_disk
+        disk.snapshot_name = "snapshot-test-vm-20240101-120000"
 
         result = runner.invoke(backup, ["--description", "Before major update"])
         assert result.exit_code == 0
         assert "Snapshot created successfully" in result.output
-        mock_disk.snapshot.assert_called_once_with("Before major update")
+        assert disk.calls == [("snapshot", "Before major update")]
 
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
     def test_backup_disk_error(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+        self, disk: _DiskStub, runner: CliRunner, temp_config_dir: Path
     ) -> None:
         """Test backup with DiskError."""
-        mock_disk = MagicMock()
-        mock_disk.snapshot.side_effect = DiskError("Test disk error")
-        mock_disk_class.return_value = mock_disk
+        disk.error = DiskError("Test disk error")
 
         result = runner.invoke(backup)
         assert result.exit_code == 1
         assert "Error" in result.output
         assert "Test disk error" in result.output
 
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
     def test_backup_shows_next_steps(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+        self, disk: _DiskStub, runner: CliRunner, temp_config_dir: Path
     ) -> None:
         """Test backup shows next steps in output."""
-        mock_disk = MagicMock()
-        mock_disk.snapshot.return_value = "snapshot-test"
-        mock_disk_class.return_value = mock_disk
+        disk.snapshot_name = "snapshot-test"
 
         result = runner.invoke(backup)
         assert result.exit_code == 0
@@ -100,68 +134,65 @@ class TestBackupCommand(TestBackupCommands):
 class TestRestoreCommand(TestBackupCommands):
     """Test restore command."""
 
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
     def test_restore_with_yes_flag(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+        self, disk: _DiskStub, runner: CliRunner, temp_config_dir: Path
     ) -> None:
         """Test restore with --yes flag (no confirmation)."""
-        mock_disk = MagicMock()
-        mock_disk_class.return_value = mock_disk
-
         result = runner.invoke(restore, ["snapshot-test-123", "--yes"])
         assert result.exit_code == 0
         assert "Restore completed successfully" in result.output
-        mock_disk.restore.assert_called_once_with("snapshot-test-123")
+        assert disk.calls == [("restore", "snapshot-test-123")]
 
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
     def test_restore_without_yes_confirmed(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+        self,
+        disk: _DiskStub,
+        runner: CliRunner,
+        temp_config_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test restore without --yes flag, user confirms."""
-        mock_disk = MagicMock()
-        mock_disk_class.return_value = mock_disk
+        monkeypatch.setattr(
+            "vmctl.cli.commands.backup_commands.click.confirm", lambda *a, **k: True
+        )
 
-        result = runner.invoke(restore, ["snapshot-test-123"], input="y\n")
+        result = runner.invoke(restore, ["snapshot-test-123"])
         assert result.exit_code == 0
         assert "WARNING" in result.output
         assert "Restore completed successfully" in result.output
-        mock_disk.restore.assert_called_once_with("snapshot-test-123")
+        assert disk.calls == [("restore", "snapshot-test-123")]
 
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
     def test_restore_without_yes_cancelled(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+        self,
+        disk: _DiskStub,
+        runner: CliRunner,
+        temp_config_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test restore without --yes flag, user cancels."""
-        mock_disk = MagicMock()
-        mock_disk_class.return_value = mock_disk
+        monkeypatch.setattr(
+            "vmctl.cli.commands.backup_commands.click.confirm", lambda *a, **k: False
+        )
 
-        result = runner.invoke(restore, ["snapshot-test-123"], input="n\n")
+        result = runner.invoke(restore, ["snapshot-test-123"])
         assert result.exit_code == 0
         assert "Cancelled" in result.output
-        mock_disk.restore.assert_not_called()
+        assert disk.calls == []
 
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
     def test_restore_disk_error(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+        self, disk: _DiskStub, runner: CliRunner, temp_config_dir: Path
     ) -> None:
         """Test restore with DiskError."""
-        mock_disk = MagicMock()
-        mock_disk.restore.side_effect = DiskError("Snapshot not found")
-        mock_disk_class.return_value = mock_disk
+        disk.error = DiskError("Snapshot not found")
 
         result = runner.invoke(restore, ["nonexistent-snapshot", "--yes"])
         assert result.exit_code == 1
         assert "Error" in result.output
         assert "Snapshot not found" in result.output
 
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
     def test_restore_shows_warning(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+        self, disk: _DiskStub, runner: CliRunner, temp_config_dir: Path
     ) -> None:
         """Test restore shows warning without --yes."""
-        mock_disk = MagicMock()
-        mock_disk_class.return_value = mock_disk
-
         result = runner.invoke(restore, ["snapshot-test"], input="n\n")
         assert result.exit_code == 0
         assert "WARNING" in result.output
@@ -172,100 +203,69 @@ class TestRestoreCommand(TestBackupCommands):
 class TestSnapshotsCommand(TestBackupCommands):
     """Test snapshots command."""
 
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
-    def test_snapshots_empty_list(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
-    ) -> None:
-        """Test snapshots with no snapshots available."""
-        mock_disk = MagicMock()
-        mock_disk.list_snapshots.return_value = []
-        mock_disk_class.return_value = mock_disk
-
-        result = runner.invoke(snapshots)
-        assert result.exit_code == 0
-        assert "No snapshots found" in result.output
-        assert "vmctl backup" in result.output
-
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
-    def test_snapshots_single_snapshot(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+    @pytest.mark.parametrize(
+        ("snaps", "expected"),
+        [
+            ([], ["No snapshots found", "vmctl backup"]),
+            (
+                [
+                    {
+                        "name": "snapshot-test-vm-20240101-120000",
+                        "created": "2024-01-01 12:00:00",
+                        "size_gb": "5.2",
+                    }
+                ],
+                [
+                    "Snapshots for test-vm",
+                    "snapshot-test-vm-20240101-120000",
+                    "2024-01-01 12:00:00",
+                    "5.2",
+                    "Total snapshots: 1",
+                    "vmctl restore",
+                ],
+            ),
+            (
+                [
+                    {
+                        "name": f"snapshot-test-vm-2024010{day}-120000",
+                        "created": f"2024-01-0{day} 12:00:00",
+                        "size_gb": size,
+                    }
+                    for day, size in ((1, "5.2"), (2, "6.8"), (3, "7.5"))
+                ],
+                [
+                    "snapshot-test-vm-20240101-120000",
+                    "snapshot-test-vm-20240102-120000",
+                    "snapshot-test-vm-20240103-120000",
+                    "Total snapshots: 3",
+                ],
+            ),
+        ],
+        ids=["empty", "single", "multiple"],
+    )
+    def test_snapshots_list(
+        self,
+        disk: _DiskStub,
+        runner: CliRunner,
+        temp_config_dir: Path,
+        snaps: list[dict[str, str]],
+        expected: list[str],
     ) -> None:
-        """Test snapshots with one snapshot."""
-        mock_disk = MagicMock()
-        mock_disk.list_snapshots.return_value = [
-            {
-                "name": "snapshot-test-vm-20240101-120000",
-                "created": "2024-01-01 12:00:00",
-                "size_gb": "5.2",
-            }
-        ]
-        mock_disk_class.return_value = mock_disk
+        """Test snapshots output for zero, one and several snapshots."""
+        disk.listing = snaps
 
         result = runner.invoke(snapshots)
         assert result.exit_code == 0
-        assert "Snapshots for test-vm" in result.output
-        assert "snapshot-test-vm-20240101-120000" in result.output
-        assert "2024-01-01 12:00:00" in result.output
-        assert "5.2" in result.output
-        assert "Total snapshots: 1" in result.output
+        for text in expected:
+            assert text in result.output
 
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
-    def test_snapshots_multiple_snapshots(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
-    ) -> None:
-        """Test snapshots with multiple snapshots."""
-        mock_disk = MagicMock()
-        mock_disk.list_snapshots.return_value = [
-            {
-                "name": "snapshot-test-vm-20240101-120000",
-                "created": "2024-01-01 12:00:00",
-                "size_gb": "5.2",
-            },
-            {
-                "name": "snapshot-test-vm-20240102-120000",
-                "created": "2024-01-02 12:00:00",
-                "size_gb": "6.8",
-            },
-            {
-                "name": "snapshot-test-vm-20240103-120000",
-                "created": "2024-01-03 12:00:00",
-                "size_gb": "7.5",
-            },
-        ]
-        mock_disk_class.return_value = mock_disk
-
-        result = runner.invoke(snapshots)
-        assert result.exit_code == 0
-        assert "snapshot-test-vm-20240101-120000" in result.output
-        assert "snapshot-test-vm-20240102-120000" in result.output
-        assert "snapshot-test-vm-20240103-120000" in result.output
-        assert "Total snapshots: 3" in result.output
-
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
     def test_snapshots_disk_error(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+        self, disk: _DiskStub, runner: CliRunner, temp_config_dir: Path
     ) -> None:
         """Test snapshots with DiskError."""
-        mock_disk = MagicMock()
-        mock_disk.list_snapshots.side_effect = DiskError("Cannot list snapshots")
-        mock_disk_class.return_value = mock_disk
+        disk.error = DiskError("Cannot list snapshots")
 
         result = runner.invoke(snapshots)
         assert result.exit_code == 1
         assert "Error" in result.output
         assert "Cannot list snapshots" in result.output
-
-    @patch("vmctl.cli.commands.backup_commands.DiskManager")
-    def test_snapshots_shows_restore_help(
-        self, mock_disk_class: MagicMock, runner: CliRunner, temp_config_dir: Path
-    ) -> None:
-        """Test snapshots shows restore help."""
-        mock_disk = MagicMock()
-        mock_disk.list_snapshots.return_value = [
-            {"name": "snapshot-test", "created": "2024-01-01", "size_gb": "5.0"}
-        ]
-        mock_disk_class.return_value = mock_disk
-
-        result = runner.invoke(snapshots)
-        assert result.exit_code == 0
-        assert "vmctl restore" in result.output
@@ -1,14 +1,17 @@
 """Tests for CLI Docker management commands (Gate 2)."""
 
+import os
+import shutil
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
 from vmctl.cli.commands.docker_commands import (
     _find_local_apps_dir,
+    _wait_for_container,
     deploy,
     docker_logs,
     docker_ps,
@@ -17,104 +20,127 @@ from vmctl.cli.commands.docker_commands import (
     setup,
 )
 from vmctl.config.manager import ConfigManager
-from vmctl.config.models import VMConfig
+from vmctl.config.models import ConfigPaths, VMConfig
 from vmctl.core.exceptions import VMError
 
 
+def _write_template(tmp_path_factory: pytest.TempPathFactory, config: VMConfig) -> Path:
+    """Save a config into a fresh directory and return the config file."""
+    config_mgr = ConfigManager(config_dir=tmp_path_factory.mktemp("config-template"))
+    config_mgr.save(config)
+    return config_mgr.paths.config_file
+
+
+def _install_config(home: Path, monkeypatch: pytest.MonkeyPatch, template: Path) -> Path:
+    """Point HOME at home and link a template config into ~/.vmctl.
+
+    ConfigManager replaces the file rather than writing in place, so a hard
+    link can't leak changes back into the shared template.
+    """
+    config_dir = home / ".vmctl"
+    config_dir.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    config_file = ConfigPaths(config_dir).config_file
+    try:
+        os.link(template, config_file)
+    except OSError:
+        shutil.copyfile(template, config_file)
+    return config_dir
+
+
+# The seed configs are identical for every test, so write them once
+@pytest.fixture(scope="session")
+def config_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Test config with app_dir set."""
+    return _write_template(
+        tmp_path_factory,
+        VMConfig(
+            vm_name="test-vm",
+            zone="us-central1-a",
+            project="test-project",
+            app_dir="/opt/apps/myapp",
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def config_template_no_app_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Test config without app_dir."""
+    return _write_template(
+        tmp_path_factory,
+        VMConfig(vm_name="test-vm", zone="us-central1-a", project="test-project"),
+    )
+
+
 class TestDockerCommands:
     """Base class for Docker command tests."""
 
     @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create Click test runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def temp_config_dir(self, monkeypatch: pytest.MonkeyPatch) -> Path:
+    def temp_config_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, config_template: Path
+    ) -> Path:
         """Create temporary config directory with a test config."""
-        with TemporaryDirectory() as tmpdir:
-            config_dir = Path(tmpdir) / ".vmctl"
-            config_dir.mkdir(parents=True)
-            monkeypatch.setenv("HOME", tmpdir)
-
-            # Create a default config for tests
-            config_mgr = ConfigManager()
-            config_mgr.save(
-                VMConfig(
-                    vm_name="test-vm",
-                    zone="us-central1-a",
-                    project="test-project",
-                    app_dir="/opt/apps/myapp",
-                )
-            )
-
-            yield config_dir
+        return _install_config(tmp_path, monkeypatch, config_template)
 
     @pytest.fixture
-    def temp_config_no_app_dir(self, monkeypatch: pytest.MonkeyPatch) -> Path:
+    def temp_config_no_app_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, config_template_no_app_dir: Path
+    ) -> Path:
         """Create temporary config directory without app_dir."""
-        with TemporaryDirectory() as tmpdir:
-            config_dir = Path(tmpdir) / ".vmctl"
-            config_dir.mkdir(parents=True)
-            monkeypatch.setenv("HOME", tmpdir)
+        return _install_config(tmp_path, monkeypatch, config_template_no_app_dir)
 
-            # Create config without app_dir
-            config_mgr = ConfigManager()
-            config_mgr.save(
-                VMConfig(
-                    vm_name="test-vm",
-                    zone="us-central1-a",
-                    project="test-project",
-                )
-            )
 
-            yield config_dir
+# (command, VM exists, VM status, expected output) for commands that need a running VM
+VM_STATE_CASES = [
+    pytest.param(provision, False, None, ("does not exist",), id="provision-missing"),
+    pytest.param(
+        provision, True, "TERMINATED", ("TERMINATED", "vmctl start"), id="provision-stopped"
+    ),
+    pytest.param(setup, False, None, ("does not exist",), id="setup-missing"),
+    pytest.param(setup, True, "TERMINATED", ("TERMINATED",), id="setup-stopped"),
+]
 
 
-class TestProvisionCommand(TestDockerCommands):
-    """Test provision command."""
-
-    def test_provision_no_config(
-        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test provision with no config file."""
-        with TemporaryDirectory() as tmpdir:
-            monkeypatch.setenv("HOME", tmpdir)
-            result = runner.invoke(provision)
-            assert result.exit_code == 1
-            assert "No configuration found" in result.output
+class TestVMStateChecks(TestDockerCommands):
+    """Test commands refuse to run against a missing or stopped VM."""
 
+    @pytest.mark.parametrize(("command", "exists", "status", "expected"), VM_STATE_CASES)
     @patch("vmctl.cli.commands.docker_commands.VMManager")
-    def test_provision_vm_not_exists(
-        self, mock_vm_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+    def test_vm_state_errors(
+        self,
+        mock_vm_class: MagicMock,
+        runner: CliRunner,
+        temp_config_dir: Path,
+        command: click.Command,
+        exists: bool,
+        status: str | None,
+        expected: tuple[str, ...],
     ) -> None:
-        """Test provision when VM doesn't exist."""
+        """Test the command exits with an explanation when the VM isn't usable."""
         mock_vm = MagicMock()
         mock_vm.use_direct_ssh = False
-        mock_vm.exists.return_value = False
+        mock_vm.exists.return_value = exists
+        mock_vm.status.return_value = status
         mock_vm.config.vm_name = "test-vm"
         mock_vm_class.return_value = mock_vm
 
-        result = runner.invoke(provision)
+        result = runner.invoke(command)
         assert result.exit_code == 1
-        assert "does not exist" in result.output
+        for text in expected:
+            assert text in result.output
 
-    @patch("vmctl.cli.commands.docker_commands.VMManager")
-    def test_provision_vm_not_running(
-        self, mock_vm_class: MagicMock, runner: CliRunner, temp_config_dir: Path
-    ) -> None:
-        """Test provision when VM is not running."""
-        mock_vm = MagicMock()
-        mock_vm.use_direct_ssh = False
-        mock_vm.exists.return_value = True
-        mock_vm.status.return_value = "TERMINATED"
-        mock_vm.config.vm_name = "test-vm"
-        mock_vm_class.return_value = mock_vm
 
+class TestProvisionCommand(TestDockerCommands):
+    """Test provision command."""
+
+    def test_provision_no_config(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test provision with no config file."""
+        monkeypatch.setenv("HOME", str(tmp_path))
         result = runner.invoke(provision)
         assert result.exit_code == 1
-        assert "TERMINATED" in result.output
-        assert "vmctl start" in result.output
+        assert "No configuration found" in result.output
 
     @patch("vmctl.cli.commands.docker_commands.VMManager")
     def test_provision_success(
@@ -176,14 +202,13 @@ class TestDeployCommand(TestDockerCommands):
     """Test deploy command."""
 
     def test_deploy_no_config(
-        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
     ) -> None:
         """Test deploy with no config file."""
-        with TemporaryDirectory() as tmpdir:
-            monkeypatch.setenv("HOME", tmpdir)
-            result = runner.invoke(deploy)
-            assert result.exit_code == 1
-            assert "No configuration found" in result.output
+        monkeypatch.setenv("HOME", str(tmp_path))
+        result = runner.invoke(deploy)
+        assert result.exit_code == 1
+        assert "No configuration found" in result.output
 
     @patch("vmctl.cli.commands.docker_commands.VMManager")
     def test_deploy_no_app_dir(
@@ -628,45 +653,13 @@ class TestSetupCommand(TestDockerCommands):
     """Test setup command."""
 
     def test_setup_no_config(
-        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
     ) -> None:
         """Test setup with no config file."""
-        with TemporaryDirectory() as tmpdir:
-            monkeypatch.setenv("HOME", tmpdir)
-            result = runner.invoke(setup)
-            assert result.exit_code == 1
-            assert "No configuration found" in result.output
-
-    @patch("vmctl.cli.commands.docker_commands.VMManager")
-    def test_setup_vm_not_exists(
-        self, mock_vm_class: MagicMock, runner: CliRunner, temp_config_dir: Path
-    ) -> None:
-        """Test setup when VM doesn't exist."""
-        mock_vm = MagicMock()
-        mock_vm.use_direct_ssh = False
-        mock_vm.exists.return_value = False
-        mock_vm.config.vm_name = "test-vm"
-        mock_vm_class.return_value = mock_vm
-
-        result = runner.invoke(setup)
-        assert result.exit_code == 1
-        assert "does not exist" in result.output
-
-    @patch("vmctl.cli.commands.docker_commands.VMManager")
-    def test_setup_vm_not_running(
-        self, mock_vm_class: MagicMock, runner: CliRunner, temp_config_dir: Path
-    ) -> None:
-        """Test setup when VM is not running."""
-        mock_vm = MagicMock()
-        mock_vm.use_direct_ssh = False
-        mock_vm.exists.return_value = True
-        mock_vm.status.return_value = "TERMINATED"
-        mock_vm.config.vm_name = "test-vm"
-        mock_vm_class.return_value = mock_vm
-
+        monkeypatch.setenv("HOME", str(tmp_path))
         result = runner.invoke(setup)
         assert result.exit_code == 1
-        assert "TERMINATED" in result.output
+        assert "No configuration found" in result.output
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -676,6 +669,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test setup when requested app doesn't exist locally."""
         mock_vm = MagicMock()
@@ -686,13 +680,13 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm_class.return_value = mock_vm
 
         # Create temp apps dir without the requested app
-        with TemporaryDirectory() as tmpdir:
-            apps_dir = Path(tmpdir)
-            mock_find_apps.return_value = apps_dir
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        mock_find_apps.return_value = apps_dir
 
-            result = runner.invoke(setup, ["--apps", "nonexistent-app"])
-            assert result.exit_code == 1
-            assert "not found" in result.output
+        result = runner.invoke(setup, ["--apps", "nonexistent-app"])
+        assert result.exit_code == 1
+        assert "not found" in result.output
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -702,6 +696,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test successful setup with skip-provision flag."""
         mock_vm = MagicMock()
@@ -716,17 +711,17 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm_class.return_value = mock_vm
 
         # Create temp apps dir with test app
-        with TemporaryDirectory() as tmpdir:
-            apps_dir = Path(tmpdir)
-            test_app = apps_dir / "test-app"
-            test_app.mkdir()
-            (test_app / "compose.yml").write_text("version: '3'")
-            mock_find_apps.return_value = apps_dir
-
-            result = runner.invoke(setup, ["--apps", "test-app", "--skip-provision"])
-            assert result.exit_code == 0
-            assert "Setup complete" in result.output
-            assert "Skipping Docker provisioning" in result.output
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        test_app = apps_dir / "test-app"
+        test_app.mkdir()
+        (test_app / "compose.yml").write_text("version: '3'")
+        mock_find_apps.return_value = apps_dir
+
+        result = runner.invoke(setup, ["--apps", "test-app", "--skip-provision"])
+        assert result.exit_code == 0
+        assert "Setup complete" in result.output
+        assert "Skipping Docker provisioning" in result.output
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -736,6 +731,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test setup when Docker is already installed."""
         mock_vm = MagicMock()
@@ -754,16 +750,16 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm.scp.return_value = (True, "", "")
         mock_vm_class.return_value = mock_vm
 
-        with TemporaryDirectory() as tmpdir:
-            apps_dir = Path(tmpdir)
-            test_app = apps_dir / "test-app"
-            test_app.mkdir()
-            (test_app / "compose.yml").write_text("version: '3'")
-            mock_find_apps.return_value = apps_dir
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        test_app = apps_dir / "test-app"
+        test_app.mkdir()
+        (test_app / "compose.yml").write_text("version: '3'")
+        mock_find_apps.return_value = apps_dir
 
-            result = runner.invoke(setup, ["--apps", "test-app"])
-            assert result.exit_code == 0
-            assert "Docker already installed" in result.output
+        result = runner.invoke(setup, ["--apps", "test-app"])
+        assert result.exit_code == 0
+        assert "Docker already installed" in result.output
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -773,6 +769,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test setup provisions Docker when not installed."""
         mock_vm = MagicMock()
@@ -794,16 +791,16 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm.scp.return_value = (True, "", "")
         mock_vm_class.return_value = mock_vm
 
-        with TemporaryDirectory() as tmpdir:
-            apps_dir = Path(tmpdir)
-            test_app = apps_dir / "test-app"
-            test_app.mkdir()
-            (test_app / "compose.yml").write_text("version: '3'")
-            mock_find_apps.return_value = apps_dir
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        test_app = apps_dir / "test-app"
+        test_app.mkdir()
+        (test_app / "compose.yml").write_text("version: '3'")
+        mock_find_apps.return_value = apps_dir
 
-            result = runner.invoke(setup, ["--apps", "test-app"])
-            assert result.exit_code == 0
-            assert "Docker provisioned" in result.output
+        result = runner.invoke(setup, ["--apps", "test-app"])
+        assert result.exit_code == 0
+        assert "Docker provisioned" in result.output
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -813,6 +810,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test setup creates openclaw-gateway agent directories."""
         mock_vm = MagicMock()
@@ -824,30 +822,30 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm.scp.return_value = (True, "", "")
         mock_vm_class.return_value = mock_vm
 
-        with TemporaryDirectory() as tmpdir:
-            apps_dir = Path(tmpdir)
-            test_app = apps_dir / "test-app"
-            test_app.mkdir()
-            (test_app / "compose.yml").write_text("version: '3'")
-            mock_find_apps.return_value = apps_dir
-
-            result = runner.invoke(setup, ["--apps", "test-app", "--skip-provision"])
-            assert result.exit_code == 0
-            assert "Agent directories created" in result.output
-
-            # Verify mkdir commands were called for agent directories
-            mkdir_calls = [
-                call
-                for call in mock_vm.ssh_exec.call_args_list
-                if "mkdir" in str(call) and "openclaw-gateway" in str(call)
-            ]
-            assert len(mkdir_calls) >= 1
-
-            # Verify agent.env placeholder creation is in the script
-            mkdir_script = mkdir_calls[0][0][0]
-            assert "touch" in mkdir_script
-            assert "agent.env" in mkdir_script
-            assert "chmod 600" in mkdir_script
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        test_app = apps_dir / "test-app"
+        test_app.mkdir()
+        (test_app / "compose.yml").write_text("version: '3'")
+        mock_find_apps.return_value = apps_dir
+
+        result = runner.invoke(setup, ["--apps", "test-app", "--skip-provision"])
+        assert result.exit_code == 0
+        assert "Agent directories created" in result.output
+
+        # Verify mkdir commands were called for agent directories
+        mkdir_calls = [
+            call
+            for call in mock_vm.ssh_exec.call_args_list
+            if "mkdir" in str(call) and "openclaw-gateway" in str(call)
+        ]
+        assert len(mkdir_calls) >= 1
+
+        # Verify agent.env placeholder creation is in the script
+        mkdir_script = mkdir_calls[0][0][0]
+        assert "touch" in mkdir_script
+        assert "agent.env" in mkdir_script
+        assert "chmod 600" in mkdir_script
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -857,6 +855,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test setup syncs app directory via scp."""
         mock_vm = MagicMock()
@@ -868,23 +867,23 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm.scp.return_value = (True, "", "")
         mock_vm_class.return_value = mock_vm
 
-        with TemporaryDirectory() as tmpdir:
-            apps_dir = Path(tmpdir)
-            test_app = apps_dir / "test-app"
-            test_app.mkdir()
-            (test_app / "compose.yml").write_text("version: '3'")
-            mock_find_apps.return_value = apps_dir
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        test_app = apps_dir / "test-app"
+        test_app.mkdir()
+        (test_app / "compose.yml").write_text("version: '3'")
+        mock_find_apps.return_value = apps_dir
 
-            result = runner.invoke(setup, ["--apps", "test-app", "--skip-provision"])
-            assert result.exit_code == 0
+        result = runner.invoke(setup, ["--apps", "test-app", "--skip-provision"])
+        assert result.exit_code == 0
 
-            # Verify scp was called with correct paths
-            # scp copies the app dir into the parent to avoid double-nesting
-            mock_vm.scp.assert_called()
-            scp_call = mock_vm.scp.call_args
-            assert "test-app" in scp_call[0][0]
-            assert scp_call[0][1] == "/srv/vmctl/apps"
-            assert scp_call[1]["recursive"] is True
+        # Verify scp was called with correct paths
+        # scp copies the app dir into the parent to avoid double-nesting
+        mock_vm.scp.assert_called()
+        scp_call = mock_vm.scp.call_args
+        assert "test-app" in scp_call[0][0]
+        assert scp_call[0][1] == "/srv/vmctl/apps"
+        assert scp_call[1]["recursive"] is True
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -894,6 +893,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test setup deploys app via docker compose."""
         mock_vm = MagicMock()
@@ -905,24 +905,24 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm.scp.return_value = (True, "", "")
         mock_vm_class.return_value = mock_vm
 
-        with TemporaryDirectory() as tmpdir:
-            apps_dir = Path(tmpdir)
-            test_app = apps_dir / "test-app"
-            test_app.mkdir()
-            (test_app / "compose.yml").write_text("version: '3'")
-            mock_find_apps.return_value = apps_dir
-
-            result = runner.invoke(setup, ["--apps", "test-app", "--skip-provision"])
-            assert result.exit_code == 0
-            assert "test-app deployed successfully" in result.output
-
-            # Verify docker compose was called
-            deploy_calls = [
-                call
-                for call in mock_vm.ssh_exec.call_args_list
-                if "docker compose up" in str(call)
-            ]
-            assert len(deploy_calls) >= 1
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        test_app = apps_dir / "test-app"
+        test_app.mkdir()
+        (test_app / "compose.yml").write_text("version: '3'")
+        mock_find_apps.return_value = apps_dir
+
+        result = runner.invoke(setup, ["--apps", "test-app", "--skip-provision"])
+        assert result.exit_code == 0
+        assert "test-app deployed successfully" in result.output
+
+        # Verify docker compose was called
+        deploy_calls = [
+            call
+            for call in mock_vm.ssh_exec.call_args_list
+            if "docker compose up" in str(call)
+        ]
+        assert len(deploy_calls) >= 1
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -932,6 +932,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test setup deploys multiple apps in correct order."""
         mock_vm = MagicMock()
@@ -943,25 +944,25 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm.scp.return_value = (True, "", "")
         mock_vm_class.return_value = mock_vm
 
-        with TemporaryDirectory() as tmpdir:
-            apps_dir = Path(tmpdir)
-            # Create two apps
-            for app_name in ["app1", "app2"]:
-                app = apps_dir / app_name
-                app.mkdir()
-                (app / "compose.yml").write_text("version: '3'")
-            mock_find_apps.return_value = apps_dir
-
-            result = runner.invoke(setup, ["--apps", "app1,app2", "--skip-provision"])
-            assert result.exit_code == 0
-            assert "app1 deployed successfully" in result.output
-            assert "app2 deployed successfully" in result.output
-
-            # Verify apps were synced/deployed in order
-            scp_calls = mock_vm.scp.call_args_list
-            assert len(scp_calls) == 2
-            assert "app1" in scp_calls[0][0][0]
-            assert "app2" in scp_calls[1][0][0]
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        # Create two apps
+        for app_name in ["app1", "app2"]:
+            app = apps_dir / app_name
+            app.mkdir()
+            (app / "compose.yml").write_text("version: '3'")
+        mock_find_apps.return_value = apps_dir
+
+        result = runner.invoke(setup, ["--apps", "app1,app2", "--skip-provision"])
+        assert result.exit_code == 0
+        assert "app1 deployed successfully" in result.output
+        assert "app2 deployed successfully" in result.output
+
+        # Verify apps were synced/deployed in order
+        scp_calls = mock_vm.scp.call_args_list
+        assert len(scp_calls) == 2
+        assert "app1" in scp_calls[0][0][0]
+        assert "app2" in scp_calls[1][0][0]
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -971,6 +972,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test setup fails gracefully when mkdir fails."""
         mock_vm = MagicMock()
@@ -989,16 +991,16 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm.ssh_exec.side_effect = ssh_side_effect
         mock_vm_class.return_value = mock_vm
 
-        with TemporaryDirectory() as tmpdir:
-            apps_dir = Path(tmpdir)
-            test_app = apps_dir / "test-app"
-            test_app.mkdir()
-            (test_app / "compose.yml").write_text("version: '3'")
-            mock_find_apps.return_value = apps_dir
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        test_app = apps_dir / "test-app"
+        test_app.mkdir()
+        (test_app / "compose.yml").write_text("version: '3'")
+        mock_find_apps.return_value = apps_dir
 
-            result = runner.invoke(setup, ["--apps", "test-app"])
-            assert result.exit_code == 1
-            assert "Failed to create agent directories" in result.output
+        result = runner.invoke(setup, ["--apps", "test-app"])
+        assert result.exit_code == 1
+        assert "Failed to create agent directories" in result.output
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -1008,6 +1010,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test setup fails gracefully when scp fails."""
         mock_vm = MagicMock()
@@ -1019,16 +1022,16 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm.scp.return_value = (False, "", "Connection refused")
         mock_vm_class.return_value = mock_vm
 
-        with TemporaryDirectory() as tmpdir:
-            apps_dir = Path(tmpdir)
-            test_app = apps_dir / "test-app"
-            test_app.mkdir()
-            (test_app / "compose.yml").write_text("version: '3'")
-            mock_find_apps.return_value = apps_dir
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        test_app = apps_dir / "test-app"
+        test_app.mkdir()
+        (test_app / "compose.yml").write_text("version: '3'")
+        mock_find_apps.return_value = apps_dir
 
-            result = runner.invoke(setup, ["--apps", "test-app", "--skip-provision"])
-            assert result.exit_code == 1
-            assert "Failed to sync" in result.output
+        result = runner.invoke(setup, ["--apps", "test-app", "--skip-provision"])
+        assert result.exit_code == 1
+        assert "Failed to sync" in result.output
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -1038,6 +1041,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test setup fails gracefully when deploy fails."""
         mock_vm = MagicMock()
@@ -1055,16 +1059,16 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm.ssh_exec.side_effect = ssh_side_effect
         mock_vm_class.return_value = mock_vm
 
-        with TemporaryDirectory() as tmpdir:
-            apps_dir = Path(tmpdir)
-            test_app = apps_dir / "test-app"
-            test_app.mkdir()
-            (test_app / "compose.yml").write_text("version: '3'")
-            mock_find_apps.return_value = apps_dir
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        test_app = apps_dir / "test-app"
+        test_app.mkdir()
+        (test_app / "compose.yml").write_text("version: '3'")
+        mock_find_apps.return_value = apps_dir
 
-            result = runner.invoke(setup, ["--apps", "test-app", "--skip-provision"])
-            assert result.exit_code == 1
-            assert "Failed to deploy" in result.output
+        result = runner.invoke(setup, ["--apps", "test-app", "--skip-provision"])
+        assert result.exit_code == 1
+        assert "Failed to deploy" in result.output
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -1074,6 +1078,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test setup with --gateway-repo option syncs the repo before deploying."""
         mock_vm = MagicMock()
@@ -1085,26 +1090,24 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm.scp.return_value = (True, "", "")
         mock_vm_class.return_value = mock_vm
 
-        with TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-            apps_dir = tmppath / "apps"
-            apps_dir.mkdir()
-            openclaw_gateway = apps_dir / "openclaw-gateway"
-            openclaw_gateway.mkdir()
-            (openclaw_gateway / "compose.yml").write_text("version: '3'")
-            mock_find_apps.return_value = apps_dir
-
-            # Create a fake gateway repo
-            gateway_repo = tmppath / "openclaw-gateway"
-            gateway_repo.mkdir()
-            (gateway_repo / "Dockerfile").write_text("FROM node:20")
-
-            result = runner.invoke(
-                setup,
-                ["--apps", "openclaw-gateway", "--skip-provision", "--gateway-repo", str(gateway_repo)],
-            )
-            assert result.exit_code == 0
-            assert "openclaw-gateway repo synced" in result.output
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        openclaw_gateway = apps_dir / "openclaw-gateway"
+        openclaw_gateway.mkdir()
+        (openclaw_gateway / "compose.yml").write_text("version: '3'")
+        mock_find_apps.return_value = apps_dir
+
+        # Create a fake gateway repo
+        gateway_repo = tmp_path / "openclaw-gateway"
+        gateway_repo.mkdir()
+        (gateway_repo / "Dockerfile").write_text("FROM node:20")
+
+        result = runner.invoke(
+            setup,
+            ["--apps", "openclaw-gateway", "--skip-provision", "--gateway-repo", str(gateway_repo)],
+        )
+        assert result.exit_code == 0
+        assert "openclaw-gateway repo synced" in result.output
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -1114,6 +1117,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test setup fails when --gateway-repo points to non-existent path."""
         mock_vm = MagicMock()
@@ -1125,22 +1129,22 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm.scp.return_value = (True, "", "")
         mock_vm_class.return_value = mock_vm
 
-        with TemporaryDirectory() as tmpdir:
-            apps_dir = Path(tmpdir)
-            openclaw_gateway = apps_dir / "openclaw-gateway"
-            openclaw_gateway.mkdir()
-            (openclaw_gateway / "compose.yml").write_text("version: '3'")
-            mock_find_apps.return_value = apps_dir
-
-            # Explicitly point to a non-existent path - click should reject this
-            nonexistent_repo = "/tmp/definitely-does-not-exist-openclaw-gateway-xyz123"
-            result = runner.invoke(
-                setup,
-                ["--apps", "openclaw-gateway", "--skip-provision", "--gateway-repo", nonexistent_repo],
-            )
-            # Click validates exists=True and should fail
-            assert result.exit_code != 0
-            assert "does not exist" in result.output.lower() or "invalid" in result.output.lower()
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        openclaw_gateway = apps_dir / "openclaw-gateway"
+        openclaw_gateway.mkdir()
+        (openclaw_gateway / "compose.yml").write_text("version: '3'")
+        mock_find_apps.return_value = apps_dir
+
+        # Explicitly point to a non-existent path - click should reject this
+        nonexistent_repo = "/tmp/definitely-does-not-exist-openclaw-gateway-xyz123"
+        result = runner.invoke(
+            setup,
+            ["--apps", "openclaw-gateway", "--skip-provision", "--gateway-repo", nonexistent_repo],
+        )
+        # Click validates exists=True and should fail
+        assert result.exit_code != 0
+        assert "does not exist" in result.output.lower() or "invalid" in result.output.lower()
 
     @patch("vmctl.cli.commands.docker_commands._find_local_apps_dir")
     @patch("vmctl.cli.commands.docker_commands.VMManager")
@@ -1150,6 +1154,7 @@ class TestSetupCommand(TestDockerCommands):
         mock_find_apps: MagicMock,
         runner: CliRunner,
         temp_config_dir: Path,
+        tmp_path: Path,
     ) -> None:
         """Test setup checks and warns about empty agent.env."""
         mock_vm = MagicMock()
@@ -1167,26 +1172,24 @@ class TestSetupCommand(TestDockerCommands):
         mock_vm.scp.return_value = (True, "", "")
         mock_vm_class.return_value = mock_vm
 
-        with TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-            apps_dir = tmppath / "apps"
-            apps_dir.mkdir()
-            openclaw_gateway = apps_dir / "openclaw-gateway"
-            openclaw_gateway.mkdir()
-            (openclaw_gateway / "compose.yml").write_text("version: '3'")
-            mock_find_apps.return_value = apps_dir
-
-            # Create fake gateway repo to avoid warning about missing repo
-            gateway_repo = tmppath / "openclaw-gateway"
-            gateway_repo.mkdir()
-            (gateway_repo / "Dockerfile").write_text("FROM node:20")
-
-            result = runner.invoke(
-                setup,
-                ["--apps", "openclaw-gateway", "--skip-provision", "--gateway-repo", str(gateway_repo)],
-            )
-            assert result.exit_code == 0
-            assert "agent.env is empty" in result.output
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        openclaw_gateway = apps_dir / "openclaw-gateway"
+        openclaw_gateway.mkdir()
+        (openclaw_gateway / "compose.yml").write_text("version: '3'")
+        mock_find_apps.return_value = apps_dir
+
+        # Create fake gateway repo to avoid warning about missing repo
+        gateway_repo = tmp_path / "openclaw-gateway"
+        gateway_repo.mkdir()
+        (gateway_repo / "Dockerfile").write_text("FROM node:20")
+
+        result = runner.invoke(
+            setup,
+            ["--apps", "openclaw-gateway", "--skip-provision", "--gateway-repo", str(gateway_repo)],
+        )
+        assert result.exit_code == 0
+        assert "agent.env is empty" in result.output
 
 
 class TestSyncGatewayRepo:
@@ -1196,6 +1199,7 @@ class TestSyncGatewayRepo:
     def test_sync_gateway_repo_success(
         self,
         mock_vm_class: MagicMock,
+        tmp_path: Path,
     ) -> None:
         """Test successful gateway repo sync."""
         from vmctl.cli.commands.docker_commands import _sync_gateway_repo
@@ -1204,18 +1208,18 @@ class TestSyncGatewayRepo:
         mock_vm.ssh_exec.return_value = (True, "", "")
         mock_vm.scp.return_value = (True, "", "")
 
-        with TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
-            (repo_path / "Dockerfile").write_text("FROM node:20")
+        repo_path = tmp_path
+        (repo_path / "Dockerfile").write_text("FROM node:20")
 
-            result = _sync_gateway_repo(mock_vm, repo_path)
-            assert result is True
-            mock_vm.scp.assert_called_once()
+        result = _sync_gateway_repo(mock_vm, repo_path)
+        assert result is True
+        mock_vm.scp.assert_called_once()
 
     @patch("vmctl.cli.commands.docker_commands.VMManager")
     def test_sync_gateway_repo_failure(
         self,
         mock_vm_class: MagicMock,
+        tmp_path: Path,
     ) -> None:
         """Test gateway repo sync handles scp failure."""
         from vmctl.cli.commands.docker_commands import _sync_gateway_repo
@@ -1224,11 +1228,10 @@ class TestSyncGatewayRepo:
         mock_vm.ssh_exec.return_value = (True, "", "")
         mock_vm.scp.return_value = (False, "", "Connection refused")
 
-        with TemporaryDirectory() as tmpdir:
-            repo_path = Path(tmpdir)
+        repo_path = tmp_path
 
-            result = _sync_gateway_repo(mock_vm, repo_path)
-            assert result is False
+        result = _sync_gateway_repo(mock_vm, repo_path)
+        assert result is False
 
 
 class TestCheckAgentSecrets:
@@ -1267,6 +1270,35 @@ class TestCheckAgentSecrets:
         # The warning should be printed
 
 
+class TestWaitForContainer:
+    """Test _wait_for_container helper function."""
+
+    @patch("vmctl.cli.commands.docker_commands.time.sleep")
+    @patch("vmctl.cli.commands.docker_commands.run_command")
+    def test_returns_once_container_running(
+        self, mock_run: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Test polling stops as soon as the container is listed."""
+        mock_run.side_effect = [(0, "CONTAINER ID   NAMES\n", ""), (0, "abc   vmctl\n", "")]
+
+        assert _wait_for_container("vmctl") is True
+        assert mock_run.call_count == 2
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.25, 0.5]
+
+    @patch("vmctl.cli.commands.docker_commands.time.monotonic")
+    @patch("vmctl.cli.commands.docker_commands.time.sleep")
+    @patch("vmctl.cli.commands.docker_commands.run_command")
+    def test_backs_off_until_timeout(
+        self, mock_run: MagicMock, mock_sleep: MagicMock, mock_monotonic: MagicMock
+    ) -> None:
+        """Test the interval doubles up to its cap and gives up at the deadline."""
+        mock_run.return_value = (0, "CONTAINER ID   NAMES\n", "")
+        mock_monotonic.side_effect = [0.0, 1.0, 2.0, 4.0, 6.0, 8.0, 10.0]
+
+        assert _wait_for_container("vmctl") is False
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.25, 0.5, 1.0, 2.0, 2.0, 2.0]
+
+
 class TestFindLocalAppsDir:
     """Test _find_local_apps_dir helper function."""
 
@@ -1,6 +1,9 @@
 """Tests for main CLI entry point."""
 
-import pytest
+import subprocess
+import sys
+
+import click
 from click.testing import CliRunner
 
 from vmctl import __version__
@@ -10,11 +13,6 @@ from vmctl.cli.main import cli
 class TestCLIMain:
     """Test main CLI entry point."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create Click test runner."""
-        return CliRunner()
-
     def test_cli_help(self, runner: CliRunner) -> None:
         """Test CLI help message."""
         result = runner.invoke(cli, ["--help"])
@@ -111,3 +109,19 @@ class TestCLIMain:
         result = runner.invoke(cli, ["--help"])
         assert result.exit_code == 0
         # Context should be created without errors
+
+    def test_logs_resolves_to_docker_logs(self) -> None:
+        """Test the lazily registered 'logs' command is the compose logs command."""
+        from vmctl.cli.commands.docker_commands import docker_logs
+
+        ctx = click.Context(cli)
+        assert cli.get_command(ctx, "logs") is docker_logs
+
+    def test_import_does_not_load_command_modules(self) -> None:
+        """Test importing the CLI entry point defers command module imports."""
+        code = (
+            "import sys, vmctl.cli.main; "
+            "sys.exit('vmctl.cli.commands.vm_commands' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+        assert result.returncode == 0
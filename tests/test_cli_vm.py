@@ -1,7 +1,7 @@
 """Tests for CLI VM commands."""
 
+from collections.abc import Callable
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -21,30 +21,25 @@ from vmctl.cli.commands.vm_commands import (
 )
 from vmctl.config.manager import ConfigManager
 from vmctl.config.models import VMConfig
-from vmctl.core.exceptions import VMError
+from vmctl.core.exceptions import TunnelError, VMError
+from vmctl.core.vm import VMInfo
 
 
 class TestVMCommands:
     """Test VM CLI commands."""
 
     @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create Click test runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def temp_config_dir(self, monkeypatch: pytest.MonkeyPatch) -> Path:
+    def temp_config_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
         """Create temporary config directory with a test config."""
-        with TemporaryDirectory() as tmpdir:
-            config_dir = Path(tmpdir) / ".vmctl"
-            config_dir.mkdir(parents=True)
-            monkeypatch.setenv("HOME", tmpdir)
+        config_dir = tmp_path / ".vmctl"
+        config_dir.mkdir()
+        monkeypatch.setenv("HOME", str(tmp_path))
 
-            # Create a default config for tests
-            config_mgr = ConfigManager()
-            config_mgr.save(VMConfig(vm_name="test-vm", zone="us-central1-a"))
+        # Create a default config for tests
+        config_mgr = ConfigManager()
+        config_mgr.save(VMConfig(vm_name="test-vm", zone="us-central1-a"))
 
-            yield config_dir
+        return config_dir
 
 
 class TestCreateCommand(TestVMCommands):
@@ -72,13 +67,14 @@ class TestInitFreshCommand(TestVMCommands):
 class TestStartCommand(TestVMCommands):
     """Test start command."""
 
-    def test_start_no_config(self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_start_no_config(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
         """Test start with no config file."""
-        with TemporaryDirectory() as tmpdir:
-            monkeypatch.setenv("HOME", tmpdir)
-            result = runner.invoke(start)
-            assert result.exit_code == 1
-            assert "No configuration found" in result.output
+        monkeypatch.setenv("HOME", str(tmp_path))
+        result = runner.invoke(start)
+        assert result.exit_code == 1
+        assert "No configuration found" in result.output
 
     @patch("vmctl.cli.commands.vm_commands.VMManager")
     def test_start_vm_not_exists(
@@ -198,13 +194,14 @@ class TestStopCommand(TestVMCommands):
 class TestStatusCommand(TestVMCommands):
     """Test status command."""
 
-    def test_status_no_config(self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_status_no_config(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
         """Test status with no config file."""
-        with TemporaryDirectory() as tmpdir:
-            monkeypatch.setenv("HOME", tmpdir)
-            result = runner.invoke(status)
-            assert result.exit_code == 0
-            assert "No configuration found" in result.output
+        monkeypatch.setenv("HOME", str(tmp_path))
+        result = runner.invoke(status)
+        assert result.exit_code == 0
+        assert "No configuration found" in result.output
 
     @patch("vmctl.cli.commands.vm_commands.VMManager")
     def test_status_vm_not_exists(
@@ -226,7 +223,7 @@ class TestStatusCommand(TestVMCommands):
         """Test status when VM is running."""
         mock_vm = MagicMock()
         mock_vm.exists.return_value = True
-        mock_vm.status.return_value = "RUNNING"
+        mock_vm.info.return_value = VMInfo(status="RUNNING")
         mock_vm_class.return_value = mock_vm
 
         result = runner.invoke(status)
@@ -235,6 +232,28 @@ class TestStatusCommand(TestVMCommands):
         assert "vmctl tunnel" in result.output
         assert "vmctl ssh" in result.output
 
+    @patch("vmctl.cli.commands.vm_commands.VMManager")
+    def test_status_running_shows_addresses(
+        self, mock_vm_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+    ) -> None:
+        """Test status shows machine type and IPs from the describe call."""
+        mock_vm = MagicMock()
+        mock_vm.exists.return_value = True
+        mock_vm.info.return_value = VMInfo(
+            status="RUNNING",
+            zone="us-central1-a",
+            machine_type="e2-standard-4",
+            internal_ip="10.128.0.2",
+            external_ip="34.1.2.3",
+        )
+        mock_vm_class.return_value = mock_vm
+
+        result = runner.invoke(status)
+        assert result.exit_code == 0
+        assert "e2-standard-4 in us-central1-a" in result.output
+        assert "10.128.0.2" in result.output
+        assert "34.1.2.3" in result.output
+
     @patch("vmctl.cli.commands.vm_commands.VMManager")
     def test_status_stopped(
         self, mock_vm_class: MagicMock, runner: CliRunner, temp_config_dir: Path
@@ -242,7 +261,7 @@ class TestStatusCommand(TestVMCommands):
         """Test status when VM is stopped."""
         mock_vm = MagicMock()
         mock_vm.exists.return_value = True
-        mock_vm.status.return_value = "TERMINATED"
+        mock_vm.info.return_value = VMInfo(status="TERMINATED")
         mock_vm_class.return_value = mock_vm
 
         result = runner.invoke(status)
@@ -256,7 +275,7 @@ class TestStatusCommand(TestVMCommands):
         """Test status with other VM states."""
         mock_vm = MagicMock()
         mock_vm.exists.return_value = True
-        mock_vm.status.return_value = "STAGING"
+        mock_vm.info.return_value = VMInfo(status="STAGING")
         mock_vm_class.return_value = mock_vm
 
         result = runner.invoke(status)
@@ -368,6 +387,23 @@ class TestConnectCommand(TestVMCommands):
         assert result.exit_code == 0
         mock_vm.ssh.assert_called_once()
 
+    @patch("vmctl.cli.commands.vm_commands.VMManager")
+    @patch("vmctl.cli.commands.vm_commands.ConfigManager")
+    def test_connect_loads_config_once(
+        self, mock_config_class: MagicMock, mock_vm_class: MagicMock, runner: CliRunner
+    ) -> None:
+        """Test connect shares the loaded config with the delegated ssh command."""
+        mock_config_class.return_value.load.return_value = VMConfig(vm_name="test-vm")
+        mock_vm = MagicMock()
+        mock_vm.exists.return_value = True
+        mock_vm.status.return_value = "RUNNING"
+        mock_vm_class.return_value = mock_vm
+
+        result = runner.invoke(connect)
+        assert result.exit_code == 0
+        mock_config_class.assert_called_once()
+        mock_config_class.return_value.load.assert_called_once()
+
 
 class TestTunnelCommand(TestVMCommands):
     """Test tunnel command."""
@@ -385,6 +421,8 @@ class TestTunnelCommand(TestVMCommands):
         mock_vm = MagicMock()
         mock_vm.exists.return_value = False
         mock_vm_class.return_value = mock_vm
+        mock_tunnel_class.return_value.running_pid.return_value = None
+        mock_tunnel_class.return_value.check_tunnel.return_value = False
 
         result = runner.invoke(tunnel)
         assert result.exit_code == 1
@@ -404,6 +442,8 @@ class TestTunnelCommand(TestVMCommands):
         mock_vm.exists.return_value = True
         mock_vm.status.return_value = "TERMINATED"
         mock_vm_class.return_value = mock_vm
+        mock_tunnel_class.return_value.running_pid.return_value = None
+        mock_tunnel_class.return_value.check_tunnel.return_value = False
 
         result = runner.invoke(tunnel)
         assert result.exit_code == 1
@@ -425,6 +465,8 @@ class TestTunnelCommand(TestVMCommands):
         mock_vm_class.return_value = mock_vm
 
         mock_tunnel = MagicMock()
+        mock_tunnel.running_pid.return_value = None
+        mock_tunnel.check_tunnel.return_value = False
         mock_tunnel_class.return_value = mock_tunnel
 
         result = runner.invoke(tunnel)
@@ -451,6 +493,8 @@ class TestTunnelCommand(TestVMCommands):
         mock_vm_class.return_value = mock_vm
 
         mock_tunnel = MagicMock()
+        mock_tunnel.running_pid.return_value = None
+        mock_tunnel.check_tunnel.return_value = False
         mock_tunnel_class.return_value = mock_tunnel
 
         result = runner.invoke(tunnel, ["--port", "9090"])
@@ -474,6 +518,8 @@ class TestTunnelCommand(TestVMCommands):
         mock_vm_class.return_value = mock_vm
 
         mock_tunnel = MagicMock()
+        mock_tunnel.running_pid.return_value = None
+        mock_tunnel.check_tunnel.return_value = False
         mock_tunnel.start.side_effect = KeyboardInterrupt()
         mock_tunnel_class.return_value = mock_tunnel
 
@@ -481,6 +527,130 @@ class TestTunnelCommand(TestVMCommands):
         assert result.exit_code == 0
         assert "Tunnel stopped" in result.output
 
+    @patch("vmctl.cli.commands.vm_commands.TunnelManager")
+    @patch("vmctl.cli.commands.vm_commands.VMManager")
+    def test_tunnel_reuses_existing(
+        self,
+        mock_vm_class: MagicMock,
+        mock_tunnel_class: MagicMock,
+        runner: CliRunner,
+        temp_config_dir: Path,
+    ) -> None:
+        """Test tunnel exits early when our background tunnel is already up."""
+        mock_tunnel = MagicMock()
+        mock_tunnel.running_pid.return_value = 12345
+        mock_tunnel_class.return_value = mock_tunnel
+
+        result = runner.invoke(tunnel)
+        assert result.exit_code == 0
+        assert "already up on localhost:8080 (PID: 12345)" in result.output
+        mock_vm_class.assert_not_called()
+        mock_tunnel.start.assert_not_called()
+
+    @patch("vmctl.cli.commands.vm_commands.TunnelManager")
+    @patch("vmctl.cli.commands.vm_commands.VMManager")
+    def test_tunnel_port_taken_by_other_process(
+        self,
+        mock_vm_class: MagicMock,
+        mock_tunnel_class: MagicMock,
+        runner: CliRunner,
+        temp_config_dir: Path,
+    ) -> None:
+        """Test tunnel refuses a port something other than our tunnel listens on."""
+        mock_tunnel = MagicMock()
+        mock_tunnel.running_pid.return_value = None
+        mock_tunnel.check_tunnel.return_value = True
+        mock_tunnel_class.return_value = mock_tunnel
+
+        result = runner.invoke(tunnel)
+        assert result.exit_code == 1
+        assert "already in use by another process" in result.output
+        mock_vm_class.assert_not_called()
+        mock_tunnel.start.assert_not_called()
+
+    @patch("vmctl.cli.commands.vm_commands.TunnelManager")
+    def test_tunnel_stop(
+        self, mock_tunnel_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+    ) -> None:
+        """Test --stop stops the background tunnel for the port."""
+        result = runner.invoke(tunnel, ["--stop", "--port", "9090"])
+        assert result.exit_code == 0
+        assert mock_tunnel_class.call_args[1]["local_port"] == 9090
+        mock_tunnel_class.return_value.stop.assert_called_once_with()
+        mock_tunnel_class.return_value.start.assert_not_called()
+
+    @patch("vmctl.cli.commands.vm_commands.TunnelManager")
+    def test_tunnel_stop_nothing_running(
+        self, mock_tunnel_class: MagicMock, runner: CliRunner, temp_config_dir: Path
+    ) -> None:
+        """Test --stop reports when there is no background tunnel."""
+        mock_tunnel_class.return_value.stop.side_effect = TunnelError(
+            "No background tunnel process running"
+        )
+
+        result = runner.invoke(tunnel, ["--stop"])
+        assert result.exit_code == 1
+        assert "No background tunnel process running" in result.output
+
+    @patch("vmctl.cli.commands.vm_commands.TunnelManager")
+    @patch("vmctl.cli.commands.vm_commands.VMManager")
+    def test_tunnel_background(
+        self,
+        mock_vm_class: MagicMock,
+        mock_tunnel_class: MagicMock,
+        runner: CliRunner,
+        temp_config_dir: Path,
+    ) -> None:
+        """Test --background starts a detached tunnel."""
+        mock_vm = MagicMock()
+        mock_vm.exists.return_value = True
+        mock_vm.status.return_value = "RUNNING"
+        mock_vm_class.return_value = mock_vm
+
+        mock_tunnel = MagicMock()
+        mock_tunnel.running_pid.return_value = None
+        mock_tunnel.check_tunnel.return_value = False
+        mock_tunnel_class.return_value = mock_tunnel
+
+        result = runner.invoke(tunnel, ["--background"])
+        assert result.exit_code == 0
+        mock_tunnel.start.assert_called_once_with(background=True)
+
+    @patch("vmctl.cli.commands.vm_commands.TunnelManager")
+    @patch("vmctl.cli.commands.vm_commands.VMManager")
+    def test_tunnel_error(
+        self,
+        mock_vm_class: MagicMock,
+        mock_tunnel_class: MagicMock,
+        runner: CliRunner,
+        temp_config_dir: Path,
+    ) -> None:
+        """Test tunnel startup failures are reported without a traceback."""
+        mock_vm = MagicMock()
+        mock_vm.exists.return_value = True
+        mock_vm.status.return_value = "RUNNING"
+        mock_vm_class.return_value = mock_vm
+
+        mock_tunnel = MagicMock()
+        mock_tunnel.running_pid.return_value = None
+        mock_tunnel.check_tunnel.return_value = False
+        mock_tunnel.start.side_effect = TunnelError("Tunnel did not open localhost:8080")
+        mock_tunnel_class.return_value = mock_tunnel
+
+        result = runner.invoke(tunnel, ["--background"])
+        assert result.exit_code == 1
+        assert "Tunnel did not open" in result.output
+
+
+def _fake_stream(*lines: str) -> Callable[[Callable[[str], None], str], None]:
+    """Build a stream_logs side effect that feeds the given lines to on_line."""
+
+    def stream(on_line: Callable[[str], None], _log_file: str) -> None:
+        for line in lines:
+            on_line(line)
+
+    return stream
+
 
 class TestLogsCommand(TestVMCommands):
     """Test logs command."""
@@ -505,13 +675,14 @@ class TestLogsCommand(TestVMCommands):
         """Test successful logs with default file."""
         mock_vm = MagicMock()
         mock_vm.exists.return_value = True
-        mock_vm.logs.return_value = "Test log content\nLine 2"
+        mock_vm.stream_logs.side_effect = _fake_stream("Test log content", "Line 2")
         mock_vm_class.return_value = mock_vm
 
         result = runner.invoke(logs)
         assert result.exit_code == 0
         assert "Test log content" in result.output
-        mock_vm.logs.assert_called_once_with("/var/log/vm-auto-shutdown.log")
+        mock_vm.stream_logs.assert_called_once()
+        assert mock_vm.stream_logs.call_args[0][1] == "/var/log/vm-auto-shutdown.log"
 
     @patch("vmctl.cli.commands.vm_commands.VMManager")
     def test_logs_success_custom_file(
@@ -520,13 +691,14 @@ class TestLogsCommand(TestVMCommands):
         """Test successful logs with custom file."""
         mock_vm = MagicMock()
         mock_vm.exists.return_value = True
-        mock_vm.logs.return_value = "Custom log content"
+        mock_vm.stream_logs.side_effect = _fake_stream("Custom log content")
         mock_vm_class.return_value = mock_vm
 
         result = runner.invoke(logs, ["--file", "/var/log/custom.log"])
         assert result.exit_code == 0
         assert "Custom log content" in result.output
-        mock_vm.logs.assert_called_once_with("/var/log/custom.log")
+        mock_vm.stream_logs.assert_called_once()
+        assert mock_vm.stream_logs.call_args[0][1] == "/var/log/custom.log"
 
     @patch("vmctl.cli.commands.vm_commands.VMManager")
     def test_logs_vm_error(
@@ -1,12 +1,14 @@
 """Tests for configuration management."""
 
+import pickle
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import pytest
 
-from vmctl.config.manager import ConfigManager
+from vmctl.config.manager import _CACHE_HEADER, _CONFIG_CACHE, ConfigManager
 from vmctl.config.models import VMConfig
+from vmctl.core.exceptions import ConfigNotFound
 
 
 class TestVMConfig:
@@ -103,6 +105,49 @@ REGION="us-west2"
         assert config.workstation_disk is None
         assert config.region == "us-west2"
 
+    def test_from_bash_format_quoting_and_comments(self) -> None:
+        """Test parsing single-quoted, unquoted, and commented lines."""
+        bash_content = '''
+# VM_NAME="commented-out"
+VM_NAME='quoted-vm'
+ZONE=us-east1-b
+  PROJECT = "spaced-project"
+UNKNOWN_KEY="ignored"
+'''
+        config = VMConfig.from_bash_format(bash_content)
+
+        assert config.vm_name == "quoted-vm"
+        assert config.zone == "us-east1-b"
+        assert config.project == "spaced-project"
+
+    def test_from_bash_format_inline_comments_and_spaces(self) -> None:
+        """Test trailing comments are dropped and unquoted values keep spaces."""
+        bash_content = '''
+VM_NAME="commented-vm"  # the main box
+ZONE=us-east1-b # default zone
+PROJECT=project with spaces
+'''
+        config = VMConfig.from_bash_format(bash_content)
+
+        assert config.vm_name == "commented-vm"
+        assert config.zone == "us-east1-b"
+        assert config.project == "project with spaces"
+
+    def test_from_bash_format_repeated_key(self) -> None:
+        """Test the last assignment wins, including an empty one."""
+        bash_content = '''
+VM_NAME="first-vm"
+VM_NAME="second-vm"
+ZONE="us-east1-b"
+PROJECT="my-project"
+REGION="us-east1"
+REGION=""
+'''
+        config = VMConfig.from_bash_format(bash_content)
+
+        assert config.vm_name == "second-vm"
+        assert config.region is None
+
     def test_bash_roundtrip(self) -> None:
         """Test bash format roundtrip conversion."""
         original = VMConfig(
@@ -225,74 +270,272 @@ PROJECT="my-project"
 class TestConfigManager:
     """Test ConfigManager."""
 
-    def test_load_nonexistent_creates_default(self) -> None:
+    def test_load_nonexistent_creates_default(self, tmp_path: Path) -> None:
         """Test loading config when file doesn't exist creates default."""
-        with TemporaryDirectory() as tmpdir:
-            manager = ConfigManager(config_dir=Path(tmpdir))
+        manager = ConfigManager(config_dir=tmp_path)
+        config = manager.load()
+
+        assert config.vm_name == "dev-workstation"
+        assert config.zone == "us-central1-a"
+
+    def test_default_project_from_env(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test default project comes from the environment without calling gcloud."""
+        monkeypatch.setenv("CLOUDSDK_CORE_PROJECT", "env-project")
+        manager = ConfigManager(config_dir=tmp_path)
+
+        with patch("vmctl.config.manager.subprocess.run") as mock_run:
+            config = manager.load()
+
+        assert config.project == "env-project"
+        mock_run.assert_not_called()
+
+    def test_default_project_from_gcloud_config_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test default project is read from gcloud's config file without calling gcloud."""
+        monkeypatch.delenv("CLOUDSDK_CORE_PROJECT", raising=False)
+        monkeypatch.delenv("GOOGLE_CLOUD_PROJECT", raising=False)
+        monkeypatch.delenv("CLOUDSDK_ACTIVE_CONFIG_NAME", raising=False)
+        gcloud_dir = tmp_path / "gcloud"
+        (gcloud_dir / "configurations").mkdir(parents=True)
+        (gcloud_dir / "active_config").write_text("work")
+        (gcloud_dir / "configurations" / "config_work").write_text(
+            "[core]\nproject = file-project\n"
+        )
+        monkeypatch.setenv("CLOUDSDK_CONFIG", str(gcloud_dir))
+        manager = ConfigManager(config_dir=tmp_path / "vmctl")
+
+        with patch("vmctl.config.manager.subprocess.run") as mock_run:
             config = manager.load()
 
-            assert config.vm_name == "dev-workstation"
-            assert config.zone == "us-central1-a"
+        assert config.project == "file-project"
+        mock_run.assert_not_called()
+
+    def test_load_required_missing_raises(self, tmp_path: Path) -> None:
+        """Test required load raises ConfigNotFound without building defaults."""
+        manager = ConfigManager(config_dir=tmp_path)
+
+        with patch.object(manager, "_get_gcloud_project") as mock_project:
+            with pytest.raises(ConfigNotFound):
+                manager.load(required=True)
+
+        mock_project.assert_not_called()
+
+    def test_load_required_after_save(self, tmp_path: Path) -> None:
+        """Test required load succeeds once a config has been saved."""
+        manager = ConfigManager(config_dir=tmp_path)
+        manager.save(VMConfig(vm_name="saved-vm"))
 
-    def test_save_and_load(self) -> None:
+        assert manager.load(required=True).vm_name == "saved-vm"
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
         """Test saving and loading configuration."""
-        with TemporaryDirectory() as tmpdir:
-            manager = ConfigManager(config_dir=Path(tmpdir))
-
-            # Save config
-            config = VMConfig(
-                vm_name="save-test-vm",
-                zone="us-central1-b",
-                project="save-test-project",
-            )
-            manager.save(config)
-
-            # Load in new manager instance
-            manager2 = ConfigManager(config_dir=Path(tmpdir))
-            loaded = manager2.load()
-
-            assert loaded.vm_name == "save-test-vm"
-            assert loaded.zone == "us-central1-b"
-            assert loaded.project == "save-test-project"
-
-    def test_update(self) -> None:
+        manager = ConfigManager(config_dir=tmp_path)
+
+        # Save config
+        config = VMConfig(
+            vm_name="save-test-vm",
+            zone="us-central1-b",
+            project="save-test-project",
+        )
+        manager.save(config)
+
+        # Load in new manager instance
+        manager2 = ConfigManager(config_dir=tmp_path)
+        loaded = manager2.load()
+
+        assert loaded.vm_name == "save-test-vm"
+        assert loaded.zone == "us-central1-b"
+        assert loaded.project == "save-test-project"
+
+    def test_save_is_owner_only(self, tmp_path: Path) -> None:
+        """Test saved config is readable only by the owner and leaves no temp file."""
+        manager = ConfigManager(config_dir=tmp_path)
+        manager.save(VMConfig(vm_name="private-vm"))
+
+        config_file = tmp_path / "config"
+        assert config_file.stat().st_mode & 0o777 == 0o600
+        assert not (tmp_path / "config.tmp").exists()
+
+    def test_update(self, tmp_path: Path) -> None:
         """Test updating configuration."""
-        with TemporaryDirectory() as tmpdir:
-            manager = ConfigManager(config_dir=Path(tmpdir))
+        manager = ConfigManager(config_dir=tmp_path)
 
-            # Initial config
-            manager.save(VMConfig(vm_name="initial-vm"))
+        # Initial config
+        manager.save(VMConfig(vm_name="initial-vm"))
 
-            # Update some fields
-            updated = manager.update(
-                vm_name="updated-vm",
-                zone="europe-west1-a",
-            )
+        # Update some fields
+        updated = manager.update(
+            vm_name="updated-vm",
+            zone="europe-west1-a",
+        )
+
+        assert updated.vm_name == "updated-vm"
+        assert updated.zone == "europe-west1-a"
+
+        # Verify persisted
+        manager2 = ConfigManager(config_dir=tmp_path)
+        loaded = manager2.load()
+        assert loaded.vm_name == "updated-vm"
+        assert loaded.zone == "europe-west1-a"
+
+    def test_update_ignores_none_values(self, tmp_path: Path) -> None:
+        """Test None values leave existing fields untouched."""
+        manager = ConfigManager(config_dir=tmp_path)
+        manager.save(VMConfig(vm_name="keep-vm", project="keep-project"))
+
+        updated = manager.update(vm_name=None, project="new-project", ssh_host=None)
 
-            assert updated.vm_name == "updated-vm"
-            assert updated.zone == "europe-west1-a"
+        assert updated.vm_name == "keep-vm"
+        assert updated.project == "new-project"
+        assert updated.ssh_host is None
 
-            # Verify persisted
-            manager2 = ConfigManager(config_dir=Path(tmpdir))
-            loaded = manager2.load()
-            assert loaded.vm_name == "updated-vm"
-            assert loaded.zone == "europe-west1-a"
+    def test_update_noop_skips_save(self, tmp_path: Path) -> None:
+        """Test an update with no values returns the current config unsaved."""
+        manager = ConfigManager(config_dir=tmp_path)
+        manager.save(VMConfig(vm_name="same-vm"))
 
-    def test_config_exists(self) -> None:
+        with patch.object(manager, "save") as mock_save:
+            result = manager.update(vm_name=None, zone=None)
+
+        assert result.vm_name == "same-vm"
+        mock_save.assert_not_called()
+
+    def test_update_rejects_unknown_field(self, tmp_path: Path) -> None:
+        """Test update raises on unknown field names."""
+        manager = ConfigManager(config_dir=tmp_path)
+
+        with pytest.raises(TypeError, match="vm_nmae"):
+            manager.update(vm_nmae="typo-vm")
+
+    def test_config_exists(self, tmp_path: Path) -> None:
         """Test checking if config exists."""
-        with TemporaryDirectory() as tmpdir:
-            manager = ConfigManager(config_dir=Path(tmpdir))
+        manager = ConfigManager(config_dir=tmp_path)
 
-            assert not manager.config_exists()
+        assert not manager.config_exists()
 
-            manager.save(VMConfig())
+        manager.save(VMConfig())
 
-            assert manager.config_exists()
+        assert manager.config_exists()
 
-    def test_get_config_path(self) -> None:
+    def test_get_config_path(self, tmp_path: Path) -> None:
         """Test getting config file path."""
-        with TemporaryDirectory() as tmpdir:
-            manager = ConfigManager(config_dir=Path(tmpdir))
-            path = manager.get_config_path()
+        manager = ConfigManager(config_dir=tmp_path)
+        path = manager.get_config_path()
+
+        assert path == tmp_path / "config"
+
+    def test_save_writes_cache(self, tmp_path: Path) -> None:
+        """Test saving also writes the parsed-config cache."""
+        manager = ConfigManager(config_dir=tmp_path)
+        manager.save(VMConfig(vm_name="cached-vm"))
+
+        assert (tmp_path / "config.cache").exists()
+
+        loaded = ConfigManager(config_dir=tmp_path).load()
+        assert loaded.vm_name == "cached-vm"
+
+    def test_stale_cache_ignored(self, tmp_path: Path) -> None:
+        """Test cache is ignored once the config file changes."""
+        manager = ConfigManager(config_dir=tmp_path)
+        manager.save(VMConfig(vm_name="old-vm"))
+
+        # Edit the bash config by hand (size changes, so key no longer matches)
+        config_file = tmp_path / "config"
+        config_file.write_text('VM_NAME="hand-edited-vm"\nZONE="us-central1-a"\n')
+
+        loaded = ConfigManager(config_dir=tmp_path).load()
+        assert loaded.vm_name == "hand-edited-vm"
+
+    def test_cache_is_owner_only(self, tmp_path: Path) -> None:
+        """Test the cache gets the config file's permissions and leaves no temp file."""
+        ConfigManager(config_dir=tmp_path).save(VMConfig(vm_name="private-vm"))
+
+        assert (tmp_path / "config.cache").stat().st_mode & 0o777 == 0o600
+        assert not (tmp_path / "config.cache.tmp").exists()
+
+    def test_cache_from_other_schema_ignored(self, tmp_path: Path) -> None:
+        """Test a cache pickled for a different VMConfig schema isn't loaded."""
+        ConfigManager(config_dir=tmp_path).save(VMConfig(vm_name="real-vm"))
+        stat = (tmp_path / "config").stat()
+        # Same config file stat, but written by a vmctl with other VMConfig fields
+        (tmp_path / "config.cache").write_bytes(
+            _CACHE_HEADER.pack(b"oldfield", stat.st_mtime_ns, stat.st_size)
+            + pickle.dumps(VMConfig(vm_name="cached-vm"))
+        )
+        _CONFIG_CACHE.clear()
+
+        loaded = ConfigManager(config_dir=tmp_path).load()
+        assert loaded.vm_name == "real-vm"
+
+    def test_corrupt_cache_ignored(self, tmp_path: Path) -> None:
+        """Test unreadable cache falls back to parsing the config file."""
+        manager = ConfigManager(config_dir=tmp_path)
+        manager.save(VMConfig(vm_name="real-vm"))
+        (tmp_path / "config.cache").write_bytes(b"garbage")
+
+        loaded = ConfigManager(config_dir=tmp_path).load()
+        assert loaded.vm_name == "real-vm"
+
+    def test_managers_share_loaded_config(self, tmp_path: Path) -> None:
+        """Test managers for the same config file reuse one parsed config."""
+        ConfigManager(config_dir=tmp_path).save(VMConfig(vm_name="shared-vm"))
+
+        first = ConfigManager(config_dir=tmp_path).load()
+        with patch.object(VMConfig, "from_bash_format") as mock_parse:
+            second = ConfigManager(config_dir=tmp_path).load()
+
+        assert second is first
+        mock_parse.assert_not_called()
+
+    def test_migration_marker_skips_probe(self, tmp_path: Path) -> None:
+        """Test migration check is skipped once the .migrated marker exists."""
+        (tmp_path / ".migrated").write_text("done\n")
+        manager = ConfigManager(config_dir=tmp_path)
+
+        with patch("vmctl.config.migration.ConfigMigration") as mock_migration:
+            manager.load()
+
+        mock_migration.assert_not_called()
+
+    def test_no_legacy_dir_skips_probe_next_time(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a load that finds nothing to migrate stops later loads probing."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        config_dir = tmp_path / ".vmctl"
+        config_dir.mkdir()
+
+        ConfigManager(config_dir=config_dir).load()
+        assert (config_dir / ".migrated").exists()
+
+        with patch("vmctl.config.migration.ConfigMigration") as mock_migration:
+            ConfigManager(config_dir=config_dir).load()
+
+        mock_migration.assert_not_called()
+
+    def test_custom_config_dir_skips_migration(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a non-default config dir neither probes for nor marks migration."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        config_dir = tmp_path / "custom"
+        config_dir.mkdir()
+
+        with patch("vmctl.config.migration.ConfigMigration") as mock_migration:
+            ConfigManager(config_dir=config_dir).load()
+
+        mock_migration.assert_not_called()
+        assert not (config_dir / ".migrated").exists()
+
+    def test_missing_config_dir_not_created_by_probe(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the no-migration marker isn't written before ~/.vmctl exists."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        ConfigManager().load()
 
-            assert path == Path(tmpdir) / "config"
+        assert not (tmp_path / ".vmctl").exists()
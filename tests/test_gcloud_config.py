@@ -0,0 +1,76 @@
+"""Tests for reading gcloud properties from its config files."""
+
+from pathlib import Path
+
+import pytest
+
+from vmctl.utils.gcloud_config import gcloud_property
+
+
+@pytest.fixture
+def gcloud_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point gcloud's config directory at a temporary directory."""
+    config_dir = tmp_path / "gcloud"
+    (config_dir / "configurations").mkdir(parents=True)
+    monkeypatch.setenv("CLOUDSDK_CONFIG", str(config_dir))
+    monkeypatch.delenv("CLOUDSDK_ACTIVE_CONFIG_NAME", raising=False)
+    monkeypatch.delenv("CLOUDSDK_CORE_PROJECT", raising=False)
+    monkeypatch.delenv("CLOUDSDK_COMPUTE_ZONE", raising=False)
+    return config_dir
+
+
+def write_config(gcloud_dir: Path, name: str, content: str) -> None:
+    """Write a named gcloud configuration file."""
+    (gcloud_dir / "configurations" / f"config_{name}").write_text(content)
+
+
+class TestGcloudProperty:
+    """Test gcloud_property function."""
+
+    def test_reads_active_config(self, gcloud_dir: Path) -> None:
+        """Test the property comes from the configuration named in active_config."""
+        (gcloud_dir / "active_config").write_text("work\n")
+        write_config(gcloud_dir, "default", "[core]\nproject = default-project\n")
+        write_config(gcloud_dir, "work", "[core]\nproject = work-project\n")
+
+        assert gcloud_property("core", "project") == "work-project"
+
+    def test_defaults_to_default_config(self, gcloud_dir: Path) -> None:
+        """Test the default configuration is used when active_config is missing."""
+        write_config(gcloud_dir, "default", "[compute]\nzone = us-east1-b\n")
+
+        assert gcloud_property("compute", "zone") == "us-east1-b"
+
+    def test_active_config_env_override(
+        self, gcloud_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test CLOUDSDK_ACTIVE_CONFIG_NAME selects the configuration."""
+        (gcloud_dir / "active_config").write_text("default")
+        write_config(gcloud_dir, "other", "[core]\nproject = other-project\n")
+        monkeypatch.setenv("CLOUDSDK_ACTIVE_CONFIG_NAME", "other")
+
+        assert gcloud_property("core", "project") == "other-project"
+
+    def test_property_env_override(self, gcloud_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test CLOUDSDK_<SECTION>_<KEY> takes precedence over the file."""
+        write_config(gcloud_dir, "default", "[core]\nproject = file-project\n")
+        monkeypatch.setenv("CLOUDSDK_CORE_PROJECT", "env-project")
+
+        assert gcloud_property("core", "project") == "env-project"
+
+    def test_unset_property(self, gcloud_dir: Path) -> None:
+        """Test a missing property or section returns None."""
+        write_config(gcloud_dir, "default", "[core]\naccount = me@example.com\n")
+
+        assert gcloud_property("core", "project") is None
+        assert gcloud_property("compute", "zone") is None
+
+    def test_missing_config_file(self, gcloud_dir: Path) -> None:
+        """Test a missing configuration file returns None."""
+        assert gcloud_property("core", "project") is None
+
+    def test_malformed_config_file(self, gcloud_dir: Path) -> None:
+        """Test an unparseable configuration file returns None."""
+        write_config(gcloud_dir, "default", "project = no-section\n")
+
+        assert gcloud_property("core", "project") is None
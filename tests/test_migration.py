@@ -0,0 +1,70 @@
+"""Tests for config directory migration."""
+
+from pathlib import Path
+
+import pytest
+
+from vmctl.config.migration import ConfigMigration
+
+
+@pytest.fixture
+def home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point HOME at a temporary directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+class TestConfigMigration:
+    """Test ConfigMigration."""
+
+    def test_no_legacy_dir(self, home: Path) -> None:
+        """Test no migration needed without a legacy directory."""
+        migration = ConfigMigration()
+        assert migration.needs_migration() is False
+        assert migration.migrate() is False
+
+    def test_migrate_copies_legacy_contents(self, home: Path) -> None:
+        """Test legacy files and subdirectories are copied to ~/.vmctl."""
+        legacy = home / ".vmws"
+        (legacy / "sub").mkdir(parents=True)
+        (legacy / "config").write_text('VM_NAME="legacy-vm"\n')
+        (legacy / "sub" / "notes").write_text("hello")
+
+        migration = ConfigMigration()
+        assert migration.needs_migration() is True
+        assert migration.migrate() is True
+
+        new_dir = home / ".vmctl"
+        assert (new_dir / "config").read_text() == 'VM_NAME="legacy-vm"\n'
+        assert (new_dir / "sub" / "notes").read_text() == "hello"
+        assert migration.is_migrated()
+        assert migration.needs_migration() is False
+
+    def test_migrate_skips_old_marker(self, home: Path) -> None:
+        """Test a marker left in the legacy dir is not copied over."""
+        legacy = home / ".codestation"
+        legacy.mkdir()
+        (legacy / "config").write_text("")
+        (legacy / ".migrated").write_text("old marker")
+
+        ConfigMigration().migrate()
+
+        marker = (home / ".vmctl" / ".migrated").read_text()
+        assert "old marker" not in marker
+        assert str(legacy) in marker
+
+    def test_merge_into_existing_new_dir(self, home: Path) -> None:
+        """Test migration merges into an existing ~/.vmctl without a marker."""
+        legacy = home / ".vmws"
+        legacy.mkdir()
+        (legacy / "config").write_text('VM_NAME="legacy-vm"\n')
+        new_dir = home / ".vmctl"
+        new_dir.mkdir()
+        (new_dir / "extra").write_text("keep me")
+
+        migration = ConfigMigration()
+        assert migration.needs_migration() is True
+        assert migration.migrate() is True
+
+        assert (new_dir / "config").read_text() == 'VM_NAME="legacy-vm"\n'
+        assert (new_dir / "extra").read_text() == "keep me"
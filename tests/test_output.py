@@ -0,0 +1,42 @@
+"""Tests for console output helper."""
+
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+
+from vmctl.utils.output import _rich_console, say
+
+
+@pytest.fixture(autouse=True)
+def reset_console() -> Generator[None, None, None]:
+    """Re-detect the terminal for each test."""
+    _rich_console.cache_clear()
+    yield
+    _rich_console.cache_clear()
+
+
+class TestSay:
+    """Test say function."""
+
+    def test_plain_output_strips_markup(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test markup tags are stripped when stdout is not a terminal."""
+        say("[green]✓ VM [bold]test-vm[/bold] started[/green]")
+        assert capsys.readouterr().out == "✓ VM test-vm started\n"
+
+    def test_plain_output_without_markup(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test markup=False prints text untouched."""
+        say("[INFO] log line [/x]", markup=False)
+        assert capsys.readouterr().out == "[INFO] log line [/x]\n"
+
+    def test_no_color_skips_rich(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test NO_COLOR disables Rich even on a terminal."""
+        monkeypatch.setenv("NO_COLOR", "1")
+        with patch("sys.stdout.isatty", return_value=True):
+            assert _rich_console() is None
+
+    def test_terminal_uses_rich(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a terminal without NO_COLOR gets a Rich console."""
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        with patch("sys.stdout.isatty", return_value=True):
+            assert _rich_console() is not None
@@ -1,12 +1,18 @@
 """Tests for subprocess runner utility."""
 
+import os
 import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from vmctl.core.exceptions import GCloudError
-from vmctl.utils.subprocess_runner import CommandResult, run_command
+from vmctl.utils.subprocess_runner import (
+    CommandResult,
+    exec_command,
+    run_command,
+    run_command_streaming,
+)
 
 
 class TestCommandResult:
@@ -52,6 +58,26 @@ class TestCommandResult:
         assert "stderr content" in error_message
         assert "exit code 2" in error_message
 
+    def test_command_result_decodes_bytes(self) -> None:
+        """Test bytes output is decoded, replacing invalid UTF-8."""
+        result = CommandResult(returncode=1, stdout=b"caf\xc3\xa9", stderr=b"bad \xff")
+
+        assert result.stdout == "café"
+        assert result.stderr == "bad \ufffd"
+        assert result.stdout_bytes == b"caf\xc3\xa9"
+
+    def test_command_result_has_no_instance_dict(self) -> None:
+        """Test CommandResult uses slots rather than a per-instance dict."""
+        result = CommandResult(returncode=0, stdout=b"out", stderr=b"")
+
+        assert not hasattr(result, "__dict__")
+        assert result.stdout == "out"
+
+    def test_command_result_json(self) -> None:
+        """Test json() parses stdout given as bytes or str."""
+        assert CommandResult(0, b'[{"name": "a"}]', b"").json() == [{"name": "a"}]
+        assert CommandResult(0, '{"status": "RUNNING"}', "").json() == {"status": "RUNNING"}
+
 
 class TestRunCommand:
     """Test run_command function."""
@@ -61,8 +87,8 @@ class TestRunCommand:
         """Test successful command execution."""
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="  hello world  \n",
-            stderr="",
+            stdout=b"  hello world  \n",
+            stderr=b"",
         )
 
         result = run_command(["echo", "hello world"])
@@ -73,8 +99,8 @@ class TestRunCommand:
         assert result.stderr == ""
         mock_run.assert_called_once_with(
             ["echo", "hello world"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             timeout=None,
         )
 
@@ -133,8 +159,8 @@ class TestRunCommand:
         assert result.success is True
         mock_run.assert_called_once_with(
             ["sleep", "1"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             timeout=5.0,
         )
 
@@ -197,15 +223,121 @@ class TestRunCommand:
         """Test that run_command always captures output."""
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="captured",
-            stderr="also captured",
+            stdout=b"captured",
+            stderr=b"also captured",
         )
 
         result = run_command(["cmd"])
 
-        # Verify capture_output=True and text=True are always set
+        # Output is captured as bytes and decoded by CommandResult
         call_kwargs = mock_run.call_args[1]
-        assert call_kwargs["capture_output"] is True
-        assert call_kwargs["text"] is True
+        assert call_kwargs["stdout"] == subprocess.PIPE
+        assert call_kwargs["stderr"] == subprocess.PIPE
+        assert "text" not in call_kwargs
         assert result.stdout == "captured"
         assert result.stderr == "also captured"
+
+    @patch("vmctl.utils.subprocess_runner.subprocess.run")
+    def test_run_command_discards_uncaptured_output(self, mock_run: MagicMock) -> None:
+        """Test streams the caller doesn't need go to /dev/null."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=b"warning")
+
+        result = run_command(["cmd"], capture_stdout=False)
+
+        call_kwargs = mock_run.call_args[1]
+        assert call_kwargs["stdout"] == subprocess.DEVNULL
+        assert call_kwargs["stderr"] == subprocess.PIPE
+        assert result.stdout == ""
+        assert result.stderr == "warning"
+
+    @patch("vmctl.utils.subprocess_runner.subprocess.run")
+    def test_run_command_gcloud_skips_update_check(
+        self, mock_run: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test gcloud calls disable the component update check by default."""
+        monkeypatch.delenv("CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK", raising=False)
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        run_command(["gcloud", "config", "list"])
+
+        env = mock_run.call_args[1]["env"]
+        assert env["CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK"] == "true"
+
+    @patch("vmctl.utils.subprocess_runner.subprocess.run")
+    def test_run_command_gcloud_respects_user_env(
+        self, mock_run: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an explicit update-check setting in the environment wins."""
+        monkeypatch.setenv("CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK", "false")
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        run_command(["gcloud", "config", "list"])
+
+        env = mock_run.call_args[1]["env"]
+        assert env["CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK"] == "false"
+
+
+class TestRunCommandStreaming:
+    """Test run_command_streaming function."""
+
+    def test_streams_lines(self) -> None:
+        """Test each stdout line reaches the callback without its newline."""
+        lines: list[str] = []
+
+        result = run_command_streaming(["printf", "one\\ntwo\\n"], lines.append)
+
+        assert result.success is True
+        assert result.stdout == ""
+        assert lines == ["one", "two"]
+
+    def test_captures_stderr_on_failure(self) -> None:
+        """Test stderr is captured when the command fails."""
+        result = run_command_streaming(
+            ["sh", "-c", "echo oops >&2; exit 3"], lambda _line: None
+        )
+
+        assert result.returncode == 3
+        assert result.stderr == "oops"
+
+    def test_command_not_found(self) -> None:
+        """Test missing executable raises GCloudError."""
+        with pytest.raises(GCloudError, match="Command not found"):
+            run_command_streaming(["nonexistent-command-xyz"], lambda _line: None)
+
+    def test_invalid_utf8_replaced(self) -> None:
+        """Test non-UTF-8 bytes in stdout and stderr are replaced, not raised."""
+        lines: list[str] = []
+
+        result = run_command_streaming(
+            ["sh", "-c", "printf 'ok\\377\\n'; printf 'bad\\377' >&2"], lines.append
+        )
+
+        assert lines == ["ok\ufffd"]
+        assert result.stderr == "bad\ufffd"
+
+
+class TestExecCommand:
+    """Test exec_command function."""
+
+    @patch("vmctl.utils.subprocess_runner.os.execvpe")
+    def test_replaces_process(self, mock_execvpe: MagicMock) -> None:
+        """Test the command is exec'd with its argv and the current environment."""
+        exec_command(["ssh", "host"])
+
+        mock_execvpe.assert_called_once_with("ssh", ["ssh", "host"], os.environ)
+
+    @patch("vmctl.utils.subprocess_runner.os.execvpe")
+    def test_gcloud_skips_update_check(self, mock_execvpe: MagicMock) -> None:
+        """Test gcloud gets the same environment defaults as run_command."""
+        exec_command(["gcloud", "compute", "ssh", "vm"])
+
+        env = mock_execvpe.call_args[0][2]
+        assert env["CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK"] == "true"
+
+    @patch("vmctl.utils.subprocess_runner.os.execvpe")
+    def test_command_not_found(self, mock_execvpe: MagicMock) -> None:
+        """Test a missing executable raises GCloudError."""
+        mock_execvpe.side_effect = FileNotFoundError()
+
+        with pytest.raises(GCloudError, match="Command not found: nope"):
+            exec_command(["nope"])
@@ -1,6 +1,10 @@
 """Tests for tunnel management."""
 
+import json
+import os
+import signal
 import subprocess
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -21,9 +25,9 @@ def vm_config() -> VMConfig:
 
 
 @pytest.fixture
-def tunnel_manager(vm_config: VMConfig) -> TunnelManager:
+def tunnel_manager(vm_config: VMConfig, tmp_path: Path) -> TunnelManager:
     """Create tunnel manager for testing."""
-    return TunnelManager(vm_config, local_port=8080, remote_port=8080)
+    return TunnelManager(vm_config, local_port=8080, remote_port=8080, state_dir=tmp_path)
 
 
 class TestTunnelManager:
@@ -41,48 +45,55 @@ class TestTunnelManager:
         assert tunnel.local_port == 9090
         assert tunnel.remote_port == 8443
 
-    def test_check_tunnel_active(self, tunnel_manager: TunnelManager) -> None:
+    @patch("vmctl.core.tunnel.socket.create_connection")
+    def test_check_tunnel_active(
+        self, mock_connect: MagicMock, tunnel_manager: TunnelManager
+    ) -> None:
         """Test checking if tunnel is active."""
-        with patch("socket.socket") as mock_socket_class:
-            mock_sock = mock_socket_class.return_value
-            mock_sock.connect_ex.return_value = 0
-
-            assert tunnel_manager.check_tunnel() is True
-            mock_sock.connect_ex.assert_called_once_with(("localhost", 8080))
-            mock_sock.close.assert_called_once()
+        assert tunnel_manager.check_tunnel() is True
+        mock_connect.assert_called_once_with(("127.0.0.1", 8080), timeout=0.1)
+        mock_connect.return_value.close.assert_called_once()
 
-    def test_check_tunnel_inactive(self, tunnel_manager: TunnelManager) -> None:
+    @patch("vmctl.core.tunnel.socket.create_connection")
+    def test_check_tunnel_inactive(
+        self, mock_connect: MagicMock, tunnel_manager: TunnelManager
+    ) -> None:
         """Test checking if tunnel is inactive."""
-        with patch("socket.socket") as mock_socket_class:
-            mock_sock = mock_socket_class.return_value
-            mock_sock.connect_ex.return_value = 1
+        mock_connect.side_effect = ConnectionRefusedError()
 
-            assert tunnel_manager.check_tunnel() is False
+        assert tunnel_manager.check_tunnel() is False
 
-    def test_check_tunnel_custom_port(self, tunnel_manager: TunnelManager) -> None:
+    @patch("vmctl.core.tunnel.socket.create_connection")
+    def test_check_tunnel_custom_port(
+        self, mock_connect: MagicMock, tunnel_manager: TunnelManager
+    ) -> None:
         """Test checking tunnel on custom port."""
-        with patch("socket.socket") as mock_socket_class:
-            mock_sock = mock_socket_class.return_value
-            mock_sock.connect_ex.return_value = 0
+        assert tunnel_manager.check_tunnel(port=9090) is True
+        mock_connect.assert_called_once_with(("127.0.0.1", 9090), timeout=0.1)
 
-            assert tunnel_manager.check_tunnel(port=9090) is True
-            mock_sock.connect_ex.assert_called_once_with(("localhost", 9090))
-
-    def test_check_tunnel_exception(self, tunnel_manager: TunnelManager) -> None:
-        """Test check_tunnel handles exceptions."""
-        with patch("socket.socket") as mock_socket_class:
-            mock_socket_class.side_effect = Exception("Socket error")
+    @patch("vmctl.core.tunnel.socket.create_connection")
+    def test_check_tunnel_timeout(
+        self, mock_connect: MagicMock, tunnel_manager: TunnelManager
+    ) -> None:
+        """Test check_tunnel treats a connect timeout as inactive."""
+        mock_connect.side_effect = TimeoutError("timed out")
 
-            assert tunnel_manager.check_tunnel() is False
+        assert tunnel_manager.check_tunnel() is False
 
     @patch("vmctl.core.tunnel.subprocess.Popen")
     @patch("vmctl.core.tunnel.time.sleep")
+    @patch.object(TunnelManager, "check_tunnel", side_effect=[False, False, True])
     def test_start_background(
-        self, mock_sleep: MagicMock, mock_popen: MagicMock, tunnel_manager: TunnelManager
+        self,
+        mock_check: MagicMock,
+        mock_sleep: MagicMock,
+        mock_popen: MagicMock,
+        tunnel_manager: TunnelManager,
     ) -> None:
-        """Test starting tunnel in background."""
+        """Test starting tunnel in background polls until the port opens."""
         mock_process = MagicMock()
         mock_process.pid = 12345
+        mock_process.poll.return_value = None
         mock_popen.return_value = mock_process
 
         tunnel_manager.start(background=True)
@@ -104,8 +115,61 @@ class TestTunnelManager:
             stderr=subprocess.DEVNULL,
             start_new_session=True,
         )
-        mock_sleep.assert_called_once_with(2)
+        assert mock_check.call_count == 3
+        assert mock_sleep.call_count == 2
+        mock_sleep.assert_called_with(0.1)
         assert tunnel_manager._process is mock_process
+        assert json.loads(tunnel_manager.state_file.read_text()) == {
+            "pid": 12345,
+            "vm_name": "test-vm",
+            "zone": "us-central1-a",
+            "project": "test-project",
+            "local_port": 8080,
+            "remote_port": 8080,
+        }
+
+    @patch("vmctl.core.tunnel.subprocess.Popen")
+    @patch("vmctl.core.tunnel.time.sleep")
+    @patch.object(TunnelManager, "check_tunnel", return_value=False)
+    def test_start_background_timeout(
+        self,
+        mock_check: MagicMock,
+        mock_sleep: MagicMock,
+        mock_popen: MagicMock,
+        tunnel_manager: TunnelManager,
+    ) -> None:
+        """Test start background raises TunnelError if the port never opens."""
+        mock_process = MagicMock()
+        mock_process.poll.return_value = None
+        mock_popen.return_value = mock_process
+
+        with pytest.raises(TunnelError, match="did not open localhost:8080"):
+            tunnel_manager.start(background=True)
+
+        mock_process.terminate.assert_called_once()
+        assert tunnel_manager._process is None
+
+    @patch("vmctl.core.tunnel.subprocess.Popen")
+    @patch("vmctl.core.tunnel.time.sleep")
+    @patch.object(TunnelManager, "check_tunnel", return_value=False)
+    def test_start_background_process_exits(
+        self,
+        mock_check: MagicMock,
+        mock_sleep: MagicMock,
+        mock_popen: MagicMock,
+        tunnel_manager: TunnelManager,
+    ) -> None:
+        """Test start background raises TunnelError if gcloud exits early."""
+        mock_process = MagicMock()
+        mock_process.poll.return_value = 1
+        mock_process.returncode = 1
+        mock_popen.return_value = mock_process
+
+        with pytest.raises(TunnelError, match="exited during startup"):
+            tunnel_manager.start(background=True)
+
+        mock_sleep.assert_not_called()
+        assert tunnel_manager._process is None
 
     @patch("vmctl.core.tunnel.subprocess.run")
     def test_start_foreground(self, mock_run: MagicMock, tunnel_manager: TunnelManager) -> None:
@@ -205,3 +269,103 @@ class TestTunnelManager:
 
         # Process should be cleared even on error
         assert tunnel_manager._process is None
+
+
+class TestBackgroundTunnelState:
+    """Test reuse and stopping of recorded background tunnels."""
+
+    def _record(self, tunnel_manager: TunnelManager, pid: int, **overrides: object) -> None:
+        """Write a state file as if a background tunnel had been started."""
+        state = {"pid": pid, **tunnel_manager._state(), **overrides}
+        tunnel_manager.state_file.write_text(json.dumps(state))
+
+    def test_running_pid_no_state(self, tunnel_manager: TunnelManager) -> None:
+        """Test no recorded tunnel means nothing to reuse."""
+        assert tunnel_manager.running_pid() is None
+
+    @patch.object(TunnelManager, "_is_tunnel_process", return_value=True)
+    @patch.object(TunnelManager, "check_tunnel", return_value=True)
+    def test_running_pid_matches(
+        self, mock_check: MagicMock, mock_is_tunnel: MagicMock, tunnel_manager: TunnelManager
+    ) -> None:
+        """Test a live tunnel recorded for the same VM and port is reused."""
+        self._record(tunnel_manager, os.getpid())
+
+        assert tunnel_manager.running_pid() == os.getpid()
+        mock_is_tunnel.assert_called_once_with(os.getpid())
+
+    @pytest.mark.skipif(not Path("/proc/self").exists(), reason="needs /proc")
+    @patch.object(TunnelManager, "check_tunnel", return_value=True)
+    def test_running_pid_reused_pid(
+        self, mock_check: MagicMock, tunnel_manager: TunnelManager
+    ) -> None:
+        """Test a recorded PID now running something other than gcloud isn't reused."""
+        self._record(tunnel_manager, os.getpid())
+
+        assert tunnel_manager.running_pid() is None
+
+    @patch.object(TunnelManager, "check_tunnel", return_value=True)
+    def test_running_pid_other_vm(
+        self, mock_check: MagicMock, tunnel_manager: TunnelManager
+    ) -> None:
+        """Test a tunnel recorded for another VM isn't reused."""
+        self._record(tunnel_manager, os.getpid(), vm_name="other-vm")
+
+        assert tunnel_manager.running_pid() is None
+
+    @patch.object(TunnelManager, "check_tunnel", return_value=False)
+    def test_running_pid_port_closed(
+        self, mock_check: MagicMock, tunnel_manager: TunnelManager
+    ) -> None:
+        """Test a recorded tunnel that stopped listening isn't reused."""
+        self._record(tunnel_manager, os.getpid())
+
+        assert tunnel_manager.running_pid() is None
+
+    @patch("vmctl.core.tunnel.os.kill", side_effect=ProcessLookupError())
+    def test_running_pid_dead_process(
+        self, mock_kill: MagicMock, tunnel_manager: TunnelManager
+    ) -> None:
+        """Test a state file for an exited process is removed."""
+        self._record(tunnel_manager, 12345)
+
+        assert tunnel_manager.running_pid() is None
+        assert not tunnel_manager.state_file.exists()
+
+    @patch.object(TunnelManager, "_is_tunnel_process", return_value=True)
+    @patch.object(TunnelManager, "check_tunnel", return_value=True)
+    @patch("vmctl.core.tunnel.os.killpg")
+    @patch("vmctl.core.tunnel.os.kill")
+    def test_stop_recorded_tunnel(
+        self,
+        mock_kill: MagicMock,
+        mock_killpg: MagicMock,
+        mock_check: MagicMock,
+        mock_is_tunnel: MagicMock,
+        tunnel_manager: TunnelManager,
+    ) -> None:
+        """Test stop without a child process stops the recorded tunnel."""
+        self._record(tunnel_manager, 12345)
+
+        tunnel_manager.stop()
+
+        mock_killpg.assert_called_once_with(12345, signal.SIGTERM)
+        assert not tunnel_manager.state_file.exists()
+
+    @patch.object(TunnelManager, "check_tunnel", return_value=False)
+    @patch("vmctl.core.tunnel.os.killpg")
+    @patch("vmctl.core.tunnel.os.kill")
+    def test_stop_recorded_port_closed(
+        self,
+        mock_kill: MagicMock,
+        mock_killpg: MagicMock,
+        mock_check: MagicMock,
+        tunnel_manager: TunnelManager,
+    ) -> None:
+        """Test a live recorded PID isn't signalled once the tunnel port is closed."""
+        self._record(tunnel_manager, 12345)
+
+        tunnel_manager.stop()
+
+        mock_killpg.assert_not_called()
+        assert not tunnel_manager.state_file.exists()
@@ -1,15 +1,44 @@
 """Tests for VM management."""
 
+import json
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from vmctl.config.models import VMConfig
 from vmctl.core.exceptions import VMError
-from vmctl.core.vm import VMManager
+from vmctl.core.vm import VMInfo, VMManager
 from vmctl.utils.subprocess_runner import CommandResult
 
 
+@pytest.fixture(autouse=True)
+def home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point HOME at a temporary directory so SSH control sockets stay there."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+def mux_opts(home: Path) -> list[str]:
+    """Expected SSH connection-sharing options for a given HOME."""
+    return [
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={home}/.cache/vmctl/cm-%C",
+        "-o", "ControlPersist=10m",
+    ]  # fmt: skip
+
+
+def described(status: str, **fields: object) -> CommandResult:
+    """Successful ``gcloud compute instances describe --format=json`` result."""
+    return CommandResult(0, json.dumps({"status": status, **fields}), "")
+
+
+def gcloud_mux_flags(home: Path, flag: str = "--ssh-flag") -> list[str]:
+    """Expected connection-sharing options as gcloud pass-through flags."""
+    opts = mux_opts(home)
+    return [f"{flag}={opts[i]} {opts[i + 1]}" for i in range(0, len(opts), 2)]
+
+
 @pytest.fixture
 def vm_config() -> VMConfig:
     """Create test VM config."""
@@ -41,18 +70,124 @@ class TestVMManager:
         mock_run.return_value = CommandResult(1, "", "Not found")
         assert vm_manager.exists() is False
 
+    @patch("vmctl.core.vm.run_command")
+    def test_describe_running(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
+        """Test describe returns existence and status from one call."""
+        mock_run.return_value = described("RUNNING")
+        assert vm_manager.describe() == (True, "RUNNING")
+        mock_run.assert_called_once()
+
+    @patch("vmctl.core.vm.run_command")
+    def test_describe_missing(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
+        """Test describe when the VM doesn't exist."""
+        mock_run.return_value = CommandResult(1, "", "Not found")
+        assert vm_manager.describe() == (False, "")
+
+    @patch("vmctl.core.vm.run_command")
+    def test_exists_then_status_single_call(
+        self, mock_run: MagicMock, vm_manager: VMManager
+    ) -> None:
+        """Test exists() followed by status() reuses one describe call."""
+        mock_run.return_value = described("RUNNING")
+
+        assert vm_manager.exists() is True
+        assert vm_manager.status() == "RUNNING"
+        mock_run.assert_called_once()
+
+    @patch("vmctl.core.vm.time.monotonic")
+    @patch("vmctl.core.vm.run_command")
+    def test_status_cache_expires(
+        self, mock_run: MagicMock, mock_monotonic: MagicMock, vm_manager: VMManager
+    ) -> None:
+        """Test status is queried again once the cache TTL has passed."""
+        mock_run.side_effect = [
+            described("STAGING"),
+            described("RUNNING"),
+        ]
+        mock_monotonic.side_effect = [100.0, 101.0, 103.0]
+
+        assert vm_manager.status() == "STAGING"
+        assert vm_manager.status() == "STAGING"
+        assert vm_manager.status() == "RUNNING"
+        assert mock_run.call_count == 2
+
+    @patch("vmctl.core.vm.run_command")
+    def test_invalidate(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
+        """Test invalidate forces a fresh describe call."""
+        mock_run.return_value = described("RUNNING")
+
+        vm_manager.status()
+        vm_manager.invalidate()
+        vm_manager.status()
+        assert mock_run.call_count == 2
+
+    @patch("vmctl.core.vm.run_command")
+    def test_stop_refreshes_status(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
+        """Test status is queried again after the VM is stopped."""
+        mock_run.side_effect = [
+            described("RUNNING"),
+            CommandResult(0, "Stopped", ""),
+            described("TERMINATED"),
+        ]
+
+        assert vm_manager.status() == "RUNNING"
+        vm_manager.stop()
+        assert vm_manager.status() == "TERMINATED"
+        assert mock_run.call_count == 3
+
     @patch("vmctl.core.vm.run_command")
     def test_status_running(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
         """Test getting VM status when running."""
-        mock_run.return_value = CommandResult(0, "RUNNING", "")
+        mock_run.return_value = described("RUNNING")
         assert vm_manager.status() == "RUNNING"
 
     @patch("vmctl.core.vm.run_command")
     def test_status_stopped(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
         """Test getting VM status when stopped."""
-        mock_run.return_value = CommandResult(0, "TERMINATED", "")
+        mock_run.return_value = described("TERMINATED")
         assert vm_manager.status() == "TERMINATED"
 
+    @patch("vmctl.core.vm.run_command")
+    def test_info(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
+        """Test info extracts location and addresses from the describe output."""
+        mock_run.return_value = described(
+            "RUNNING",
+            zone="https://www.googleapis.com/compute/v1/projects/p/zones/us-central1-a",
+            machineType="https://www.googleapis.com/compute/v1/projects/p/zones/"
+            "us-central1-a/machineTypes/e2-standard-4",
+            networkInterfaces=[
+                {"networkIP": "10.128.0.2", "accessConfigs": [{"natIP": "34.1.2.3"}]}
+            ],
+        )
+
+        assert vm_manager.info() == VMInfo(
+            status="RUNNING",
+            zone="us-central1-a",
+            machine_type="e2-standard-4",
+            internal_ip="10.128.0.2",
+            external_ip="34.1.2.3",
+        )
+
+    @patch("vmctl.core.vm.run_command")
+    def test_info_stopped_has_no_external_ip(
+        self, mock_run: MagicMock, vm_manager: VMManager
+    ) -> None:
+        """Test a VM without an access config has no external IP."""
+        mock_run.return_value = described(
+            "TERMINATED", networkInterfaces=[{"networkIP": "10.128.0.2"}]
+        )
+
+        info = vm_manager.info()
+        assert info.internal_ip == "10.128.0.2"
+        assert info.external_ip is None
+
+    @patch("vmctl.core.vm.run_command")
+    def test_info_invalid_output(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
+        """Test unparseable describe output raises VMError."""
+        mock_run.return_value = CommandResult(0, "not json", "")
+        with pytest.raises(VMError, match="Unexpected output"):
+            vm_manager.info()
+
     @patch("vmctl.core.vm.run_command")
     def test_status_error(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
         """Test VM status when command fails."""
@@ -66,6 +201,8 @@ class TestVMManager:
         mock_run.return_value = CommandResult(0, "Started", "")
         vm_manager.start()
         mock_run.assert_called_once()
+        # Only the exit status and stderr (for errors) are used
+        assert mock_run.call_args[1]["capture_stdout"] is False
 
     @patch("vmctl.core.vm.run_command")
     def test_stop(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
@@ -109,9 +246,11 @@ class TestVMManager:
             vm_manager.delete()
 
     @patch("vmctl.core.vm.run_command")
-    def test_ssh_interactive(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
-        """Test SSH without command (interactive)."""
-        mock_run.return_value = CommandResult(0, "", "")
+    @patch("vmctl.core.vm.exec_command")
+    def test_ssh_interactive(
+        self, mock_exec: MagicMock, mock_run: MagicMock, vm_manager: VMManager, home: Path
+    ) -> None:
+        """Test SSH without command (interactive) replaces the process."""
         vm_manager.ssh()
 
         expected_cmd = [
@@ -122,11 +261,13 @@ class TestVMManager:
             "--zone=us-central1-a",
             "--project=test-project",
             "--tunnel-through-iap",
+            *gcloud_mux_flags(home),
         ]
-        mock_run.assert_called_once_with(expected_cmd, check=False)
+        mock_exec.assert_called_once_with(expected_cmd)
+        mock_run.assert_not_called()
 
     @patch("vmctl.core.vm.run_command")
-    def test_ssh_with_command(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
+    def test_ssh_with_command(self, mock_run: MagicMock, vm_manager: VMManager, home: Path) -> None:
         """Test SSH with command."""
         mock_run.return_value = CommandResult(0, "output", "")
         vm_manager.ssh("ls -la")
@@ -139,6 +280,7 @@ class TestVMManager:
             "--zone=us-central1-a",
             "--project=test-project",
             "--tunnel-through-iap",
+            *gcloud_mux_flags(home),
             "--command",
             "ls -la",
         ]
@@ -157,6 +299,17 @@ class TestVMManager:
         from vmctl.core.exceptions import GCloudError
 
         mock_run.side_effect = GCloudError("Network error")
+        with pytest.raises(VMError, match="Failed to SSH to VM"):
+            vm_manager.ssh("ls")
+
+    @patch("vmctl.core.vm.exec_command")
+    def test_ssh_interactive_exec_failure(
+        self, mock_exec: MagicMock, vm_manager: VMManager
+    ) -> None:
+        """Test interactive SSH when the client can't be executed."""
+        from vmctl.core.exceptions import GCloudError
+
+        mock_exec.side_effect = GCloudError("Command not found: gcloud")
         with pytest.raises(VMError, match="Failed to SSH to VM"):
             vm_manager.ssh()
 
@@ -180,6 +333,16 @@ class TestVMManager:
         call_args = mock_run.call_args[0][0]
         assert "sudo cat /var/log/custom.log" in call_args
 
+    @patch("vmctl.core.vm.run_command")
+    def test_logs_tail_lines(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
+        """Test retrieving only the last N lines quotes the log path."""
+        mock_run.return_value = CommandResult(0, "last lines", "")
+        result = vm_manager.logs("/var/log/my app.log", lines=50)
+
+        assert result == "last lines"
+        call_args = mock_run.call_args[0][0]
+        assert "sudo tail -n 50 '/var/log/my app.log'" in call_args
+
     @patch("vmctl.core.vm.run_command")
     def test_logs_error(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
         """Test retrieving logs with error."""
@@ -187,6 +350,25 @@ class TestVMManager:
         with pytest.raises(VMError, match="Failed to retrieve logs"):
             vm_manager.logs()
 
+    @patch("vmctl.core.vm.run_command_streaming")
+    def test_stream_logs(self, mock_stream: MagicMock, vm_manager: VMManager) -> None:
+        """Test streaming logs passes the callback and SSH command through."""
+        mock_stream.return_value = CommandResult(0, "", "")
+        on_line = MagicMock()
+
+        vm_manager.stream_logs(on_line, "/var/log/custom.log", lines=10)
+
+        cmd, callback = mock_stream.call_args[0]
+        assert "sudo tail -n 10 /var/log/custom.log" in cmd
+        assert callback is on_line
+
+    @patch("vmctl.core.vm.run_command_streaming")
+    def test_stream_logs_error(self, mock_stream: MagicMock, vm_manager: VMManager) -> None:
+        """Test streaming logs raises VMError on failure."""
+        mock_stream.return_value = CommandResult(1, "", "File not found")
+        with pytest.raises(VMError, match="Failed to retrieve logs: File not found"):
+            vm_manager.stream_logs(MagicMock())
+
     @patch("vmctl.core.vm.run_command")
     def test_status_empty_output(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
         """Test status with empty output."""
@@ -207,6 +389,7 @@ class TestVMManager:
             "test-vm",
             "--zone=us-central1-a",
             "--project=test-project",
+            "--format=json",
         ]
         mock_run.assert_called_once_with(expected_cmd, check=False)
 
@@ -223,7 +406,7 @@ class TestVMManager:
         assert "--quiet" in call_args
 
     @patch("vmctl.core.vm.run_command")
-    def test_ssh_exec_success(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
+    def test_ssh_exec_success(self, mock_run: MagicMock, vm_manager: VMManager, home: Path) -> None:
         """Test ssh_exec with successful command."""
         mock_run.return_value = CommandResult(0, "output text", "")
         success, stdout, stderr = vm_manager.ssh_exec("echo hello")
@@ -240,6 +423,7 @@ class TestVMManager:
             "--zone=us-central1-a",
             "--project=test-project",
             "--tunnel-through-iap",
+            *gcloud_mux_flags(home),
             "--command",
             "echo hello",
         ]
@@ -276,7 +460,7 @@ echo "world"
         assert script in call_args
 
     @patch("vmctl.core.vm.run_command")
-    def test_scp_file_success(self, mock_run: MagicMock, vm_manager: VMManager) -> None:
+    def test_scp_file_success(self, mock_run: MagicMock, vm_manager: VMManager, home: Path) -> None:
         """Test scp single file to VM."""
         mock_run.return_value = CommandResult(0, "", "")
         success, stdout, stderr = vm_manager.scp("/local/file.txt", "/remote/file.txt")
@@ -294,12 +478,13 @@ echo "world"
             "--zone=us-central1-a",
             "--project=test-project",
             "--tunnel-through-iap",
+            *gcloud_mux_flags(home, "--scp-flag"),
         ]
         mock_run.assert_called_once_with(expected_cmd, check=False)
 
     @patch("vmctl.core.vm.run_command")
     def test_scp_directory_recursive(
-        self, mock_run: MagicMock, vm_manager: VMManager
+        self, mock_run: MagicMock, vm_manager: VMManager, home: Path
     ) -> None:
         """Test scp directory with recursive flag."""
         mock_run.return_value = CommandResult(0, "", "")
@@ -319,6 +504,7 @@ echo "world"
             "--zone=us-central1-a",
             "--project=test-project",
             "--tunnel-through-iap",
+            *gcloud_mux_flags(home, "--scp-flag"),
         ]
         mock_run.assert_called_once_with(expected_cmd, check=False)
 
@@ -365,7 +551,7 @@ class TestVMManagerDirectSSH:
 
     @patch("vmctl.core.vm.run_command")
     def test_ssh_exec_direct(
-        self, mock_run: MagicMock, direct_ssh_manager: VMManager
+        self, mock_run: MagicMock, direct_ssh_manager: VMManager, home: Path
     ) -> None:
         """Test ssh_exec uses plain ssh when direct SSH configured."""
         mock_run.return_value = CommandResult(0, "output", "")
@@ -377,6 +563,7 @@ class TestVMManagerDirectSSH:
             "ssh",
             "-o", "StrictHostKeyChecking=no",
             "-o", "UserKnownHostsFile=/dev/null",
+            *mux_opts(home),
             "devuser@10.0.0.5",
             "echo hello",
         ]
@@ -440,7 +627,7 @@ class TestVMManagerDirectSSH:
 
     @patch("vmctl.core.vm.run_command")
     def test_scp_direct(
-        self, mock_run: MagicMock, direct_ssh_manager: VMManager
+        self, mock_run: MagicMock, direct_ssh_manager: VMManager, home: Path
     ) -> None:
         """Test scp uses plain scp when direct SSH configured."""
         mock_run.return_value = CommandResult(0, "", "")
@@ -451,6 +638,7 @@ class TestVMManagerDirectSSH:
             "scp",
             "-o", "StrictHostKeyChecking=no",
             "-o", "UserKnownHostsFile=/dev/null",
+            *mux_opts(home),
             "/local/file",
             "devuser@10.0.0.5:/remote/file",
         ]
@@ -490,15 +678,14 @@ class TestVMManagerDirectSSH:
         p_index = cmd.index("-P")
         assert cmd[p_index + 1] == "2222"
 
-    @patch("vmctl.core.vm.run_command")
+    @patch("vmctl.core.vm.exec_command")
     def test_ssh_interactive_direct(
-        self, mock_run: MagicMock, direct_ssh_manager: VMManager
+        self, mock_exec: MagicMock, direct_ssh_manager: VMManager
     ) -> None:
         """Test interactive ssh uses plain ssh."""
-        mock_run.return_value = CommandResult(0, "", "")
         direct_ssh_manager.ssh()
 
-        cmd = mock_run.call_args[0][0]
+        cmd = mock_exec.call_args[0][0]
         assert cmd[0] == "ssh"
         assert "devuser@10.0.0.5" in cmd
         assert "gcloud" not in cmd